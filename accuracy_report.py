@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Data Accuracy Report
+Generates html_dashboard/data_accuracy_report.html and DATA_ACCURACY_REPORT.md
+from one report model, replacing the hand-edited accuracy pages and the
+repeated per-app/per-platform filtering that produced them.
+
+Headline numbers and label distributions come from the metrics cube; data
+quality stats (null rate per column, date coverage per app and platform) come
+from a single grouped scan of the dataset. Label drift is measured per year
+against the whole dataset and against the previous run's profile, saved in
+data_quality_profile.json. When categories come from another column than
+primary_category the reports and profile get a _<column> suffix
+(data_accuracy_report_enhanced_category.html,
+DATA_ACCURACY_REPORT_ENHANCED_CATEGORY.md, ...), so neither run overwrites
+the other's reports or compares against its profile.
+
+Usage:
+    python accuracy_report.py                 # telecom_app_reviews_filtered_current.csv
+    python accuracy_report.py <reviews.csv>   # any review CSV
+"""
+
+import html
+import json
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+
+from markdown_reports import render_markdown_reports
+from metrics_cube import build_cube, cube_count, cube_slice, merge_cubes, summary_metrics
+from report_layout import assemble_page
+from review_records import read_review_chunks
+
+DATA_FILE = 'telecom_app_reviews_filtered_current.csv'
+HTML_FILE = 'html_dashboard/data_accuracy_report.html'
+MARKDOWN_FILE = 'DATA_ACCURACY_REPORT.md'
+PROFILE_FILE = 'data_quality_profile.json'
+DEFAULT_CATEGORY_COLUMN = 'primary_category'
+
+# Cube dimensions whose distributions are tracked for drift
+LABEL_DIMENSIONS = {'sentiment': 'Sentiment', 'category': 'Category'}
+
+# Drift (total variation distance, percentage points) flagged in the report
+DRIFT_WARNING = 10.0
+
+PAGE_META = {
+    'title': 'Data Accuracy and Currency Report | EY Analysis',
+    'header_title': 'Data Accuracy and Currency Report',
+    'header_subtitle': 'Data quality, coverage and label stability of the review dataset'
+}
+
+
+def quality_scan(df):
+    """
+    Null counts per column and date coverage per app × platform in one grouped pass
+
+    Returns:
+        DataFrame indexed by (app_name, platform) with 'reviews', 'dated',
+        'first_date', 'last_date' and one 'null:<column>' count per column
+    """
+    dates = pd.to_datetime(df['date'], errors='coerce')
+    frame = df.isna().add_prefix('null:')
+    frame['app_name'] = df['app_name']
+    frame['platform'] = df['platform']
+    frame['reviews'] = 1
+    frame['dated'] = dates.notna()
+    frame['first_date'] = dates
+    frame['last_date'] = dates
+
+    return frame.groupby(['app_name', 'platform'], dropna=False).agg(_scan_aggregations(frame.columns))
+
+
+def _scan_aggregations(columns):
+    aggregations = {column: 'sum' for column in columns if column.startswith('null:')}
+    aggregations.update({'reviews': 'sum', 'dated': 'sum', 'first_date': 'min', 'last_date': 'max'})
+    return aggregations
+
+
+def merge_scans(scans):
+    """One quality scan from the scans of consecutive parts of a dataset"""
+    scans = list(scans)
+    if len(scans) == 1:
+        return scans[0]
+    combined = pd.concat(scans)
+    return combined.groupby(level=['app_name', 'platform'], dropna=False).agg(_scan_aggregations(combined.columns))
+
+
+def label_distribution(cube, dimension, **filters):
+    """Share (%) of each label of a cube dimension, missing labels as 'Unlabelled'"""
+    rows = cube_slice(cube, **filters)
+    counts = rows.groupby(rows[dimension].fillna('Unlabelled'))['count'].sum()
+    total = counts.sum()
+    if total == 0:
+        return {}
+    return {str(label): round(count / total * 100, 2) for label, count in counts.items()}
+
+
+def drift(current, reference):
+    """Total variation distance between two label distributions, in percentage points"""
+    labels = set(current) | set(reference)
+    return round(sum(abs(current.get(label, 0) - reference.get(label, 0)) for label in labels) / 2, 2)
+
+
+def _date(value):
+    return value.strftime('%Y-%m-%d') if pd.notna(value) else ''
+
+
+def quality_profile(df, category_column=DEFAULT_CATEGORY_COLUMN, previous=None, dataset=''):
+    """
+    Everything the accuracy report states, from the cube and one quality scan
+
+    Args:
+        df: Review DataFrame, or its consecutive chunks (read_review_chunks);
+            chunks are cubed and scanned one at a time and merged
+        previous: Profile from the last run (for drift against it), or None;
+            ignored if its categories came from another column
+    """
+    if previous and previous.get('category_column', DEFAULT_CATEGORY_COLUMN) != category_column:
+        previous = None
+    frames = [df] if isinstance(df, pd.DataFrame) else df
+    cubes, scans = [], []
+    for frame in frames:
+        cubes.append(build_cube(frame, category_column))
+        scans.append(quality_scan(frame))
+    cube = merge_cubes(cubes)
+    scan = merge_scans(scans)
+    total = int(scan['reviews'].sum())
+
+    first, last = scan['first_date'].min(), scan['last_date'].max()
+    metrics = summary_metrics(cube, _date(first), _date(last))
+
+    null_counts = scan[[c for c in scan.columns if c.startswith('null:')]].sum()
+    null_rates = {
+        column[len('null:'):]: {'nulls': int(count), 'rate': round(count / total * 100, 2) if total else 0.0}
+        for column, count in null_counts.items()
+    }
+
+    coverage = []
+    for (app_name, platform), row in scan.sort_index().iterrows():
+        coverage.append({
+            'app_name': app_name,
+            'platform': platform,
+            'reviews': int(row['reviews']),
+            'dated': int(row['dated']),
+            'coverage': round(row['dated'] / row['reviews'] * 100, 1),
+            'first_date': _date(row['first_date']),
+            'last_date': _date(row['last_date'])
+        })
+
+    distributions = {}
+    drifts = {}
+    years = sorted(int(year) for year in cube['year'].dropna().unique())
+    for dimension in LABEL_DIMENSIONS:
+        overall = label_distribution(cube, dimension)
+        distributions[dimension] = overall
+        by_year = {str(year): drift(label_distribution(cube, dimension, year=year), overall)
+                   for year in years if cube_count(cube, year=year)}
+        reference = (previous or {}).get('distributions', {}).get(dimension)
+        drifts[dimension] = {
+            'by_year': by_year,
+            'previous': drift(overall, reference) if reference else None
+        }
+
+    return {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'dataset': dataset,
+        'category_column': category_column,
+        'metrics': metrics,
+        'null_rates': null_rates,
+        'date_coverage': coverage,
+        'distributions': distributions,
+        'drift': drifts,
+        'previous_generated': (previous or {}).get('generated')
+    }
+
+
+def _file_for(path, category_column):
+    """path, suffixed with the category column unless it is the default one"""
+    if category_column == DEFAULT_CATEGORY_COLUMN:
+        return path
+    root, extension = os.path.splitext(path)
+    suffix = category_column.upper() if os.path.basename(root).isupper() else category_column
+    return f"{root}_{suffix}{extension}"
+
+
+def profile_file_for(category_column=DEFAULT_CATEGORY_COLUMN):
+    """Profile file of reports whose categories come from category_column"""
+    return _file_for(PROFILE_FILE, category_column)
+
+
+def report_files_for(category_column=DEFAULT_CATEGORY_COLUMN):
+    """(HTML, Markdown) report files whose categories come from category_column"""
+    return _file_for(HTML_FILE, category_column), _file_for(MARKDOWN_FILE, category_column)
+
+
+def load_profile(path=PROFILE_FILE):
+    """Last saved quality profile, or None"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_profile(profile, path=PROFILE_FILE):
+    """Write the quality profile as JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, indent=2)
+
+
+def report_sections(profile):
+    """
+    The report model both formats are rendered from
+
+    Returns:
+        List of (heading, blocks); a block is ('stats', [(value, label)]),
+        ('table', headers, rows), ('text', str) or ('list', [str])
+    """
+    metrics = profile['metrics']
+    dated = sum(row['dated'] for row in profile['date_coverage'])
+    total = metrics['total_reviews']
+
+    summary = ('stats', [
+        (f"{total:,}", 'Total Reviews'),
+        (f"{metrics['data_currency']:.1f}%", 'Data Currency (2020+)'),
+        (f"{dated / total * 100 if total else 0:.1f}%", 'Date Coverage'),
+        (f"{metrics['average_rating']:.2f}", 'Average Rating')
+    ])
+    breakdown = ('stats', [
+        (f"{metrics['android_reviews']:,}", 'Android Reviews'),
+        (f"{metrics['ios_reviews']:,}", 'iOS Reviews'),
+        (f"{metrics['rogers_reviews']:,}", 'Rogers Reviews'),
+        (f"{metrics['bell_reviews']:,}", 'Bell Reviews')
+    ])
+
+    coverage = ('table', ['Provider', 'Platform', 'Date Range', 'Reviews', 'Dated', 'Date Coverage'], [
+        [row['app_name'], row['platform'],
+         f"{row['first_date']} to {row['last_date']}" if row['first_date'] else 'No dates',
+         f"{row['reviews']:,}", f"{row['dated']:,}", f"{row['coverage']:.1f}%"]
+        for row in profile['date_coverage']
+    ])
+
+    nulls = ('table', ['Column', 'Missing', 'Null Rate'], [
+        [column, f"{stats['nulls']:,}", f"{stats['rate']:.2f}%"]
+        for column, stats in sorted(profile['null_rates'].items(), key=lambda item: -item[1]['rate'])
+    ])
+
+    distribution_blocks = []
+    drift_rows = []
+    for dimension, title in LABEL_DIMENSIONS.items():
+        shares = profile['distributions'][dimension]
+        distribution_blocks.append(('table', [title, 'Share'], [
+            [label, f"{share:.1f}%"] for label, share in sorted(shares.items(), key=lambda item: -item[1])
+        ]))
+        for year, distance in profile['drift'][dimension]['by_year'].items():
+            flag = '⚠️ Drift' if distance >= DRIFT_WARNING else '✅ Stable'
+            drift_rows.append([title, year, f"{distance:.1f} pp", flag])
+
+    drift_blocks = [
+        ('text', 'Total variation distance between each year\'s label distribution and the whole '
+                 f'dataset, in percentage points. Years at {DRIFT_WARNING:g} pp or more are flagged.'),
+        ('table', ['Labels', 'Year', 'Drift', 'Status'], drift_rows)
+    ]
+    previous = [(title, profile['drift'][dimension]['previous']) for dimension, title in LABEL_DIMENSIONS.items()]
+    if profile.get('previous_generated') and any(distance is not None for _, distance in previous):
+        drift_blocks.append(('list', [
+            f"**{title}**: {distance:.1f} pp since the run of {profile['previous_generated'][:10]}"
+            for title, distance in previous if distance is not None
+        ]))
+
+    sources = ('list', [
+        '**Android Reviews:** Google Play Store API (google_play_scraper)',
+        '**iOS Reviews:** iTunes RSS Feed API with date matching',
+        '**Analysis Enhancement:** Claude AI sentiment analysis and categorization',
+        '**Filtering:** Android reviews from January 1, 2020 onwards; all iOS reviews retained'
+    ])
+
+    return [
+        ('Executive Summary', [summary]),
+        ('Data Sources and Methodology', [sources]),
+        ('Platform and Provider Breakdown', [breakdown, ('text', 'Date ranges by platform and provider:'), coverage]),
+        ('Missing Values', [('text', 'Share of reviews with no value in each column.'), nulls]),
+        ('Label Distributions', distribution_blocks),
+        ('Label Drift', drift_blocks)
+    ]
+
+
+def _inline_html(text):
+    """Escaped text with **bold** spans as <strong>"""
+    parts = html.escape(text).split('**')
+    return ''.join(f"<strong>{part}</strong>" if i % 2 else part for i, part in enumerate(parts))
+
+
+def render_markdown(sections, profile):
+    """DATA_ACCURACY_REPORT.md"""
+    lines = [
+        f"# {PAGE_META['header_title']}",
+        f"**Generated:** {profile['generated'][:10]}  ",
+        f"**Dataset:** {profile['dataset']}  ",
+        f"**Analysis Period:** {profile['metrics']['date_range_start']} to {profile['metrics']['date_range_end']}",
+        ''
+    ]
+    for heading, blocks in sections:
+        lines += ['---', '', f"## {heading}", '']
+        for block in blocks:
+            if block[0] == 'stats':
+                lines += [f"- **{label}:** {value}" for value, label in block[1]]
+            elif block[0] == 'table':
+                headers, rows = block[1], block[2]
+                lines.append('| ' + ' | '.join(headers) + ' |')
+                lines.append('|' + '|'.join('---' for _ in headers) + '|')
+                lines += ['| ' + ' | '.join(row) + ' |' for row in rows]
+            elif block[0] == 'text':
+                lines.append(block[1])
+            else:
+                lines += [f"- {item}" for item in block[1]]
+            lines.append('')
+    return '\n'.join(lines)
+
+
+def render_html(sections, profile):
+    """Content of data_accuracy_report.html (assembled into the shared report layout)"""
+    parts = [
+        '<div class="report-container">',
+        '<div class="report-section">',
+        '<div class="report-header">',
+        f'<h1 class="report-title">{PAGE_META["header_title"]}</h1>',
+        f'<p class="report-subtitle">Generated {profile["generated"][:10]} from {html.escape(profile["dataset"])} '
+        f'({profile["metrics"]["date_range_start"]} to {profile["metrics"]["date_range_end"]})</p>',
+        '</div>',
+        '<div class="report-content">'
+    ]
+    for heading, blocks in sections:
+        parts.append(f"<h2>{html.escape(heading)}</h2>")
+        for block in blocks:
+            if block[0] == 'stats':
+                parts.append('<div class="stat-grid">' + ''.join(
+                    f'<div class="stat-card"><div class="stat-number">{html.escape(value)}</div>'
+                    f'<div class="stat-label">{html.escape(label)}</div></div>'
+                    for value, label in block[1]) + '</div>')
+            elif block[0] == 'table':
+                head = ''.join(f"<th>{html.escape(h)}</th>" for h in block[1])
+                body = ''.join('<tr>' + ''.join(f"<td>{html.escape(cell)}</td>" for cell in row) + '</tr>\n'
+                               for row in block[2])
+                parts.append(f"<table>\n<thead><tr>{head}</tr></thead>\n<tbody>\n{body}</tbody>\n</table>")
+            elif block[0] == 'text':
+                parts.append(f"<p>{_inline_html(block[1])}</p>")
+            else:
+                parts.append('<ul>' + ''.join(f"<li>{_inline_html(item)}</li>" for item in block[1]) + '</ul>')
+    parts += ['</div>', '</div>', '</div>']
+    return '\n'.join(parts)
+
+
+def write_accuracy_reports(df, dataset=DATA_FILE, category_column=DEFAULT_CATEGORY_COLUMN,
+                           html_file=None, markdown_file=None, profile_file=None):
+    """
+    Profile df (a DataFrame or its chunks) and write both report formats (and the report viewer fragment
+    of the Markdown) plus the profile
+
+    Args:
+        html_file, markdown_file: Default: report_files_for(category_column)
+        profile_file: Default: profile_file_for(category_column)
+
+    Returns:
+        The quality profile
+    """
+    default_html, default_markdown = report_files_for(category_column)
+    html_file = html_file or default_html
+    markdown_file = markdown_file or default_markdown
+    profile_file = profile_file or profile_file_for(category_column)
+    profile = quality_profile(df, category_column, load_profile(profile_file), dataset)
+    sections = report_sections(profile)
+
+    with open(markdown_file, 'w', encoding='utf-8') as f:
+        f.write(render_markdown(sections, profile))
+    with open(html_file, 'w', encoding='utf-8') as f:
+        f.write(assemble_page(PAGE_META, render_html(sections, profile)))
+    render_markdown_reports([markdown_file])
+
+    save_profile(profile, profile_file)
+    return profile
+
+
+def main():
+    """Generate the data accuracy report from a review CSV"""
+    data_path = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+
+    print("=== DATA ACCURACY REPORT ===\n")
+    if not os.path.exists(data_path):
+        print(f"❌ Review data not found: {data_path}")
+        sys.exit(1)
+
+    profile = write_accuracy_reports(read_review_chunks(data_path), data_path)
+    total = sum(row['reviews'] for row in profile['date_coverage'])
+    print(f"Dataset: {data_path} ({total:,} reviews)\n")
+
+    dated = sum(row['dated'] for row in profile['date_coverage'])
+    print(f"  Date coverage: {dated / max(total, 1) * 100:.1f}%")
+    print(f"  Data currency: {profile['metrics']['data_currency']:.1f}%")
+    worst = max(profile['null_rates'].items(), key=lambda item: item[1]['rate'], default=None)
+    if worst:
+        print(f"  Highest null rate: {worst[0]} ({worst[1]['rate']:.2f}%)")
+    for dimension, title in LABEL_DIMENSIONS.items():
+        by_year = profile['drift'][dimension]['by_year']
+        if by_year:
+            year, distance = max(by_year.items(), key=lambda item: item[1])
+            icon = '⚠️ ' if distance >= DRIFT_WARNING else '✅'
+            print(f"  {icon} {title} drift: max {distance:.1f} pp ({year})")
+
+    print(f"\n✅ {HTML_FILE}")
+    print(f"✅ {MARKDOWN_FILE}")
+    print(f"✅ {PROFILE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
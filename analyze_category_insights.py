@@ -2,28 +2,16 @@
 """
 Analyze category differences to generate insights for chart annotations
 """
-import re
+from dashboard_data import load_dashboard_data
 
 def main():
     print("=== ANALYZING CATEGORY INSIGHTS ===")
     
-    # Read the dashboard JS file
-    with open('html_dashboard/dashboard_complete_enhanced.js', 'r') as f:
-        content = f.read()
-
-    # Extract the data
-    data_match = re.search(r'window\.ENHANCED_DASHBOARD_DATA\s*=\s*({.*?});', content, re.DOTALL)
-    if not data_match:
-        print("❌ Could not find ENHANCED_DASHBOARD_DATA")
-        return
-        
-    data_str = data_match.group(1)
-    data_str = data_str.replace('true', 'True').replace('false', 'False').replace('null', 'None').replace('NaN', 'None')
-    
+    # Load the dashboard data (JSON sidecar written by the generator)
     try:
-        data = eval(data_str)
-    except Exception as e:
-        print(f"❌ Error parsing data: {e}")
+        data = load_dashboard_data()
+    except (OSError, ValueError) as e:
+        print(f"❌ Error loading dashboard data: {e}")
         return
     
     # Calculate categories for each provider
@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 
 import pandas as pd
-import json
 from datetime import datetime
 
+from metrics_cube import compute_metrics, save_metrics
+
 def analyze_filtered_dataset():
     """Analyze the filtered dataset to generate accurate metrics for all HTML reports"""
     
@@ -72,32 +73,11 @@ def analyze_filtered_dataset():
             percentage = (count / len(df)) * 100
             print(f"  {i+1}. {category}: {count:,} ({percentage:.1f}%)")
     
-    # Generate metrics dictionary for use in updates
-    metrics = {
-        'total_reviews': len(df),
-        'android_reviews': int(platform_counts.get('Android', 0)),
-        'ios_reviews': int(platform_counts.get('iOS', 0)),
-        'rogers_reviews': int(app_counts.get('Rogers', 0)),
-        'bell_reviews': int(app_counts.get('Bell', 0)),
-        'average_rating': round(avg_rating, 2),
-        'data_currency': round(data_currency, 1),
-        'date_range_start': df['date'].min().strftime('%Y-%m-%d'),
-        'date_range_end': df['date'].max().strftime('%Y-%m-%d'),
-        'android_percentage': round((platform_counts.get('Android', 0) / len(df)) * 100, 1),
-        'ios_percentage': round((platform_counts.get('iOS', 0) / len(df)) * 100, 1),
-        'rogers_percentage': round((app_counts.get('Rogers', 0) / len(df)) * 100, 1),
-        'bell_percentage': round((app_counts.get('Bell', 0) / len(df)) * 100, 1)
-    }
-    
-    # Add sentiment metrics if available
-    if 'claude_sentiment' in df.columns:
-        for sentiment, count in sentiment_counts.items():
-            metrics[f'{sentiment.lower()}_reviews'] = int(count)
-            metrics[f'{sentiment.lower()}_percentage'] = round((count / len(df)) * 100, 1)
+    # Generate metrics dictionary for use in updates (derived from the metrics cube)
+    _, metrics = compute_metrics(df)
     
     # Save metrics to JSON for easy access
-    with open('filtered_dataset_metrics.json', 'w') as f:
-        json.dump(metrics, f, indent=2)
+    save_metrics(metrics)
     
     print(f"\n=== SUMMARY FOR REPORTS ===")
     print(f"Total Reviews: {metrics['total_reviews']:,}")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+App Registry
+Loads scraper_registry.yaml: the brands whose reviews are scraped, with their
+carrier, countries and per-store app ids. The scrapers read their app lists
+from here instead of hard-coding app ids and countries.
+
+Usage:
+    from app_registry import load_registry, store_apps
+    apps = store_apps('itunes')     # [{'app_id', 'app_name', 'carrier', 'country'}, ...]
+
+    python app_registry.py          # validate the registry and list its apps
+"""
+
+import sys
+
+import yaml
+
+REGISTRY_FILE = 'scraper_registry.yaml'
+
+
+def load_registry(path=REGISTRY_FILE, stores=None):
+    """
+    Load and validate the app registry
+
+    Args:
+        stores: Known store names; stores outside it are rejected when given
+
+    Returns:
+        List of app dicts with app_name, carrier, countries and stores
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or {}
+
+    apps = []
+    names = set()
+    for i, entry in enumerate(data.get('apps') or []):
+        where = f"{path} app {i + 1}"
+        if not isinstance(entry, dict) or not entry.get('app_name'):
+            raise ValueError(f"{where}: app_name is required")
+        name = str(entry['app_name'])
+        if name in names:
+            raise ValueError(f"{where}: duplicate app_name '{name}'")
+        names.add(name)
+
+        countries = entry.get('countries') or []
+        if not isinstance(countries, list) or not countries:
+            raise ValueError(f"{where} ({name}): countries must be a non-empty list")
+        app_stores = entry.get('stores') or {}
+        if not isinstance(app_stores, dict):
+            raise ValueError(f"{where} ({name}): stores must map store names to app ids")
+        unknown = [store for store in app_stores if stores is not None and store not in stores]
+        if unknown:
+            raise ValueError(f"{where} ({name}): unknown stores {', '.join(unknown)}")
+
+        apps.append({
+            'app_name': name,
+            'carrier': str(entry.get('carrier') or name),
+            'countries': [str(country).lower() for country in countries],
+            'stores': {store: str(app_id) for store, app_id in app_stores.items() if app_id}
+        })
+    return apps
+
+
+def store_apps(store, path=REGISTRY_FILE):
+    """One entry per (app, country) that has an id in a store"""
+    return [{'app_id': app['stores'][store], 'app_name': app['app_name'],
+             'carrier': app['carrier'], 'country': country}
+            for app in load_registry(path) if store in app['stores']
+            for country in app['countries']]
+
+
+def main():
+    """Validate the registry and list its apps"""
+    try:
+        apps = load_registry()
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print("=== APP REGISTRY ===")
+    for app in apps:
+        stores = ', '.join(f"{store}={app_id}" for store, app_id in app['stores'].items())
+        icon = '✅' if app['stores'] else '⚪'
+        print(f"{icon} {app['app_name']:<12} {app['carrier']:<10} {'/'.join(app['countries']):<6} "
+              f"{stores or 'no store ids yet'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Dashboard Build Regression Suite
+Builds the dashboard (metrics, review shards, JS files and JSON sidecar) from
+synthetic review CSVs (synthetic_reviews.py) of increasing size, read in chunks
+as update_dashboard_complete reads its dataset, and records per size:
+
+    build_seconds     wall time of metrics + dashboard build graph
+    peak_rss_mb       peak resident memory of the build (before the sidecar is parsed)
+    output_bytes      dashboard JS files + sidecar
+    parse_seconds     load_dashboard_data() on the sidecar (as verify scripts load it)
+    js_parse_seconds  node require() of the dashboard JS (only when node is installed;
+                      a payload node can't load is reported as js_parse_error)
+
+Each size runs in a fresh process and scratch directory so peak RSS is per build.
+Results are compared with benchmark_baseline.json; the run fails (exit 1) when
+a metric regresses past its tolerance.
+
+Usage:
+    python benchmark_dashboard_build.py [rows ...]              # default: 10000 100000 1000000
+    python benchmark_dashboard_build.py --update-baseline [rows ...]
+"""
+
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BASELINE_FILE = 'benchmark_baseline.json'
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+# Allowed regression per metric: relative tolerance plus an absolute slack so
+# timer noise on small runs doesn't fail the suite
+TOLERANCES = {
+    'build_seconds': (0.25, 0.5),
+    'peak_rss_mb': (0.20, 20.0),
+    'output_bytes': (0.05, 0),
+    'parse_seconds': (0.30, 0.05),
+    'js_parse_seconds': (0.30, 0.05)
+}
+
+NODE_PARSE = ("const start = process.hrtime.bigint(); require(process.argv[1]);"
+              "console.log(Number(process.hrtime.bigint() - start) / 1e9);")
+
+
+def run_case(rows):
+    """
+    Build the dashboard for a synthetic corpus in the current directory
+
+    Returns:
+        Dict of the suite's metrics for this size
+    """
+    from build_graph import run_build
+    from dashboard_data import SIDECAR_FILE, clear_cache, load_dashboard_data
+    import synthetic_reviews
+    from review_records import read_review_chunks
+    from update_dashboard_complete import (
+        DASHBOARD_JS_FILES, METRIC_COLUMNS, calculate_enhanced_metrics, dashboard_artifacts, read_dataset
+    )
+
+    # Corpus written by a separate process so its generation doesn't count towards peak RSS
+    corpus = 'reviews.csv'
+    subprocess.run([sys.executable, synthetic_reviews.__file__, str(rows), corpus], check=True, capture_output=True)
+    os.makedirs(os.path.dirname(SIDECAR_FILE), exist_ok=True)
+
+    start = time.perf_counter()
+    metrics = calculate_enhanced_metrics(read_review_chunks(corpus, usecols=METRIC_COLUMNS))
+    results = run_build(dashboard_artifacts(read_dataset(corpus), metrics), force=True)
+    build_seconds = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux
+    peak_rss_mb = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    failed = [r['name'] for r in results if r['status'] == 'failed']
+    if failed:
+        raise RuntimeError(f"Build failed: {', '.join(failed)}")
+
+    clear_cache()
+    start = time.perf_counter()
+    data = load_dashboard_data(SIDECAR_FILE)
+    parse_seconds = time.perf_counter() - start
+    if len(data['reviews']) != rows:
+        raise RuntimeError(f"Sidecar has {len(data['reviews']):,} reviews, expected {rows:,}")
+
+    case = {
+        'rows': rows,
+        'build_seconds': round(build_seconds, 3),
+        'peak_rss_mb': peak_rss_mb,
+        'output_bytes': sum(os.path.getsize(path) for path in DASHBOARD_JS_FILES + [SIDECAR_FILE]),
+        'parse_seconds': round(parse_seconds, 3)
+    }
+
+    node = shutil.which('node')
+    if node:
+        process = subprocess.run([node, '-e', NODE_PARSE, os.path.abspath(DASHBOARD_JS_FILES[0])],
+                                 capture_output=True, text=True)
+        if process.returncode == 0:
+            case['js_parse_seconds'] = round(float(process.stdout.strip()), 3)
+        else:
+            # e.g. the payload exceeds V8's maximum string length
+            errors = [line for line in process.stderr.splitlines() if 'Error' in line]
+            case['js_parse_error'] = (errors or process.stderr.strip().splitlines() or ['unknown'])[-1].strip()
+
+    return case
+
+
+def measure(rows):
+    """Run one size in a fresh process and scratch directory"""
+    script = os.path.abspath(__file__)
+    with tempfile.TemporaryDirectory(prefix='dashboard_bench_') as workdir:
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [os.path.dirname(script),
+                                                                          os.environ.get('PYTHONPATH')])))
+        process = subprocess.run([sys.executable, script, '--case', str(rows)],
+                                 cwd=workdir, env=env, capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(f"{rows:,} rows: {process.stderr.strip().splitlines()[-1:]}")
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def compare(case, baseline):
+    """
+    Regressions of one size against its baseline entry
+
+    Returns:
+        List of (metric, baseline value, current value, limit) tuples
+    """
+    regressions = []
+    for metric, (relative, slack) in TOLERANCES.items():
+        if case.get(metric) is None or baseline.get(metric) is None:
+            continue
+        limit = baseline[metric] * (1 + relative) + slack
+        if case[metric] > limit:
+            regressions.append((metric, baseline[metric], case[metric], limit))
+    if 'js_parse_error' in case and baseline.get('js_parse_seconds') is not None:
+        regressions.append(('js_parse_seconds', baseline['js_parse_seconds'], float('inf'), 0))
+    return regressions
+
+
+def load_baseline(path=BASELINE_FILE):
+    """Baseline cases keyed by row count (as a string)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['cases']
+
+
+def save_baseline(cases, path=BASELINE_FILE):
+    """Store the measured cases as the new baseline"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'python': sys.version.split()[0],
+            'cpu_count': os.cpu_count(),
+            'cases': {str(case['rows']): case for case in cases}
+        }, f, indent=2)
+
+
+def print_cases(cases):
+    """Table of measured metrics"""
+    print(f"{'Rows':>10} {'Build (s)':>10} {'Peak RSS (MB)':>14} {'Output (MB)':>12} {'Parse (s)':>10} {'JS parse (s)':>13}")
+    print("-" * 74)
+    for case in cases:
+        js = f"{case['js_parse_seconds']:>13.3f}" if 'js_parse_seconds' in case else f"{'-':>13}"
+        print(f"{case['rows']:>10,} {case['build_seconds']:>10.3f} {case['peak_rss_mb']:>14.1f} "
+              f"{case['output_bytes'] / 1e6:>12.2f} {case['parse_seconds']:>10.3f} {js}")
+    for case in cases:
+        if 'js_parse_error' in case:
+            print(f"⚠️  {case['rows']:,} rows: node could not load the dashboard JS ({case['js_parse_error']})")
+
+
+def main():
+    """Run the suite, compare with the baseline (or update it)"""
+    args = sys.argv[1:]
+    if args[:1] == ['--case']:
+        print(json.dumps(run_case(int(args[1]))))
+        return
+
+    update = '--update-baseline' in args
+    sizes = [int(arg) for arg in args if not arg.startswith('--')] or DEFAULT_SIZES
+
+    print("=== DASHBOARD BUILD REGRESSION SUITE ===\n")
+    cases = []
+    for rows in sizes:
+        print(f"Building dashboard for {rows:,} synthetic reviews...")
+        try:
+            cases.append(measure(rows))
+        except (RuntimeError, ValueError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+    print()
+    print_cases(cases)
+
+    if update:
+        save_baseline(cases)
+        print(f"\n✅ Baseline updated: {BASELINE_FILE}")
+        return
+
+    baseline = load_baseline()
+    if not baseline:
+        print(f"\n⚠️  No baseline found ({BASELINE_FILE}); run with --update-baseline to record one")
+        return
+
+    failures = 0
+    print()
+    for case in cases:
+        reference = baseline.get(str(case['rows']))
+        if reference is None:
+            print(f"⚪ {case['rows']:,} rows: no baseline entry")
+            continue
+        regressions = compare(case, reference)
+        if not regressions:
+            print(f"✅ {case['rows']:,} rows: within baseline")
+        for metric, before, after, limit in regressions:
+            print(f"❌ {case['rows']:,} rows: {metric} {before:g} → {after:g} (limit {limit:g})")
+        failures += len(regressions)
+
+    print(f"\n=== {failures} REGRESSIONS ===")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
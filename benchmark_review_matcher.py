@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+iOS Review Matching Benchmark
+Times the original nested-loop matcher against the blocked matcher
+(review_matcher.match_reviews) on synthetic existing/re-scraped iOS reviews,
+and checks they agree. The nested loop is quadratic, so it only runs up to
+LEGACY_LIMIT rows. Exact matches must be identical; fuzzy matches may differ
+slightly, since the nested loop assigns greedily in row order and the
+matcher assigns the highest-scoring one-to-one matching, so the total fuzzy
+confidence is also compared.
+
+The re-scrape keeps most reviews verbatim (dated), edits the text of some,
+renames the author of some, drops some and adds new ones.
+
+With --scaling, times the matcher with 1, 2, 4 and 8 workers scoring the
+fuzzy candidates instead, and checks every worker count finds the same
+matches. Speedup is bounded by the cores available.
+
+Usage: python benchmark_review_matcher.py [rows ...]   (default: 2000 10000 100000)
+       python benchmark_review_matcher.py --scaling [rows]   (default: 100000)
+"""
+
+import os
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from review_matcher import similarity_score, match_reviews
+from synthetic_reviews import make_reviews
+
+LEGACY_LIMIT = 2_000
+MIN_AGREEMENT = 0.98
+SCALING_WORKERS = [1, 2, 4, 8]
+WORDS = ['bill', 'login', 'payment', 'data', 'roaming', 'plan', 'update', 'screen', 'support', 'account',
+         'phone', 'crash', 'password', 'usage', 'invoice', 'wifi', 'network', 'store', 'chat', 'upgrade']
+
+
+def make_pair(n, seed=42):
+    """(existing iOS reviews without dates, re-scraped reviews with dates)"""
+    rng = np.random.default_rng(seed)
+    df = make_reviews(n, seed=seed)[['review_id', 'title', 'text', 'rating', 'author', 'date', 'app_name']]
+    df['platform'] = 'iOS'
+    # Real nicknames and texts are close to unique; the generator's pools aren't
+    df['author'] = df['author'] + ' ' + pd.Series(rng.integers(0, n * 10, n)).astype(str)
+    words = np.array(WORDS, dtype=object)
+    df['text'] = df['text'] + ' ' + words[rng.integers(0, len(words), n)] + ' ' + words[rng.integers(0, len(words), n)] \
+        + ' ' + pd.Series(rng.integers(0, 1000, n)).astype(str)
+
+    existing = df.assign(date='')
+    new = df.copy()
+    edited = rng.random(n) < 0.05
+    new.loc[edited, 'text'] = new.loc[edited, 'text'].str.replace(r'\.', '!', regex=True) + ' Please fix.'
+    renamed = rng.random(n) < 0.03
+    new.loc[renamed, 'author'] = new.loc[renamed, 'author'] + 'x'
+    new = new[rng.random(n) >= 0.05]
+    extra = make_reviews(n // 20 + 1, seed=seed + 1)[new.columns.drop('platform')].assign(platform='iOS')
+    new = pd.concat([new, extra], ignore_index=True)
+    return existing, new.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def legacy_match_reviews(existing_ios_df, new_ios_df):
+    """The original nested loops, kept here as the baseline"""
+    matches = []
+    unmatched_existing = []
+    unmatched_new = list(range(len(new_ios_df)))
+
+    for idx_e, existing in existing_ios_df.iterrows():
+        found_match = False
+        for idx_n in unmatched_new[:]:
+            new = new_ios_df.iloc[idx_n]
+            if (existing['author'] == new['author'] and
+                    existing['rating'] == new['rating'] and
+                    existing['app_name'] == new['app_name']):
+                text_sim = similarity_score(existing.get('text', ''), new.get('text', ''))
+                if text_sim > 0.9:
+                    matches.append({'existing_idx': idx_e, 'new_idx': idx_n, 'match_type': 'exact',
+                                    'confidence': text_sim, 'date_to_add': new['date']})
+                    unmatched_new.remove(idx_n)
+                    found_match = True
+                    break
+        if not found_match:
+            unmatched_existing.append(idx_e)
+
+    for idx_e in unmatched_existing[:]:
+        existing = existing_ios_df.loc[idx_e]
+        best_match = None
+        best_score = 0
+        best_idx = None
+        for idx_n in unmatched_new:
+            new = new_ios_df.iloc[idx_n]
+            if (existing['app_name'] == new['app_name'] and
+                    abs(existing['rating'] - new['rating']) <= 1):
+                text_sim = similarity_score(existing.get('text', ''), new.get('text', ''))
+                title_sim = similarity_score(existing.get('title', ''), new.get('title', ''))
+                combined_score = (text_sim * 0.7 + title_sim * 0.3) if title_sim > 0 else text_sim
+                if combined_score > best_score and combined_score > 0.7:
+                    best_score = combined_score
+                    best_match = new
+                    best_idx = idx_n
+        if best_match is not None:
+            matches.append({'existing_idx': idx_e, 'new_idx': best_idx, 'match_type': 'fuzzy',
+                            'confidence': best_score, 'date_to_add': best_match['date']})
+            unmatched_existing.remove(idx_e)
+            unmatched_new.remove(best_idx)
+
+    return matches, unmatched_existing, unmatched_new
+
+
+def pairs(matches, match_type=None):
+    return {(m['existing_idx'], m['new_idx']) for m in matches if match_type in (None, m['match_type'])}
+
+
+def total_confidence(matches):
+    return sum(m['confidence'] for m in matches if m['match_type'] == 'fuzzy')
+
+
+def scaling(n):
+    """Match n rows with each worker count; False if any count matches differently"""
+    existing, new = make_pair(n)
+    print(f"⏱️  FUZZY SCORING SCALING ({n:,} rows, {os.cpu_count()} CPUs)")
+    print("=" * 50)
+    print(f"{'workers':>8} {'time (s)':>10} {'speedup':>8} {'matches':>9} {'same':>6}")
+    print("-" * 50)
+
+    baseline = base_time = None
+    same = True
+    for workers in SCALING_WORKERS:
+        start = time.perf_counter()
+        matches, _, _ = match_reviews(existing, new, verbose=False, workers=workers)
+        elapsed = time.perf_counter() - start
+        found = [(m['existing_idx'], m['new_idx'], m['match_type'], m['confidence']) for m in matches]
+        if baseline is None:
+            baseline, base_time = found, elapsed
+        same &= found == baseline
+        print(f"{workers:>8} {elapsed:>10.2f} {base_time / elapsed:>7.2f}x {len(found):>9,} "
+              f"{'✅' if found == baseline else '❌':>5}")
+    return same
+
+
+def main():
+    if '--scaling' in sys.argv[1:]:
+        sizes = [int(arg) for arg in sys.argv[1:] if arg != '--scaling'] or [100_000]
+        if not scaling(sizes[0]):
+            print("\n❌ Matches depend on the worker count")
+            sys.exit(1)
+        print("\n✅ Same matches with every worker count")
+        return
+
+    sizes = [int(arg) for arg in sys.argv[1:]] or [2_000, 10_000, 100_000]
+
+    print("⏱️  iOS REVIEW MATCHING BENCHMARK")
+    print("=" * 87)
+    print(f"{'Rows':>9} {'nested (s)':>11} {'blocked (s)':>12} {'speedup':>8} {'exact':>8} {'fuzzy':>7} "
+          f"{'agreement':>10} {'fuzzy Σ':>8}")
+    print("-" * 87)
+
+    failed = False
+    for n in sizes:
+        existing, new = make_pair(n)
+
+        start = time.perf_counter()
+        matches, _, _ = match_reviews(existing, new, verbose=False)
+        blocked_time = time.perf_counter() - start
+        exact, fuzzy = len(pairs(matches, 'exact')), len(pairs(matches, 'fuzzy'))
+
+        if n <= LEGACY_LIMIT:
+            start = time.perf_counter()
+            legacy, _, _ = legacy_match_reviews(existing, new)
+            legacy_time = time.perf_counter() - start
+            agreement = len(pairs(matches) & pairs(legacy)) / max(len(pairs(legacy)), 1)
+            ratio = total_confidence(matches) / max(total_confidence(legacy), 1e-9)
+            # Exact matches must be identical; fuzzy blocking and assignment may only change a few
+            failed |= pairs(matches, 'exact') != pairs(legacy, 'exact') or agreement < MIN_AGREEMENT
+            print(f"{n:>9,} {legacy_time:>11.2f} {blocked_time:>12.2f} {legacy_time / blocked_time:>7.0f}x "
+                  f"{exact:>8,} {fuzzy:>7,} {agreement:>9.2%} {ratio:>7.1%}")
+        else:
+            print(f"{n:>9,} {'-':>11} {blocked_time:>12.2f} {'-':>8} {exact:>8,} {fuzzy:>7,} {'-':>10} {'-':>8}")
+
+    if failed:
+        print("\n❌ Blocked matches differ from the nested loops")
+        sys.exit(1)
+    print("\n✅ Blocked matches agree with the nested loops")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Rewrite Engine Benchmark
+Times the legacy one-re.sub-per-rule chain against the single-pass rewrite
+engine on a report, using a fixed rule set shaped like the old patch scripts'
+(literal numbers, bounded and lazy gaps, case-insensitive phrases, group
+templates, a counted callable). Works on an in-memory copy; the report on disk
+is not modified and the replacement values mean nothing.
+
+Usage: python benchmark_rewrite_engine.py [html_file] [repeat]
+       (default: html_dashboard/dashboard.html 20)
+"""
+
+import re
+import sys
+import time
+
+from rewrite_engine import _normalize_rule, compile_rules, rewrite
+
+# Timing fixture (rule shapes of the removed patch scripts, not report corrections)
+BENCHMARK_RULES = [
+    (r'\b\d{1,3},\d{3}\b', '0,000'),
+    (r'\b(19|20)\d{2}-(19|20)\d{2}\b', '2000-2000'),
+    (r'\b(from|since) (19|20)\d{2}\b', '\\g<1> 2000'),
+    (r'spanning[^\n<]{0,80}?20\d{2}[^\n<]{0,80}?20\d{2}', 'spanning 2000-2000'),
+    (r'data currency.*?\d+\.\d', 'data currency: 0.0', re.IGNORECASE),
+    (r'\b\d{1,2}\.\d%', '0.0%'),
+    (r'(average rating.*?)([1-5]\.\d+)', '\\g<1>0.00', re.IGNORECASE),
+    (r'Rogers.*?(\d+,?\d*)', 'Rogers: 0'),
+    (r'Bell.*?(\d+,?\d*)', 'Bell: 0'),
+    (r'(<p[^>]*>.*?</p>)', lambda match: match.group(1) + '<div class="note"></div>', 0, 1)
+]
+
+
+def legacy_rewrite(text, rules):
+    """Sequential re.search + re.sub per rule, as the patch scripts did"""
+    hits = []
+    for rule in rules:
+        pattern, replacement, flags, count = _normalize_rule(rule)
+        if re.search(pattern, text, flags):
+            text, n = re.subn(pattern, replacement, text, count=count, flags=flags)
+            hits.append(n)
+        else:
+            hits.append(0)
+    return text, hits
+
+
+def time_call(func, repeat):
+    """Best-of-repeat wall time in seconds and the last result"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else 'html_dashboard/dashboard.html'
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    rules = BENCHMARK_RULES
+
+    print(f"=== REWRITE ENGINE BENCHMARK: {path} ({len(content):,} chars, {len(rules)} rules) ===\n")
+
+    legacy_time, (legacy_text, legacy_hits) = time_call(lambda: legacy_rewrite(content, rules), repeat)
+    ruleset = compile_rules(rules)
+    engine_time, (engine_text, engine_hits) = time_call(lambda: rewrite(content, ruleset), repeat)
+
+    print(f"{'Method':<20} {'Time (ms)':>10} {'Replacements':>13}")
+    print("-" * 45)
+    print(f"{'Sequential re.sub':<20} {legacy_time * 1000:>10.2f} {sum(legacy_hits):>13}")
+    print(f"{'Single pass':<20} {engine_time * 1000:>10.2f} {sum(engine_hits):>13}")
+    print("-" * 45)
+    print(f"Speedup: {legacy_time / engine_time:.1f}x")
+    print(f"Identical output: {'✅' if legacy_text == engine_text else '⚠️  no (replaced text is not rescanned)'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Incremental Build Graph
+Tracks an input hash per output artifact so dashboard and report rebuilds only
+redo the artifacts whose inputs changed.
+
+An artifact is a dict (see artifact()) with a build function, the files and
+in-memory values it depends on, and the files it writes. Artifacts run in
+list order; a downstream artifact lists upstream outputs as its inputs, so a
+change propagates through the file hashes.
+
+The hash stored for an artifact is taken after it builds, which also covers
+the patch scripts that rewrite a report in place: a report is skipped until its
+content (or the script patching it) changes again.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+STATE_FILE = '.build_state.json'
+
+# Files hashed once per process, keyed by (path, mtime_ns, size)
+_file_hashes = {}
+
+
+def file_digest(path):
+    """SHA-256 of a file's content ('missing' when it doesn't exist)"""
+    if not os.path.exists(path):
+        return 'missing'
+
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        _file_hashes[key] = digest.hexdigest()
+
+    return _file_hashes[key]
+
+
+def value_digest(value):
+    """SHA-256 of an in-memory input (bytes, str or anything JSON-serializable)"""
+    if isinstance(value, bytes):
+        data = value
+    elif isinstance(value, str):
+        data = value.encode('utf-8')
+    else:
+        data = json.dumps(value, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def artifact(name, build, inputs=(), values=(), outputs=()):
+    """
+    Describe one build artifact
+
+    Args:
+        name: Unique artifact name (used as the state key)
+        build: Zero-argument function that writes the outputs
+        inputs: File paths the artifact depends on
+        values: In-memory inputs (e.g. metrics dicts, row hashes)
+        outputs: File paths the build writes (rebuilt if any is missing)
+    """
+    return {
+        'name': name,
+        'build': build,
+        'inputs': list(inputs),
+        'values': list(values),
+        'outputs': list(outputs)
+    }
+
+
+def input_digest(item):
+    """Combined hash of an artifact's file and value inputs"""
+    digest = hashlib.sha256()
+    for path in item['inputs']:
+        digest.update(f"{path}:{file_digest(path)}\n".encode('utf-8'))
+    for value in item['values']:
+        digest.update(f"value:{value_digest(value)}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_state(state_file=STATE_FILE):
+    """Previously recorded artifact hashes"""
+    if not os.path.exists(state_file):
+        return {}
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state, state_file=STATE_FILE):
+    """Persist artifact hashes"""
+    with open(state_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+
+def run_build(artifacts, state_file=STATE_FILE, force=False):
+    """
+    Build the artifacts whose inputs changed since the last run
+
+    Returns:
+        List of {'name', 'status', 'seconds'} dicts, one per artifact
+    """
+    state = load_state(state_file)
+    results = []
+
+    for item in artifacts:
+        start = time.perf_counter()
+        digest = input_digest(item)
+        outputs_present = all(os.path.exists(path) for path in item['outputs'])
+
+        if not force and outputs_present and state.get(item['name']) == digest:
+            status = 'skipped'
+        else:
+            try:
+                item['build']()
+            except Exception as e:
+                print(f"❌ Error building {item['name']}: {e}")
+                state.pop(item['name'], None)
+                results.append({'name': item['name'], 'status': 'failed', 'seconds': time.perf_counter() - start})
+                continue
+
+            # Re-hash after building: in-place builds change their own inputs
+            state[item['name']] = input_digest(item)
+            status = 'built'
+
+        results.append({'name': item['name'], 'status': status, 'seconds': time.perf_counter() - start})
+
+    save_state(state, state_file)
+    return results
+
+
+def print_timing_table(results):
+    """Per-artifact status and timing"""
+    if not results:
+        return
+
+    width = max(len('Artifact'), max(len(r['name']) for r in results))
+    icons = {'built': '🔨', 'skipped': '⚪', 'failed': '❌'}
+
+    print(f"\n{'Artifact':<{width}}  {'Status':<10} {'Time (s)':>9}")
+    print("-" * (width + 22))
+    for r in results:
+        print(f"{r['name']:<{width}}  {icons[r['status']]} {r['status']:<8} {r['seconds']:>9.3f}")
+    print("-" * (width + 22))
+
+    built = sum(1 for r in results if r['status'] == 'built')
+    total_time = sum(r['seconds'] for r in results)
+    print(f"{'TOTAL':<{width}}  {built}/{len(results)} built {total_time:>9.3f}")
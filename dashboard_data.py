@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Dashboard Data Loader
+Reads the dashboard_data.json sidecar written next to the dashboard JS files
+instead of regex-extracting and eval()-ing the multi-MB JS.
+
+The file is memory-mapped and parsed with orjson when available. Parsed data is
+cached in-process per path and reused until the file's mtime or size changes.
+Falls back to safely JSON-decoding the object literal inside the JS file when
+no sidecar has been generated yet.
+"""
+
+import json
+import mmap
+import os
+
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SIDECAR_FILE = 'html_dashboard/dashboard_data.json'
+DASHBOARD_JS_FILE = 'html_dashboard/dashboard_complete_enhanced.js'
+
+# Names the generators have used for the data object, newest first
+JS_VARIABLES = ['ENHANCED_DASHBOARD_DATA', 'COMPLETE_DASHBOARD_DATA', 'DASHBOARD_DATA']
+
+# Dashboard record keys -> review store columns (as metrics_cube reads them)
+REVIEW_STORE_COLUMNS = {
+    'app': 'app_name',
+    'content': 'text',
+    'sentiment': 'claude_sentiment',
+    'category': 'enhanced_category'
+}
+
+# abspath -> ((mtime_ns, size), data)
+_cache = {}
+
+
+def _file_key(path):
+    """Cache key that changes whenever the file is rewritten"""
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _parse_mapped(path):
+    """Parse a JSON file through a read-only memory map"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"Empty dashboard data file: {path}")
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+            return json.loads(mm[:])
+
+
+def _parse_js(path):
+    """Decode the data object literal from a generated dashboard JS file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    decoder = json.JSONDecoder()
+    for name in JS_VARIABLES:
+        marker = content.find(f'{name} = {{')
+        if marker == -1:
+            continue
+        # JSON decoding (not eval) - NaN is accepted and review text is left alone
+        data, _ = decoder.raw_decode(content, content.index('{', marker))
+        return data
+
+    raise ValueError(f"No dashboard data object found in {path}")
+
+
+def _load_cached(path, parse):
+    """Return parsed data for path, reparsing only when the file changed"""
+    full_path = os.path.abspath(path)
+    key = _file_key(full_path)
+
+    cached = _cache.get(full_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    data = parse(full_path)
+    _cache[full_path] = (key, data)
+    return data
+
+
+def load_dashboard_data(path=SIDECAR_FILE, js_fallback=DASHBOARD_JS_FILE):
+    """
+    Load the dashboard data ({'summary': ..., 'reviews': [...]})
+
+    Args:
+        path: Sidecar JSON written by the dashboard generators
+        js_fallback: Generated JS file to decode when the sidecar is missing
+
+    Returns:
+        Dictionary with 'summary' and 'reviews' keys
+    """
+    if os.path.exists(path):
+        return _load_cached(path, _parse_mapped)
+
+    if js_fallback and os.path.exists(js_fallback):
+        return _load_cached(js_fallback, _parse_js)
+
+    raise FileNotFoundError(f"Dashboard data not found: {path} (run regenerate_dashboard_js.py)")
+
+
+def load_reviews_frame(path=SIDECAR_FILE, js_fallback=DASHBOARD_JS_FILE):
+    """Dashboard reviews as a DataFrame"""
+    return pd.DataFrame(load_dashboard_data(path, js_fallback)['reviews'])
+
+
+def review_store_frame(reviews):
+    """Dashboard review records as a DataFrame with review store column names"""
+    return pd.DataFrame(reviews).rename(columns=REVIEW_STORE_COLUMNS)
+
+
+def clear_cache():
+    """Drop all cached dashboard data"""
+    _cache.clear()
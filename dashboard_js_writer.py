@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Streaming Dashboard JS Writer
+Writes dashboard data files without holding the full review JSON in memory.
+The summary block is rendered by the existing template functions; reviews are
+written to disk chunk by chunk as the caller yields them. Memory only stays
+flat when the reviews come from a chunked reader too: update_dashboard_complete
+reads its CSV with read_review_chunks, regenerate_dashboard_js still loads the
+whole filtered CSV first.
+
+compat=True reproduces json.dumps(reviews, indent=4) byte for byte.
+compat=False writes one compact review per line using orjson when available.
+
+write_dashboard_sidecar writes the same summary and reviews as strict JSON
+for dashboard_data.load_dashboard_data.
+"""
+
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Marker substituted for the reviews array when rendering the template
+REVIEWS_SLOT = '\x00__REVIEWS__\x00'
+
+# Rows prepared and serialized per write
+CHUNK_SIZE = 5000
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def iter_review_records(df, prepare, chunk_size=CHUNK_SIZE):
+    """Yield dashboard review dicts chunk by chunk from the review DataFrame"""
+    for start in range(0, len(df), chunk_size):
+        yield from prepare(df.iloc[start:start + chunk_size])
+
+
+def _encode_compat(record):
+    """Match the nesting json.dumps(list, indent=4) gives each element"""
+    return '    ' + json.dumps(record, indent=4).replace('\n', '\n    ')
+
+
+def encode_compact(record):
+    """One compact review per line, NaN written as null"""
+    if orjson is not None:
+        return orjson.dumps(record, option=ORJSON_OPTIONS).decode('utf-8')
+    return json.dumps(_nan_to_none(record), ensure_ascii=False, separators=(',', ':'), default=_to_builtin)
+
+
+def _nan_to_none(value):
+    """Recursively replace float NaN with None (strict JSON has no NaN)"""
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, dict):
+        return {k: _nan_to_none(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_nan_to_none(v) for v in value]
+    return value
+
+
+def _to_builtin(value):
+    """json.dumps fallback for NumPy scalars"""
+    if hasattr(value, 'item'):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def write_review_array(f, records, compat=True, chunk_size=CHUNK_SIZE):
+    """Stream an iterable of review dicts to f as a JSON array, return count"""
+    encode = _encode_compat if compat else encode_compact
+    count = 0
+    buffer = []
+
+    for record in records:
+        buffer.append(encode(record))
+        count += 1
+        if len(buffer) >= chunk_size:
+            f.write(('[\n' if count == len(buffer) else ',\n') + ',\n'.join(buffer))
+            buffer = []
+
+    if buffer:
+        f.write(('[\n' if count == len(buffer) else ',\n') + ',\n'.join(buffer))
+
+    f.write('\n]' if count else '[]')
+    return count
+
+
+def encode_fragment(records, compat=True):
+    """Serialize records as the comma-joined body of a JSON array (no brackets)"""
+    encode = _encode_compat if compat else encode_compact
+    return ',\n'.join(encode(record) for record in records)
+
+
+def write_fragment_array(f, fragment_paths):
+    """Write a JSON array from fragment files produced by encode_fragment, return fragment count"""
+    written = 0
+
+    for fragment_path in fragment_paths:
+        with open(fragment_path, 'r', encoding='utf-8') as part:
+            body = part.read()
+        if body:
+            f.write(('[\n' if written == 0 else ',\n') + body)
+            written += 1
+
+    f.write('\n]' if written else '[]')
+    return written
+
+
+def _write_template(path, render, metrics, write_array):
+    """Write a rendered template, calling write_array(f) at every reviews slot"""
+    parts = render(metrics, REVIEWS_SLOT).split(REVIEWS_SLOT)
+    result = 0
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(parts[0])
+        for part in parts[1:]:
+            result = write_array(f)
+            f.write(part)
+
+    return result
+
+
+def stream_dashboard_js(path, render, metrics, reviews_factory, compat=True):
+    """
+    Write a dashboard JS file by streaming reviews into a rendered template
+
+    Args:
+        path: Output file path
+        render: Template function (metrics, reviews_json) -> str
+        metrics: Summary metrics passed to the template
+        reviews_factory: Callable returning a fresh iterator of review dicts
+            (called once for every reviews array in the template)
+        compat: Byte-identical to the json.dumps(indent=4) format when True
+
+    Returns:
+        Number of reviews written per array
+    """
+    return _write_template(
+        path, render, metrics,
+        lambda f: write_review_array(f, reviews_factory(), compat=compat)
+    )
+
+
+def assemble_dashboard_js(path, render, metrics, fragment_paths):
+    """Write a dashboard JS file from pre-encoded review fragments (see encode_fragment)"""
+    return _write_template(path, render, metrics, lambda f: write_fragment_array(f, fragment_paths))
+
+
+def write_dashboard_sidecar(path, summary, reviews_factory):
+    """
+    Write summary and reviews as strict JSON (one review per line)
+
+    Args:
+        path: Output file path (see dashboard_data.SIDECAR_FILE)
+        summary: Summary metrics dict (same values as the JS "summary" block)
+        reviews_factory: Callable returning a fresh iterator of review dicts
+
+    Returns:
+        Number of reviews written
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"summary":' + encode_compact(summary) + ',\n"reviews":')
+        count = write_review_array(f, reviews_factory(), compat=False)
+        f.write('}\n')
+
+    return count
+
+
+def assemble_dashboard_sidecar(path, summary, fragment_paths):
+    """Write the strict JSON sidecar from fragments encoded with compat=False"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"summary":' + encode_compact(summary) + ',\n"reviews":')
+        write_fragment_array(f, fragment_paths)
+        f.write('}\n')
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Report Layout Extractor
+One-off conversion of the full-page report templates in html_dashboard/templates/
+into front matter + content for report_layout.py. The head, header, shared
+navigation and footer each page carried are dropped in favour of the shared
+layout in html_dashboard/layout/; page-specific <style> blocks are kept with
+the content.
+
+Re-run only for a report template that was edited back into a full page.
+"""
+
+import os
+import re
+
+import yaml
+
+from render_reports import TEMPLATE_DIR
+from report_layout import split_front_matter
+
+REPORTS = [
+    'bell_smart_cx_report.html',
+    'cx_ux_assessment_report.html',
+    'executive_summary.html',
+    'key_metrics_reference.html',
+    'metrics_calculations_verification.html',
+    'research_methodology.html',
+    'research_process_approach.html',
+    'rogers_cx_transformation_report.html'
+]
+
+TITLE = re.compile(r'<title>(.*?)</title>', re.DOTALL)
+HEADER_TITLE = re.compile(r'<h1 class="header-title">(.*?)</h1>', re.DOTALL)
+HEADER_SUBTITLE = re.compile(r'<p class="header-subtitle">(.*?)</p>', re.DOTALL)
+HEAD_STYLES = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+MAIN_CONTENT = re.compile(r'<!-- Main Content -->(.*?)<!-- Footer -->', re.DOTALL)
+
+
+def collapse(text):
+    """Single-line text from a multi-line tag body"""
+    return ' '.join(text.split())
+
+
+def extract_page(html):
+    """
+    Split a full report page into front matter and content
+
+    Raises:
+        ValueError: If the page doesn't have the standard report structure
+    """
+    parts = {}
+    for name, pattern in [('title', TITLE), ('header_title', HEADER_TITLE),
+                          ('header_subtitle', HEADER_SUBTITLE), ('content', MAIN_CONTENT)]:
+        match = pattern.search(html)
+        if not match:
+            raise ValueError(f"No {name} found")
+        parts[name] = match.group(1)
+
+    head = html[:html.lower().find('</head>')]
+    styles = '\n'.join(HEAD_STYLES.findall(head))
+
+    meta = {name: collapse(parts[name]) for name in ('title', 'header_title', 'header_subtitle')}
+    front_matter = yaml.safe_dump(meta, sort_keys=False, allow_unicode=True, width=1000)
+    content = '\n'.join(part for part in (styles, parts['content'].strip('\n')) if part)
+
+    return f"---\n{front_matter}---\n{content}\n"
+
+
+def main():
+    """Convert each full-page report template"""
+    print("=== EXTRACTING REPORT CONTENT FROM PAGE TEMPLATES ===\n")
+
+    for report in REPORTS:
+        path = os.path.join(TEMPLATE_DIR, report)
+        if not os.path.exists(path):
+            print(f"⚠️  Template not found: {path}")
+            continue
+
+        with open(path, 'r', encoding='utf-8') as f:
+            html = f.read()
+
+        if split_front_matter(html)[0] is not None:
+            print(f"⚪ Already uses the layout: {path}")
+            continue
+
+        try:
+            converted = extract_page(html)
+        except ValueError as e:
+            print(f"❌ {path}: {e}")
+            continue
+
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(converted)
+        print(f"✅ {path}: {len(html):,} → {len(converted):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
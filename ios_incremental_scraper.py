@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Incremental iOS Review Scraper
+Scrapes only the iOS reviews posted since the last run. A per-app high-water
+mark (the newest review date already ingested, plus the ids of the reviews at
+that date) is kept in ios_high_water_marks.json; paging stops at the first
+page reaching it, so a routine daily refresh costs one or two requests per app
+and writes only the delta.
+
+The delta has the columns of ios_rescrape_fixed.py's output and is added to
+the dataset with merge_ios_data.py --append. Marks only advance after the
+delta is saved, and not for a feed that failed part-way or whose mark wasn't
+reached within the pages iTunes serves: the reviews in between can't be
+fetched, so the old mark is kept and the gap reported until a --full run
+resets it.
+
+Usage:
+    python ios_incremental_scraper.py                          # delta since the stored marks
+    python ios_incremental_scraper.py --seed <existing.csv>    # start marks from a dataset's newest iOS dates
+    python ios_incremental_scraper.py --full                   # ignore the marks (full scrape, marks reset)
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from app_registry import store_apps
+from ios_rescrape_fixed import parse_review_entries
+from itunes_rss import FEED_URL, MARK_NOT_REACHED, MAX_PAGES, fetch_feeds_async, print_fetch_summary
+
+MARKS_FILE = 'ios_high_water_marks.json'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+APPS = store_apps('itunes')
+
+
+def mark_key(app):
+    return f"{app['app_id']}/{app['country']}"
+
+
+def entry_id(entry):
+    return entry.get('id', {}).get('label', '')
+
+
+def entry_time(entry):
+    """Review time as the dataset stores it (local wall-clock time, no offset), or None"""
+    try:
+        return datetime.fromisoformat(entry.get('updated', {}).get('label', '')).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def load_marks(path=MARKS_FILE):
+    """High-water marks keyed by 'app_id/country'"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_marks(marks, path=MARKS_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(marks, f, indent=2, sort_keys=True)
+
+
+def seed_marks(df, apps=APPS):
+    """Marks from the newest dated iOS review per app in an existing dataset"""
+    marks = {}
+    ios = df[df['platform'] == 'iOS']
+    for app in apps:
+        dates = pd.to_datetime(ios.loc[ios['app_name'] == app['app_name'], 'date'], errors='coerce').dropna()
+        if len(dates):
+            marks[mark_key(app)] = {'app_name': app['app_name'], 'date': dates.max().strftime(DATE_FORMAT), 'ids': []}
+    return marks
+
+
+def seen_before(mark):
+    """Predicate for entries at or below a mark (None: nothing seen yet)"""
+    if not mark:
+        return None
+    mark_date = datetime.strptime(mark['date'], DATE_FORMAT)
+    ids = set(mark['ids'])
+
+    def seen(entry):
+        if entry_id(entry) in ids:
+            return True
+        when = entry_time(entry)
+        # Reviews at the mark's own second are new when their id wasn't recorded
+        # (seeded marks have no ids, so everything at their date counts as seen)
+        return when is not None and (when < mark_date or (when == mark_date and not ids))
+    return seen
+
+
+def advance_mark(mark, entries, app):
+    """Mark after ingesting entries (newest date, ids of the reviews at that date)"""
+    dated = [(entry_time(entry), entry_id(entry)) for entry in entries]
+    dated = [(when, review_id) for when, review_id in dated if when is not None]
+    if not dated:
+        return mark
+
+    newest = max(when for when, _ in dated)
+    if mark and datetime.strptime(mark['date'], DATE_FORMAT) > newest:
+        return mark
+    ids = {review_id for when, review_id in dated if when == newest and review_id}
+    if mark and mark['date'] == newest.strftime(DATE_FORMAT):
+        ids.update(mark['ids'])
+    return {'app_name': app['app_name'], 'date': newest.strftime(DATE_FORMAT), 'ids': sorted(ids),
+            'updated_at': datetime.now().strftime(DATE_FORMAT)}
+
+
+def scrape_delta(apps, marks, max_pages=MAX_PAGES, url=FEED_URL, cache=True):
+    """
+    New review entries per app since its mark
+
+    Pages are fetched one at a time per feed (apps concurrently), so a feed
+    whose first page reaches the mark costs a single request.
+
+    Returns:
+        ({mark key: (entries, error or None)}, fetch stats)
+    """
+    targets = [(app['app_id'], app['country']) for app in apps]
+    seen = {target: seen_before(marks.get(mark_key(app))) for target, app in zip(targets, apps)}
+    start = time.perf_counter()
+    results, stats = asyncio.run(fetch_feeds_async(targets, max_pages, url, window=1, seen=seen, cache=cache))
+    print_fetch_summary(results, stats, time.perf_counter() - start)
+    return {mark_key(app): (results[target][0], results[target][2]) for target, app in zip(targets, apps)}, stats
+
+
+def main():
+    """Scrape the delta since the stored marks and advance them"""
+    print("🚀 Incremental iOS Review Scraper")
+    print("=" * 60)
+
+    args = sys.argv[1:]
+    marks = {} if '--full' in args else load_marks()
+
+    if '--seed' in args:
+        index = args.index('--seed')
+        if index + 1 >= len(args) or not os.path.exists(args[index + 1]):
+            print("❌ Usage: python ios_incremental_scraper.py --seed <existing.csv>")
+            sys.exit(1)
+        marks = seed_marks(pd.read_csv(args[index + 1]))
+        save_marks(marks)
+        for key, mark in marks.items():
+            print(f"   📌 {mark['app_name']} ({key}): {mark['date']}")
+        print(f"\n✅ Seeded {len(marks)} marks in {MARKS_FILE}")
+        return
+
+    for app in APPS:
+        mark = marks.get(mark_key(app))
+        print(f"   📌 {app['app_name']}: {mark['date'] if mark else 'no mark (full scrape)'}")
+
+    print("\n🍎 Scraping new iOS reviews...")
+    delta, stats = scrape_delta(APPS, marks)
+
+    all_new_reviews = []
+    for app in APPS:
+        entries, error = delta[mark_key(app)]
+        reviews = parse_review_entries(entries, app['app_name'])
+        all_new_reviews.extend(reviews)
+        print(f"   {'⚠️ ' if error else '✅'} {app['app_name']}: {len(reviews)} new reviews")
+
+    if all_new_reviews:
+        new_df = pd.DataFrame(all_new_reviews)
+        if 'date_parsed' in new_df.columns:
+            new_df = new_df.drop('date_parsed', axis=1)
+        filename = f"ios_reviews_delta_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        new_df.to_csv(filename, index=False)
+        print(f"\n💾 Saved {len(new_df)} new iOS reviews to: {filename}")
+        print(f"🔄 Next step: python3 merge_ios_data.py --append <existing.csv> {filename}")
+    else:
+        print("\n✅ No new iOS reviews since the last run")
+
+    # Advance marks only for feeds read completely up to the mark
+    for app in APPS:
+        entries, error = delta[mark_key(app)]
+        if error == MARK_NOT_REACHED:
+            oldest = min(filter(None, map(entry_time, entries)), default=None)
+            print(f"⚠️  {app['app_name']}: mark {marks[mark_key(app)]['date']} not reached; reviews between it and "
+                  f"{oldest or 'the oldest fetched review'} may be missing. Mark kept (--full resets it)")
+            continue
+        if error:
+            print(f"⚠️  {app['app_name']}: mark not advanced ({error})")
+            continue
+        marks[mark_key(app)] = advance_mark(marks.get(mark_key(app)), entries, app)
+    save_marks(marks)
+    print(f"📌 Marks saved to {MARKS_FILE} ({stats['requests']} requests)")
+
+
+if __name__ == "__main__":
+    main()
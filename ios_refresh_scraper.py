@@ -4,13 +4,51 @@ iOS App Store Review Scraper
 Refreshes iOS review data with proper date extraction
 """
 
-import requests
 import json
 import pandas as pd
 from datetime import datetime
-import time
 import sys
 
+from app_registry import store_apps
+from itunes_rss import fetch_feeds
+
+def parse_review_entries(entries, app_name):
+    """Review dictionaries from iTunes RSS review entries"""
+    reviews = []
+    
+    for entry in entries:
+        try:
+            # Extract review data
+            review = {
+                'review_id': entry.get('id', {}).get('label', ''),
+                'title': entry.get('title', {}).get('label', ''),
+                'text': entry.get('content', {}).get('label', ''),
+                'rating': int(entry.get('im:rating', {}).get('label', 0)),
+                'author': entry.get('author', {}).get('name', {}).get('label', ''),
+                'app_version': entry.get('im:version', {}).get('label', ''),
+                'date': entry.get('updated', {}).get('label', ''),
+                'app_name': app_name,
+                'platform': 'iOS',
+                'extraction_method': 'itunes_rss_refresh',
+                'extraction_date': datetime.now().strftime('%Y-%m-%d')
+            }
+            
+            # Clean and validate date
+            if review['date']:
+                try:
+                    # iTunes dates are in ISO format: 2025-05-20T10:30:00-07:00
+                    review['date'] = pd.to_datetime(review['date']).strftime('%Y-%m-%d %H:%M:%S')
+                except:
+                    review['date'] = ''
+            
+            reviews.append(review)
+            
+        except Exception as e:
+            print(f"    ⚠️ Error parsing review: {e}")
+            continue
+    
+    return reviews
+
 def scrape_ios_reviews(app_id, app_name, country='ca', pages=10):
     """
     Scrape iOS App Store reviews using iTunes RSS API
@@ -25,65 +63,10 @@ def scrape_ios_reviews(app_id, app_name, country='ca', pages=10):
         List of review dictionaries
     """
     
-    reviews = []
-    base_url = f"https://itunes.apple.com/{country}/rss/customerreviews/page={{page}}/id={app_id}/sortby=mostrecent/json"
-    
     print(f"🍎 Scraping {app_name} iOS reviews...")
     
-    for page in range(1, pages + 1):
-        try:
-            url = base_url.format(page=page)
-            print(f"  📄 Page {page}/{pages}")
-            
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract reviews from RSS feed
-            if 'feed' in data and 'entry' in data['feed']:
-                entries = data['feed']['entry']
-                
-                # Skip first entry (app info)
-                review_entries = entries[1:] if len(entries) > 1 else []
-                
-                for entry in review_entries:
-                    try:
-                        # Extract review data
-                        review = {
-                            'review_id': entry.get('id', {}).get('label', ''),
-                            'title': entry.get('title', {}).get('label', ''),
-                            'text': entry.get('content', {}).get('label', ''),
-                            'rating': int(entry.get('im:rating', {}).get('label', 0)),
-                            'author': entry.get('author', {}).get('name', {}).get('label', ''),
-                            'app_version': entry.get('im:version', {}).get('label', ''),
-                            'date': entry.get('updated', {}).get('label', ''),
-                            'app_name': app_name,
-                            'platform': 'iOS',
-                            'extraction_method': 'itunes_rss_refresh',
-                            'extraction_date': datetime.now().strftime('%Y-%m-%d')
-                        }
-                        
-                        # Clean and validate date
-                        if review['date']:
-                            try:
-                                # iTunes dates are in ISO format: 2025-05-20T10:30:00-07:00
-                                review['date'] = pd.to_datetime(review['date']).strftime('%Y-%m-%d %H:%M:%S')
-                            except:
-                                review['date'] = ''
-                        
-                        reviews.append(review)
-                        
-                    except Exception as e:
-                        print(f"    ⚠️ Error parsing review: {e}")
-                        continue
-            
-            # Rate limiting
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"    ❌ Error fetching page {page}: {e}")
-            continue
+    entries = fetch_feeds([(app_id, country)], max_pages=pages)[(app_id, country)]
+    reviews = parse_review_entries(entries, app_name)
     
     print(f"  ✅ Scraped {len(reviews)} iOS reviews for {app_name}")
     return reviews
@@ -94,31 +77,21 @@ def main():
     print("🚀 iOS App Store Review Refresh")
     print("=" * 50)
     
-    # App configurations
-    apps = [
-        {
-            'app_id': '850549838',
-            'app_name': 'Bell',
-            'description': 'MyBell'
-        },
-        {
-            'app_id': '337618972', 
-            'app_name': 'Rogers',
-            'description': 'MyRogers - Manage your account'
-        }
-    ]
+    # App ids and countries come from the app registry
+    apps = store_apps('itunes')
     
     all_reviews = []
     
+    # Fetch every app's feed concurrently
+    print("🍎 Scraping iOS reviews...")
+    feeds = fetch_feeds([(app['app_id'], app['country']) for app in apps], max_pages=20)
+    print()
+    
     for app in apps:
-        reviews = scrape_ios_reviews(
-            app_id=app['app_id'],
-            app_name=app['app_name'],
-            pages=20  # Increased pages for better coverage
-        )
+        reviews = parse_review_entries(feeds[(app['app_id'], app['country'])], app['app_name'])
         all_reviews.extend(reviews)
         
-        print(f"  📱 {app['description']}: {len(reviews)} reviews")
+        print(f"  📱 {app['app_name']}: {len(reviews)} reviews")
         print()
     
     if all_reviews:
@@ -4,20 +4,66 @@ iOS App Store Review Re-scraper with Comparison
 Scrapes fresh iOS reviews and compares with existing data
 """
 
-import requests
 import json
 import pandas as pd
 from datetime import datetime
-import time
 import sys
 import hashlib
 
+from app_registry import store_apps
+from itunes_rss import fetch_feeds
+from near_duplicates import duplicates_of
+
 def generate_review_id(review_data):
     """Generate consistent review ID for matching"""
     # Create unique ID from author + date + rating
     unique_string = f"{review_data.get('author', '')}{review_data.get('date', '')}{review_data.get('rating', '')}"
     return hashlib.md5(unique_string.encode()).hexdigest()
 
+def parse_review_entries(entries, app_name):
+    """Review dictionaries from iTunes RSS review entries"""
+    reviews = []
+    
+    for entry in entries:
+        try:
+            # Extract review data
+            review = {
+                'title': entry.get('title', {}).get('label', ''),
+                'text': entry.get('content', {}).get('label', ''),
+                'rating': int(entry.get('im:rating', {}).get('label', 0)),
+                'author': entry.get('author', {}).get('name', {}).get('label', ''),
+                'app_version': entry.get('im:version', {}).get('label', ''),
+                'date': entry.get('updated', {}).get('label', ''),
+                'app_name': app_name,
+                'platform': 'iOS',
+                'extraction_method': 'itunes_rss',
+                'extraction_date': datetime.now().strftime('%Y-%m-%d'),
+                'vote_sum': entry.get('im:voteSum', {}).get('label', '0'),
+                'vote_count': entry.get('im:voteCount', {}).get('label', '0'),
+                'store_review_id': entry.get('id', {}).get('label', '')
+            }
+            
+            # Parse and format date
+            if review['date']:
+                try:
+                    parsed_date = pd.to_datetime(review['date'])
+                    review['date'] = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
+                    review['date_parsed'] = parsed_date
+                except:
+                    review['date'] = ''
+                    review['date_parsed'] = None
+            
+            # Generate review ID
+            review['review_id'] = generate_review_id(review)
+            
+            reviews.append(review)
+            
+        except Exception as e:
+            print(f"    ⚠️  Error parsing review: {e}")
+            continue
+    
+    return reviews
+
 def scrape_ios_reviews(app_id, app_name, country='ca', pages=50):
     """
     Scrape iOS App Store reviews using iTunes RSS API
@@ -26,97 +72,17 @@ def scrape_ios_reviews(app_id, app_name, country='ca', pages=50):
         app_id: iTunes app ID
         app_name: Name for identification
         country: Country code
-        pages: Number of pages to scrape (50 pages = ~500 reviews)
+        pages: Maximum pages to scrape (the feed ends after ~10 pages)
     
     Returns:
         List of review dictionaries
     """
     
-    reviews = []
-    base_url = f"https://itunes.apple.com/{country}/rss/customerreviews/page={{page}}/id={app_id}/sortby=mostrecent/json"
-    
     print(f"\n🍎 Scraping {app_name} iOS reviews...")
     print(f"   App ID: {app_id}")
     
-    consecutive_empty = 0
-    
-    for page in range(1, pages + 1):
-        try:
-            url = base_url.format(page=page)
-            
-            # Show progress every 5 pages
-            if page % 5 == 0:
-                print(f"   📄 Progress: {page}/{pages} pages ({len(reviews)} reviews collected)")
-            
-            response = requests.get(url, timeout=30, headers={
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            })
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Extract reviews from RSS feed
-            if 'feed' in data and 'entry' in data['feed']:
-                entries = data['feed']['entry']
-                
-                # Skip first entry (app info) on first page
-                review_entries = entries[1:] if page == 1 and len(entries) > 1 else entries
-                
-                if not review_entries:
-                    consecutive_empty += 1
-                    if consecutive_empty >= 3:
-                        print(f"   ⚠️  No more reviews found after page {page}")
-                        break
-                else:
-                    consecutive_empty = 0
-                
-                for entry in review_entries:
-                    try:
-                        # Extract review data
-                        review = {
-                            'title': entry.get('title', {}).get('label', ''),
-                            'text': entry.get('content', {}).get('label', ''),
-                            'rating': int(entry.get('im:rating', {}).get('label', 0)),
-                            'author': entry.get('author', {}).get('name', {}).get('label', ''),
-                            'app_version': entry.get('im:version', {}).get('label', ''),
-                            'date': entry.get('updated', {}).get('label', ''),
-                            'app_name': app_name,
-                            'platform': 'iOS',
-                            'extraction_method': 'itunes_rss',
-                            'extraction_date': datetime.now().strftime('%Y-%m-%d'),
-                            'vote_sum': entry.get('im:voteSum', {}).get('label', '0'),
-                            'vote_count': entry.get('im:voteCount', {}).get('label', '0')
-                        }
-                        
-                        # Parse and format date
-                        if review['date']:
-                            try:
-                                parsed_date = pd.to_datetime(review['date'])
-                                review['date'] = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
-                                review['date_parsed'] = parsed_date
-                            except:
-                                review['date'] = ''
-                                review['date_parsed'] = None
-                        
-                        # Generate review ID
-                        review['review_id'] = generate_review_id(review)
-                        
-                        reviews.append(review)
-                        
-                    except Exception as e:
-                        print(f"    ⚠️  Error parsing review: {e}")
-                        continue
-            
-            # Rate limiting
-            time.sleep(0.5)
-            
-        except requests.exceptions.RequestException as e:
-            print(f"    ❌ Network error on page {page}: {e}")
-            time.sleep(2)
-            continue
-        except Exception as e:
-            print(f"    ❌ Error fetching page {page}: {e}")
-            continue
+    entries = fetch_feeds([(app_id, country)], max_pages=pages)[(app_id, country)]
+    reviews = parse_review_entries(entries, app_name)
     
     print(f"   ✅ Scraped {len(reviews)} iOS reviews for {app_name}")
     return reviews
@@ -181,16 +147,8 @@ def compare_reviews(new_reviews, existing_ios_df, app_name):
     print("\n   🔄 Checking for overlapping reviews...")
     matches = 0
     if len(existing_app_df) > 0 and len(new_app_df) > 0:
-        for _, new_review in new_app_df.iterrows():
-            # Check for exact author match with similar text
-            author_matches = existing_app_df[existing_app_df['author'] == new_review['author']]
-            if len(author_matches) > 0:
-                for _, existing in author_matches.iterrows():
-                    if pd.notna(new_review['text']) and pd.notna(existing['text']):
-                        # Simple text similarity check
-                        if str(new_review['text'])[:50] == str(existing['text'])[:50]:
-                            matches += 1
-                            break
+        # Same author with a near-duplicate text (near_duplicates.py)
+        matches = int(duplicates_of(new_app_df, existing_app_df, same=('author',)).sum())
     
     print(f"   Found {matches} potential matching reviews")
     
@@ -211,30 +169,19 @@ def main():
         print(f"❌ Error loading existing data: {e}")
         sys.exit(1)
     
-    # App configurations
-    apps = [
-        {
-            'app_id': '850549838',
-            'app_name': 'Bell',
-            'description': 'MyBell'
-        },
-        {
-            'app_id': '337618972', 
-            'app_name': 'Rogers',
-            'description': 'MyRogers - Manage your account'
-        }
-    ]
+    # App ids and countries come from the app registry
+    apps = store_apps('itunes')
     
     all_new_reviews = []
     comparison_results = {}
     
+    # Scrape new reviews for every app concurrently (up to 50 pages; the feed ends earlier)
+    print("\n🍎 Scraping iOS reviews...")
+    feeds = fetch_feeds([(app['app_id'], app['country']) for app in apps], max_pages=50)
+    
     for app in apps:
-        # Scrape new reviews
-        new_reviews = scrape_ios_reviews(
-            app_id=app['app_id'],
-            app_name=app['app_name'],
-            pages=50  # Scrape up to 50 pages for comprehensive coverage
-        )
+        new_reviews = parse_review_entries(feeds[(app['app_id'], app['country'])], app['app_name'])
+        print(f"   ✅ Scraped {len(new_reviews)} iOS reviews for {app['app_name']}")
         
         all_new_reviews.extend(new_reviews)
         
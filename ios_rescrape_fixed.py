@@ -2,21 +2,69 @@
 """
 iOS App Store Review Re-scraper (Fixed)
 Handles timezone issues and API pagination limits
+
+Usage:
+    python ios_rescrape_fixed.py [existing_reviews.csv]
 """
 
-import requests
 import json
 import pandas as pd
 from datetime import datetime
-import time
 import sys
 import hashlib
 
+from app_registry import store_apps
+from itunes_rss import fetch_feeds
+
 def generate_review_id(review_data):
     """Generate consistent review ID for matching"""
     unique_string = f"{review_data.get('author', '')}{review_data.get('date', '')}{review_data.get('rating', '')}"
     return hashlib.md5(unique_string.encode()).hexdigest()
 
+def parse_review_entries(entries, app_name):
+    """Review dictionaries from iTunes RSS review entries"""
+    reviews = []
+    
+    for entry in entries:
+        try:
+            # Extract review data
+            review = {
+                'title': entry.get('title', {}).get('label', ''),
+                'text': entry.get('content', {}).get('label', ''),
+                'rating': int(entry.get('im:rating', {}).get('label', 0)),
+                'author': entry.get('author', {}).get('name', {}).get('label', ''),
+                'app_version': entry.get('im:version', {}).get('label', ''),
+                'date': entry.get('updated', {}).get('label', ''),
+                'app_name': app_name,
+                'platform': 'iOS',
+                'extraction_method': 'itunes_rss',
+                'extraction_date': datetime.now().strftime('%Y-%m-%d'),
+                'vote_sum': entry.get('im:voteSum', {}).get('label', '0'),
+                'vote_count': entry.get('im:voteCount', {}).get('label', '0'),
+                'store_review_id': entry.get('id', {}).get('label', '')
+            }
+            
+            # Parse and format date
+            if review['date']:
+                try:
+                    # Parse the date and convert to timezone-naive
+                    parsed_date = pd.to_datetime(review['date']).tz_localize(None)
+                    review['date'] = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
+                    review['date_parsed'] = parsed_date
+                except:
+                    review['date'] = ''
+                    review['date_parsed'] = None
+            
+            # Generate review ID
+            review['review_id'] = generate_review_id(review)
+            
+            reviews.append(review)
+            
+        except Exception as e:
+            continue
+    
+    return reviews
+
 def scrape_ios_reviews(app_id, app_name, country='ca', max_pages=10):
     """
     Scrape iOS App Store reviews using iTunes RSS API
@@ -32,91 +80,13 @@ def scrape_ios_reviews(app_id, app_name, country='ca', max_pages=10):
         List of review dictionaries
     """
     
-    reviews = []
-    base_url = f"https://itunes.apple.com/{country}/rss/customerreviews/page={{page}}/id={app_id}/sortby=mostrecent/json"
-    
     print(f"\n🍎 Scraping {app_name} iOS reviews...")
     print(f"   App ID: {app_id}")
     
-    consecutive_errors = 0
-    
-    for page in range(1, max_pages + 1):
-        try:
-            url = base_url.format(page=page)
-            print(f"   📄 Page {page}/{max_pages}", end='\r')
-            
-            response = requests.get(url, timeout=30, headers={
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-            })
-            
-            if response.status_code != 200:
-                consecutive_errors += 1
-                if consecutive_errors >= 3:
-                    print(f"\n   ℹ️  Reached API limit after {page-1} pages")
-                    break
-                continue
-            
-            consecutive_errors = 0
-            data = response.json()
-            
-            # Extract reviews from RSS feed
-            if 'feed' in data and 'entry' in data['feed']:
-                entries = data['feed']['entry']
-                
-                # Skip first entry (app info) on first page
-                review_entries = entries[1:] if page == 1 and len(entries) > 1 else entries
-                
-                if not review_entries:
-                    print(f"\n   ℹ️  No more reviews after page {page-1}")
-                    break
-                
-                for entry in review_entries:
-                    try:
-                        # Extract review data
-                        review = {
-                            'title': entry.get('title', {}).get('label', ''),
-                            'text': entry.get('content', {}).get('label', ''),
-                            'rating': int(entry.get('im:rating', {}).get('label', 0)),
-                            'author': entry.get('author', {}).get('name', {}).get('label', ''),
-                            'app_version': entry.get('im:version', {}).get('label', ''),
-                            'date': entry.get('updated', {}).get('label', ''),
-                            'app_name': app_name,
-                            'platform': 'iOS',
-                            'extraction_method': 'itunes_rss',
-                            'extraction_date': datetime.now().strftime('%Y-%m-%d'),
-                            'vote_sum': entry.get('im:voteSum', {}).get('label', '0'),
-                            'vote_count': entry.get('im:voteCount', {}).get('label', '0')
-                        }
-                        
-                        # Parse and format date
-                        if review['date']:
-                            try:
-                                # Parse the date and convert to timezone-naive
-                                parsed_date = pd.to_datetime(review['date']).tz_localize(None)
-                                review['date'] = parsed_date.strftime('%Y-%m-%d %H:%M:%S')
-                                review['date_parsed'] = parsed_date
-                            except:
-                                review['date'] = ''
-                                review['date_parsed'] = None
-                        
-                        # Generate review ID
-                        review['review_id'] = generate_review_id(review)
-                        
-                        reviews.append(review)
-                        
-                    except Exception as e:
-                        continue
-            
-            # Rate limiting
-            time.sleep(0.5)
-            
-        except Exception as e:
-            consecutive_errors += 1
-            if consecutive_errors >= 3:
-                print(f"\n   ℹ️  Stopping after {page-1} pages due to errors")
-                break
+    entries = fetch_feeds([(app_id, country)], max_pages=max_pages)[(app_id, country)]
+    reviews = parse_review_entries(entries, app_name)
     
-    print(f"\n   ✅ Scraped {len(reviews)} iOS reviews for {app_name}")
+    print(f"   ✅ Scraped {len(reviews)} iOS reviews for {app_name}")
     return reviews
 
 def load_existing_data(filepath):
@@ -185,7 +155,7 @@ def main():
     print("=" * 60)
     
     # Load existing data
-    existing_file = '/Users/amirshayegh/Developer/temp/review_analysis/telecom_app_reviews_analyzed.csv'
+    existing_file = sys.argv[1] if len(sys.argv) > 1 else '/Users/amirshayegh/Developer/temp/review_analysis/telecom_app_reviews_analyzed.csv'
     
     try:
         full_df, existing_ios_df = load_existing_data(existing_file)
@@ -193,30 +163,19 @@ def main():
         print(f"❌ Error loading existing data: {e}")
         sys.exit(1)
     
-    # App configurations
-    apps = [
-        {
-            'app_id': '850549838',
-            'app_name': 'Bell',
-            'description': 'MyBell'
-        },
-        {
-            'app_id': '337618972', 
-            'app_name': 'Rogers',
-            'description': 'MyRogers'
-        }
-    ]
+    # App ids and countries come from the app registry
+    apps = store_apps('itunes')
     
     all_new_reviews = []
     comparison_results = {}
     
+    # Scrape new reviews for every app concurrently (iTunes RSS API typically limits to ~10 pages)
+    print("\n🍎 Scraping iOS reviews...")
+    feeds = fetch_feeds([(app['app_id'], app['country']) for app in apps], max_pages=15)
+    
     for app in apps:
-        # Scrape new reviews (iTunes RSS API typically limits to ~10 pages)
-        new_reviews = scrape_ios_reviews(
-            app_id=app['app_id'],
-            app_name=app['app_name'],
-            max_pages=15  # Try up to 15 but expect ~10 to work
-        )
+        new_reviews = parse_review_entries(feeds[(app['app_id'], app['country'])], app['app_name'])
+        print(f"   ✅ Scraped {len(new_reviews)} iOS reviews for {app['app_name']}")
         
         all_new_reviews.extend(new_reviews)
         
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+iTunes RSS Review Fetcher
+Fetches customer review feed pages for many apps and countries concurrently
+over one pooled requests.Session, replacing the one-page-at-a-time
+requests.get loops with fixed sleeps in the iOS scrapers. Feeds are driven by
+asyncio; the blocking requests run in a few worker threads per host.
+
+    - connections are reused per host (urllib3 keep-alive pool)
+    - in-flight requests are capped per host instead of sleeping between pages
+    - pages of one feed are fetched a few at a time; paging stops at the first
+      empty page (or the 4xx iTunes returns past its last page)
+    - transient errors (network, 5xx) are retried with backoff
+    - responses go through the on-disk cache in http_cache.py (TTL,
+      conditional requests, offline replay; HTTP_CACHE=off disables it)
+
+Usage:
+    from itunes_rss import fetch_feeds
+    feeds = fetch_feeds([('850549838', 'ca'), ('337618972', 'ca')], max_pages=10)
+    entries = feeds[('850549838', 'ca')]      # review entries, newest first
+
+    python itunes_rss.py <app_id> [country] [max_pages]
+"""
+
+import asyncio
+import collections
+import functools
+import json
+import sys
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from http_cache import CacheMiss, default_cache
+
+FEED_URL = 'https://itunes.apple.com/{country}/rss/customerreviews/page={page}/id={app_id}/sortby=mostrecent/json'
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+
+# iTunes serves at most 10 pages of 50 reviews per feed
+MAX_PAGES = 10
+PER_HOST = 4
+PAGE_WINDOW = 3
+TIMEOUT = 30
+RETRIES = 3
+MAX_REDIRECTS = 5
+
+# fetch_feed error when the page limit came before any already-seen review
+MARK_NOT_REACHED = 'mark not reached within the page limit'
+
+Response = collections.namedtuple('Response', ['status', 'headers', 'body', 'url'])
+
+
+class HTTPSession:
+    """
+    Async front end to a pooled requests.Session
+
+    Requests run in worker threads, one pool of per_host threads per host, so
+    at most per_host requests are in flight per host; urllib3 keeps their
+    connections alive and reuses them. With a cache (http_cache.ResponseCache)
+    fresh responses are served from disk and stale ones revalidated.
+    """
+
+    def __init__(self, per_host=PER_HOST, timeout=TIMEOUT, headers=None, cache=None):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cache = cache
+        self.requests_sent = 0
+        self.session = requests.Session()
+        self.session.max_redirects = MAX_REDIRECTS
+        self.session.headers.update({'User-Agent': USER_AGENT, 'Accept': 'application/json', **(headers or {})})
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=per_host, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._executors = {}
+
+    @property
+    def connections_opened(self):
+        """Connections opened so far, over all hosts"""
+        pools = self.session.get_adapter('https://').poolmanager.pools
+        return sum(pools[key].num_connections for key in pools.keys())
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        """Stop the worker threads and close all connections"""
+        for executor in self._executors.values():
+            executor.shutdown(wait=True)
+        self._executors.clear()
+        self.session.close()
+
+    async def get(self, url, headers=None):
+        """GET a URL through the cache, following redirects; returns a Response"""
+        cached = self.cache.lookup(url) if self.cache else None
+        if cached and (cached[2] or self.cache.offline):
+            self.cache.hits += 1
+            return Response(cached[0]['status'], cached[0]['headers'], cached[1], url)
+        if self.cache and self.cache.offline:
+            raise CacheMiss(f"Not in the response cache (offline): {url}")
+
+        conditional = self.cache.conditional_headers(cached[0]) if cached else {}
+        response = await self._get(url, {**(headers or {}), **conditional})
+        if self.cache:
+            if response.status == 304 and cached:
+                self.cache.touch(url, cached[0], response.headers)
+                return Response(cached[0]['status'], cached[0]['headers'], cached[1], url)
+            self.cache.store(url, response.status, response.headers, response.body)
+        return response
+
+    async def _get(self, url, headers):
+        host = urllib.parse.urlsplit(url).netloc
+        if host not in self._executors:
+            self._executors[host] = ThreadPoolExecutor(max_workers=self.per_host, thread_name_prefix=host)
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            self._executors[host], functools.partial(self.session.get, url, headers=headers, timeout=self.timeout))
+        self.requests_sent += 1 + len(response.history)
+        # requests decodes gzip/deflate bodies; header names lower-cased as the cache stores them
+        return Response(response.status_code, {name.lower(): value for name, value in response.headers.items()},
+                        response.content, response.url)
+
+
+def review_entries(data):
+    """Review entries of one feed page (the app's own info entry has no rating)"""
+    entries = data.get('feed', {}).get('entry', [])
+    if isinstance(entries, dict):
+        entries = [entries]
+    return [entry for entry in entries if 'im:rating' in entry]
+
+
+async def fetch_page(session, url):
+    """
+    Review entries of one page
+
+    Returns:
+        (entries, error); entries is [] past the last page, None if the page
+        couldn't be fetched after RETRIES attempts
+    """
+    error = None
+    for attempt in range(RETRIES):
+        if attempt:
+            await asyncio.sleep(2 ** (attempt - 1))
+        try:
+            response = await session.get(url)
+        except CacheMiss as e:
+            return None, str(e)
+        except (requests.RequestException, OSError, ValueError) as e:
+            error = str(e) or type(e).__name__
+            continue
+        if response.status >= 500 or response.status == 429:
+            error = f"HTTP {response.status}"
+            continue
+        if response.status >= 400:
+            # iTunes answers pages past its limit with 400
+            return [], None
+        try:
+            return review_entries(json.loads(response.body)), None
+        except (ValueError, AttributeError) as e:
+            return None, f"Invalid feed JSON: {e}"
+    return None, error
+
+
+async def fetch_feed(session, app_id, country, max_pages=MAX_PAGES, url=FEED_URL, window=PAGE_WINDOW, seen=None):
+    """
+    Review entries of one app's feed, newest first
+
+    Pages are requested window at a time; the first empty or failed page
+    ends the feed. With seen (entry -> bool, true for reviews already
+    ingested) seen entries are dropped and paging stops after the first page
+    holding one: the feed is newest first, so everything after it is older.
+    If the page limit (max_pages, or the MAX_PAGES iTunes serves) comes first,
+    the error is MARK_NOT_REACHED: reviews between the last page and the seen
+    ones may be missing.
+
+    Returns:
+        (entries, pages fetched, error or None)
+    """
+    entries = []
+    pages = 0
+    for first in range(1, max_pages + 1, window):
+        batch = range(first, min(first + window, max_pages + 1))
+        results = await asyncio.gather(*(fetch_page(session, url.format(app_id=app_id, country=country, page=page))
+                                         for page in batch))
+        for page, (page_entries, error) in zip(batch, results):
+            pages += 1
+            if error:
+                return entries, pages, error
+            if not page_entries:
+                # Past the last page iTunes serves, older reviews exist but can't be paged to
+                reached_limit = seen is not None and page > MAX_PAGES
+                return entries, pages, MARK_NOT_REACHED if reached_limit else None
+            if seen is None:
+                entries.extend(page_entries)
+                continue
+            unseen = [entry for entry in page_entries if not seen(entry)]
+            entries.extend(unseen)
+            if len(unseen) < len(page_entries):
+                return entries, pages, None
+    return entries, pages, None if seen is None else MARK_NOT_REACHED
+
+
+def session_cache(cache):
+    """The cache a session uses: True for the environment's default, False/None for none"""
+    return default_cache() if cache is True else (cache or None)
+
+
+async def fetch_feeds_async(targets, max_pages=MAX_PAGES, url=FEED_URL, per_host=PER_HOST, window=PAGE_WINDOW,
+                            seen=None, cache=True):
+    """
+    Async fetch_feeds (see there)
+
+    Returns:
+        ({target: (entries, pages fetched, error or None)},
+         {'connections', 'requests', 'cache_hits', 'revalidated'})
+    """
+    seen = seen or {}
+    cache = session_cache(cache)
+    async with HTTPSession(per_host=per_host, cache=cache) as session:
+        results = await asyncio.gather(*(fetch_feed(session, app_id, country, max_pages, url, window,
+                                                    seen.get((app_id, country)))
+                                         for app_id, country in targets))
+        stats = {'connections': session.connections_opened, 'requests': session.requests_sent,
+                 'cache_hits': cache.hits if cache else 0, 'revalidated': cache.revalidated if cache else 0}
+    return dict(zip(targets, results)), stats
+
+
+def print_fetch_summary(results, stats, seconds):
+    """Reviews, pages and errors per feed plus request totals"""
+    for (app_id, country), (entries, pages, error) in results.items():
+        if error:
+            print(f"   ⚠️  {app_id}/{country}: stopped at page {pages} ({error})")
+        print(f"   📄 {app_id}/{country}: {len(entries)} reviews from {pages} pages")
+    print(f"   ⏱️  {stats['requests']} requests over {stats['connections']} connections in {seconds:.1f}s")
+    if stats.get('cache_hits') or stats.get('revalidated'):
+        print(f"   💾 {stats['cache_hits']} pages from cache, {stats['revalidated']} revalidated (304)")
+
+
+def fetch_feeds(targets, max_pages=MAX_PAGES, url=FEED_URL, per_host=PER_HOST, window=PAGE_WINDOW, verbose=True,
+                cache=True):
+    """
+    Fetch the review feeds of several apps/countries concurrently
+
+    Args:
+        targets: List of (app_id, country) pairs
+        max_pages: Pages to request per feed at most
+        url: Feed URL template with {app_id}, {country} and {page}
+        per_host: Concurrent requests per host
+        window: Pages of one feed requested at a time
+        cache: True for the HTTP_CACHE default, False for none, or a ResponseCache
+
+    Returns:
+        {(app_id, country): review entries}
+    """
+    targets = [(str(app_id), country) for app_id, country in targets]
+    start = time.perf_counter()
+    results, stats = asyncio.run(fetch_feeds_async(targets, max_pages, url, per_host, window, cache=cache))
+
+    if verbose:
+        print_fetch_summary(results, stats, time.perf_counter() - start)
+
+    return {target: entries for target, (entries, _, _) in results.items()}
+
+
+def get_json(url, cache=True):
+    """GET one JSON document (through the cache); raises OSError/ValueError"""
+    async def get():
+        async with HTTPSession(cache=session_cache(cache)) as session:
+            return await session.get(url)
+
+    response = asyncio.run(get())
+    if response.status >= 400:
+        raise ConnectionError(f"HTTP {response.status}: {url}")
+    return json.loads(response.body)
+
+
+def main():
+    """Fetch one app's feed and print a summary"""
+    if len(sys.argv) < 2:
+        print("Usage: python itunes_rss.py <app_id> [country] [max_pages]")
+        sys.exit(1)
+
+    app_id = sys.argv[1]
+    country = sys.argv[2] if len(sys.argv) > 2 else 'ca'
+    max_pages = int(sys.argv[3]) if len(sys.argv) > 3 else MAX_PAGES
+
+    print(f"🍎 Fetching iTunes reviews for {app_id} ({country})...")
+    entries = fetch_feeds([(app_id, country)], max_pages)[(app_id, country)]
+    if not entries:
+        print("❌ No reviews fetched")
+        sys.exit(1)
+    print(f"✅ {len(entries)} reviews, newest {entries[0].get('updated', {}).get('label', '?')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Markdown Report Renderer
+Renders the Markdown reports (EXECUTIVE_SUMMARY.md, RESEARCH_METHODOLOGY.md, ...)
+to HTML fragments in html_dashboard/reports/ at build time, so the dashboard's
+report viewer injects ready-made HTML instead of loading marked.js and parsing
+Markdown in the browser.
+
+Covers the Markdown the reports use (GFM flavour, line breaks kept): headings
+with ids, paragraphs, nested lists, tables, fenced code, blockquotes, rules,
+links and emphasis. Rendered output is cached in .build/markdown/ keyed by the
+source hash, so unchanged reports are never re-rendered.
+
+Usage:
+    python markdown_reports.py            # all reports in MARKDOWN_REPORTS
+    python markdown_reports.py <file.md>  # specific files
+"""
+
+import html
+import os
+import re
+import sys
+
+from build_graph import file_digest, value_digest
+
+OUTPUT_DIR = 'html_dashboard/reports'
+CACHE_DIR = '.build/markdown'
+
+# Bump when the renderer's output changes so cached fragments are discarded
+RENDERER_VERSION = 1
+
+MARKDOWN_REPORTS = [
+    'CX_UX_ASSESSMENT_REPORT.md',
+    'DATA_ACCURACY_REPORT.md',
+    'DATA_ACCURACY_REPORT_ENHANCED_CATEGORY.md',
+    'DATA_METHODOLOGY_AND_DERIVATIONS.md',
+    'EXECUTIVE_SUMMARY.md',
+    'FILTERING_SUMMARY_REPORT.md',
+    'KEY_METRICS_QUICK_REFERENCE.md',
+    'RESEARCH_METHODOLOGY.md',
+    'ROGERS_CX_TRANSFORMATION_FINAL_REPORT.md'
+]
+
+# Block syntax
+HEADING = re.compile(r'^ {0,3}(#{1,6})\s+(.*?)(?:\s+#+)?\s*$')
+FENCE = re.compile(r'^ {0,3}(`{3,}|~{3,})\s*([\w+-]*)')
+RULE = re.compile(r'^ {0,3}([-*_])(?:\s*\1){2,}\s*$')
+QUOTE = re.compile(r'^ {0,3}> ?')
+LIST_ITEM = re.compile(r'^( *)([-*+]|\d{1,9}[.)])( +|$)(.*)$')
+TABLE_DELIMITER = re.compile(r'^\s*\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$')
+
+# Inline syntax (applied to escaped text)
+CODE_SPAN = re.compile(r'(`+)(.+?)\1', re.DOTALL)
+LINK = re.compile(r'\[([^\]]+)\]\(([^)\s]+)(?:\s+&quot;(.*?)&quot;)?\)')
+STRONG = re.compile(r'\*\*(?=\S)(.+?)(?<=\S)\*\*|__(?=\S)(.+?)(?<=\S)__')
+EMPHASIS = re.compile(r'(?<![\w*])\*(?=\S)(.+?)(?<=\S)\*(?![\w*])|(?<!\w)_(?=\S)(.+?)(?<=\S)_(?!\w)')
+STRIKE = re.compile(r'~~(?=\S)(.+?)(?<=\S)~~')
+SLUG_STRIP = re.compile(r'[^\w\- ]')
+
+
+def _escape(text):
+    return html.escape(text, quote=True)
+
+
+def render_inline(text):
+    """Inline Markdown (code, links, strong, emphasis, strikethrough) to HTML"""
+    # Code spans are set aside so emphasis can span them but never reach inside
+    codes = []
+
+    def hold(match):
+        codes.append(f"<code>{_escape(match.group(2).strip())}</code>")
+        return f"\x00{len(codes) - 1}\x00"
+
+    text = _render_spans(CODE_SPAN.sub(hold, text))
+    return re.sub(r'\x00(\d+)\x00', lambda m: codes[int(m.group(1))], text)
+
+
+def _render_spans(text):
+    text = _escape(text)
+    text = LINK.sub(lambda m: f'<a href="{m.group(2)}"'
+                              + (f' title="{m.group(3)}"' if m.group(3) else '')
+                              + f'>{m.group(1)}</a>', text)
+    text = STRONG.sub(lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
+    text = EMPHASIS.sub(lambda m: f"<em>{m.group(1) or m.group(2)}</em>", text)
+    return STRIKE.sub(r'<del>\1</del>', text)
+
+
+def _lines_inline(lines):
+    """Paragraph lines joined with line breaks (GFM 'breaks' mode)"""
+    return '<br>\n'.join(render_inline(line.strip()) for line in lines)
+
+
+def _slug(text, used):
+    """Heading id as marked generates it, de-duplicated within the document"""
+    slug = SLUG_STRIP.sub('', re.sub(r'<[^>]+>', '', text).lower()).strip().replace(' ', '-')
+    count = used.get(slug, 0)
+    used[slug] = count + 1
+    return f"{slug}-{count}" if count else slug
+
+
+def _indent(line):
+    return len(line) - len(line.lstrip(' '))
+
+
+def _starts_block(line):
+    """Whether a line interrupts a paragraph"""
+    return bool(HEADING.match(line) or FENCE.match(line) or RULE.match(line)
+                or QUOTE.match(line) or LIST_ITEM.match(line))
+
+
+def _split_row(line):
+    row = line.strip()
+    if row.startswith('|'):
+        row = row[1:]
+    if row.endswith('|') and not row.endswith('\\|'):
+        row = row[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in re.split(r'(?<!\\)\|', row)]
+
+
+def _render_table(lines):
+    header = _split_row(lines[0])
+    aligns = []
+    for cell in _split_row(lines[1]):
+        left, right = cell.startswith(':'), cell.endswith(':')
+        aligns.append('center' if left and right else 'right' if right else 'left' if left else None)
+
+    def cells(row, tag):
+        row = (row + [''] * len(header))[:len(header)]
+        return ''.join(f'<{tag}' + (f' align="{align}"' if align else '') + f'>{render_inline(cell)}</{tag}>'
+                       for cell, align in zip(row, aligns + [None] * len(header)))
+
+    body = ''.join(f"<tr>{cells(_split_row(line), 'td')}</tr>\n" for line in lines[2:])
+    return (f"<table>\n<thead>\n<tr>{cells(header, 'th')}</tr>\n</thead>\n"
+            + (f"<tbody>\n{body}</tbody>\n" if body else '') + "</table>")
+
+
+def _collect_list(lines, start):
+    """(end index, [(marker, item lines)], loose) for the list starting at lines[start]"""
+    base = _indent(lines[start])
+    ordered = LIST_ITEM.match(lines[start]).group(2)[-1] in '.)'
+    items = []
+    loose = False
+    i = start
+
+    while i < len(lines):
+        line = lines[i]
+        match = LIST_ITEM.match(line)
+        if match and _indent(line) <= base + 3 and (match.group(2)[-1] in '.)') == ordered:
+            content_indent = len(match.group(1)) + len(match.group(2)) + max(1, min(len(match.group(3)), 4))
+            items.append((match.group(2), content_indent, [match.group(4)]))
+        elif not line.strip():
+            following = next((l for l in lines[i + 1:] if l.strip()), None)
+            if following is None or (_indent(following) <= base and not LIST_ITEM.match(following)):
+                break
+            items[-1][2].append('')
+        elif _indent(line) > base or not _starts_block(line) and items[-1][2][-1].strip():
+            items[-1][2].append(line)
+        else:
+            break
+        i += 1
+
+    # A list is loose (paragraphs in <p>) when a blank line separates any of its blocks
+    parsed = []
+    for index, (marker, content_indent, item_lines) in enumerate(items):
+        while item_lines and not item_lines[-1].strip():
+            item_lines.pop()
+            loose = loose or index < len(items) - 1
+        loose = loose or any(not line.strip() for line in item_lines)
+        body = [item_lines[0]] + [line[min(_indent(line), content_indent):] for line in item_lines[1:]]
+        parsed.append((marker, body))
+
+    return i, parsed, loose
+
+
+def _render_list(items, loose, used):
+    first = items[0][0]
+    if first[-1] in '.)':
+        number = int(first[:-1])
+        open_tag, close_tag = (f'<ol start="{number}">' if number != 1 else '<ol>'), '</ol>'
+    else:
+        open_tag, close_tag = '<ul>', '</ul>'
+
+    rendered = []
+    for _, body in items:
+        inner = render_blocks(body, used, tight=not loose)
+        rendered.append(f"<li>{inner}</li>")
+    return open_tag + '\n' + '\n'.join(rendered) + '\n' + close_tag
+
+
+def render_blocks(lines, used=None, tight=False):
+    """
+    Block-level Markdown to HTML
+
+    Args:
+        lines: Source lines (tabs already expanded)
+        used: Heading ids already issued in the document
+        tight: Render paragraphs without <p> (items of a tight list)
+    """
+    used = {} if used is None else used
+    blocks = []
+    i = 0
+
+    while i < len(lines):
+        line = lines[i]
+
+        if not line.strip():
+            i += 1
+            continue
+
+        fence = FENCE.match(line)
+        if fence:
+            marker = fence.group(1)
+            end = i + 1
+            while end < len(lines) and not lines[end].strip().startswith(marker):
+                end += 1
+            code = _escape('\n'.join(lines[i + 1:end]))
+            language = f' class="language-{fence.group(2)}"' if fence.group(2) else ''
+            blocks.append(f"<pre><code{language}>{code}\n</code></pre>")
+            i = end + 1
+            continue
+
+        heading = HEADING.match(line)
+        if heading:
+            level = len(heading.group(1))
+            inner = render_inline(heading.group(2))
+            blocks.append(f'<h{level} id="{_slug(inner, used)}">{inner}</h{level}>')
+            i += 1
+            continue
+
+        if RULE.match(line):
+            blocks.append('<hr>')
+            i += 1
+            continue
+
+        if QUOTE.match(line):
+            quoted = []
+            while i < len(lines) and lines[i].strip() and (QUOTE.match(lines[i]) or not _starts_block(lines[i])):
+                quoted.append(QUOTE.sub('', lines[i], count=1))
+                i += 1
+            blocks.append(f"<blockquote>\n{render_blocks(quoted, used)}\n</blockquote>")
+            continue
+
+        if LIST_ITEM.match(line):
+            i, items, loose = _collect_list(lines, i)
+            blocks.append(_render_list(items, loose, used))
+            continue
+
+        if '|' in line and i + 1 < len(lines) and TABLE_DELIMITER.match(lines[i + 1]) and '-' in lines[i + 1]:
+            end = i + 2
+            while end < len(lines) and lines[end].strip() and '|' in lines[end]:
+                end += 1
+            blocks.append(_render_table(lines[i:end]))
+            i = end
+            continue
+
+        paragraph = [line]
+        i += 1
+        while i < len(lines) and lines[i].strip() and not _starts_block(lines[i]):
+            paragraph.append(lines[i])
+            i += 1
+        text = _lines_inline(paragraph)
+        blocks.append(text if tight else f"<p>{text}</p>")
+
+    return '\n'.join(blocks)
+
+
+def render_markdown(text):
+    """Markdown document to an HTML fragment"""
+    lines = text.replace('\r\n', '\n').expandtabs(4).split('\n')
+    return render_blocks(lines) + '\n'
+
+
+def fragment_path(source, output_dir=OUTPUT_DIR):
+    """html_dashboard/reports/EXECUTIVE_SUMMARY.html for EXECUTIVE_SUMMARY.md"""
+    return os.path.join(output_dir, os.path.splitext(os.path.basename(source))[0] + '.html')
+
+
+def render_markdown_file(source, cache_dir=CACHE_DIR):
+    """
+    Rendered HTML for one Markdown file, from the cache when its content is unchanged
+
+    Returns:
+        (html, cached) tuple
+    """
+    key = value_digest(f"{RENDERER_VERSION}:{file_digest(source)}")
+    cache_path = os.path.join(cache_dir, f"{key}.html")
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return f.read(), True
+
+    with open(source, 'r', encoding='utf-8') as f:
+        rendered = render_markdown(f.read())
+
+    os.makedirs(cache_dir, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        f.write(rendered)
+    return rendered, False
+
+
+def render_markdown_reports(sources=MARKDOWN_REPORTS, output_dir=OUTPUT_DIR, cache_dir=CACHE_DIR):
+    """
+    Render each Markdown report to its fragment, writing only changed fragments
+
+    Returns:
+        List of (source, output_path, status) tuples; status is 'rendered',
+        'cached' (served from the cache) or 'missing'
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+
+    for source in sources:
+        output_path = fragment_path(source, output_dir)
+        if not os.path.exists(source):
+            results.append((source, output_path, 'missing'))
+            continue
+
+        rendered, cached = render_markdown_file(source, cache_dir)
+        current = None
+        if os.path.exists(output_path):
+            with open(output_path, 'r', encoding='utf-8') as f:
+                current = f.read()
+        if rendered != current:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(rendered)
+
+        results.append((source, output_path, 'cached' if cached else 'rendered'))
+
+    return results
+
+
+def main():
+    """Render the Markdown reports to HTML fragments"""
+    sources = sys.argv[1:] or MARKDOWN_REPORTS
+
+    print("=== RENDERING MARKDOWN REPORTS ===\n")
+    results = render_markdown_reports(sources)
+
+    icons = {'rendered': '✅ Rendered', 'cached': '⚪ Cached', 'missing': '⚠️  Not found'}
+    for source, output_path, status in results:
+        print(f"  {icons[status]}: {source} → {output_path}")
+
+    rendered = sum(1 for _, _, status in results if status == 'rendered')
+    print(f"\n=== {rendered} rendered, {sum(1 for r in results if r[2] == 'cached')} from cache ({CACHE_DIR}) ===")
+
+
+if __name__ == "__main__":
+    main()
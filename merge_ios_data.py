@@ -3,6 +3,14 @@
 iOS Data Merger
 Merges newly scraped iOS reviews with existing dataset
 Handles deduplication and data validation
+
+Every review gets a canonical_id (review_ids.py); new reviews whose canonical
+ID is already in the dataset are duplicates without any text comparison, and
+only the rest are checked for near-duplicates.
+
+Usage:
+    python merge_ios_data.py <existing_data.csv> <new_ios_data.csv>            # replace iOS reviews with a full scrape
+    python merge_ios_data.py --append <existing_data.csv> <ios_delta.csv>      # add an incremental scrape's new reviews
 """
 
 import pandas as pd
@@ -11,18 +19,32 @@ from datetime import datetime
 import sys
 import os
 
+from near_duplicates import duplicates_of
+from review_ids import ID_DTYPES, REGISTRY_FILE, add_canonical_ids
+
+# Columns every review in the merged dataset carries
+REQUIRED_COLUMNS = [
+    'review_id', 'title', 'text', 'rating', 'author', 'app_version',
+    'date', 'app_name', 'platform', 'extraction_method', 'extraction_date',
+    'sentiment_score', 'sentiment', 'userImage', 'thumbs_up',
+    'developer_response', 'replied_at', 'appVersion', 'claude_summary',
+    'claude_sentiment', 'claude_sentiment_score', 'primary_category',
+    'sub_categories', 'issue_tags', 'feature_tags', 'severity',
+    'customer_service_impact'
+]
+
 def load_datasets(existing_path, new_ios_path):
     """Load existing and new datasets"""
     print("📂 Loading datasets...")
     
     # Load existing data
     print(f"   Loading existing data: {existing_path}")
-    existing_df = pd.read_csv(existing_path)
+    existing_df = pd.read_csv(existing_path, dtype=ID_DTYPES)
     print(f"   ✅ Loaded {len(existing_df):,} existing reviews")
     
     # Load new iOS data
     print(f"   Loading new iOS data: {new_ios_path}")
-    new_ios_df = pd.read_csv(new_ios_path)
+    new_ios_df = pd.read_csv(new_ios_path, dtype=ID_DTYPES)
     print(f"   ✅ Loaded {len(new_ios_df):,} new iOS reviews")
     
     return existing_df, new_ios_df
@@ -35,31 +57,18 @@ def analyze_overlap(existing_df, new_ios_df):
     existing_ios = existing_df[existing_df['platform'] == 'iOS'].copy()
     print(f"   Existing iOS reviews: {len(existing_ios):,}")
     
-    # Check for potential duplicates based on author + text
-    duplicates = 0
-    unique_new = []
+    # Known duplicates: the same canonical ID ...
+    is_duplicate = new_ios_df['canonical_id'].isin(set(existing_ios['canonical_id'])).to_numpy().copy()
+    known = int(is_duplicate.sum())
     
-    for idx, new_review in new_ios_df.iterrows():
-        is_duplicate = False
-        
-        # Check if this review might already exist
-        if pd.notna(new_review['author']):
-            author_matches = existing_ios[existing_ios['author'] == new_review['author']]
-            
-            if len(author_matches) > 0:
-                # Check text similarity
-                for _, existing in author_matches.iterrows():
-                    if pd.notna(new_review['text']) and pd.notna(existing['text']):
-                        # Compare first 100 characters
-                        if str(new_review['text'])[:100] == str(existing['text'])[:100]:
-                            duplicates += 1
-                            is_duplicate = True
-                            break
-        
-        if not is_duplicate:
-            unique_new.append(idx)
+    # ... potential ones: same author and a near-duplicate text (near_duplicates.py)
+    rest = np.flatnonzero(~is_duplicate)
+    is_duplicate[rest] = duplicates_of(new_ios_df.iloc[rest], existing_ios, same=('author',))
+    duplicates = int(is_duplicate.sum())
+    unique_new = np.flatnonzero(~is_duplicate).tolist()
     
-    print(f"   Potential duplicates found: {duplicates}")
+    print(f"   Already in the dataset (same canonical ID): {known}")
+    print(f"   Potential duplicates found: {duplicates - known}")
     print(f"   Unique new reviews: {len(unique_new)}")
     
     return unique_new
@@ -71,19 +80,8 @@ def prepare_new_reviews(new_ios_df, unique_indices):
     # Filter to unique reviews only
     unique_df = new_ios_df.iloc[unique_indices].copy()
     
-    # Ensure all required columns are present
-    required_columns = [
-        'review_id', 'title', 'text', 'rating', 'author', 'app_version',
-        'date', 'app_name', 'platform', 'extraction_method', 'extraction_date',
-        'sentiment_score', 'sentiment', 'userImage', 'thumbs_up',
-        'developer_response', 'replied_at', 'appVersion', 'claude_summary',
-        'claude_sentiment', 'claude_sentiment_score', 'primary_category',
-        'sub_categories', 'issue_tags', 'feature_tags', 'severity',
-        'customer_service_impact'
-    ]
-    
     # Add missing columns with appropriate defaults
-    for col in required_columns:
+    for col in REQUIRED_COLUMNS:
         if col not in unique_df.columns:
             if col in ['sentiment_score', 'claude_sentiment_score']:
                 unique_df[col] = np.nan
@@ -103,16 +101,20 @@ def prepare_new_reviews(new_ios_df, unique_indices):
     
     return unique_df
 
-def merge_datasets(existing_df, prepared_new_df):
-    """Merge datasets"""
+def merge_datasets(existing_df, prepared_new_df, append=False):
+    """Merge datasets (append=True keeps the existing iOS reviews, for incremental scrapes)"""
     print("\n🔄 Merging datasets...")
     
-    # Remove existing iOS reviews (we're replacing them)
-    android_only = existing_df[existing_df['platform'] == 'Android'].copy()
-    print(f"   Keeping {len(android_only):,} Android reviews")
+    if append:
+        kept = existing_df.copy()
+        print(f"   Keeping all {len(kept):,} existing reviews")
+    else:
+        # Remove existing iOS reviews (we're replacing them)
+        kept = existing_df[existing_df['platform'] == 'Android'].copy()
+        print(f"   Keeping {len(kept):,} Android reviews")
     
     # Combine with new iOS data
-    merged_df = pd.concat([android_only, prepared_new_df], ignore_index=True)
+    merged_df = pd.concat([kept, prepared_new_df], ignore_index=True)
     
     # Sort by date (newest first)
     if 'date' in merged_df.columns:
@@ -175,14 +177,17 @@ def main():
     print("=" * 60)
     
     # Check command line arguments
-    if len(sys.argv) != 3:
-        print("\n❌ Usage: python merge_ios_data.py <existing_data.csv> <new_ios_data.csv>")
+    args = sys.argv[1:]
+    append = '--append' in args
+    paths = [arg for arg in args if arg != '--append']
+    if len(paths) != 2:
+        print("\n❌ Usage: python merge_ios_data.py [--append] <existing_data.csv> <new_ios_data.csv>")
         print("\nExample:")
         print("  python merge_ios_data.py telecom_app_reviews_analyzed.csv ios_reviews_fresh_20250528_214500.csv")
+        print("  python merge_ios_data.py --append telecom_app_reviews_analyzed.csv ios_reviews_delta_20250530_060000.csv")
         sys.exit(1)
     
-    existing_path = sys.argv[1]
-    new_ios_path = sys.argv[2]
+    existing_path, new_ios_path = paths
     
     # Validate files exist
     if not os.path.exists(existing_path):
@@ -197,6 +202,10 @@ def main():
         # Load datasets
         existing_df, new_ios_df = load_datasets(existing_path, new_ios_path)
         
+        # Canonical review IDs, whatever ID scheme each file used
+        registry = add_canonical_ids(existing_df, new_ios_df)
+        print(f"   🆔 Review ID registry: {len(registry):,} aliases ({registry.added:,} new) in {REGISTRY_FILE}")
+        
         # Analyze overlap
         unique_indices = analyze_overlap(existing_df, new_ios_df)
         
@@ -204,7 +213,7 @@ def main():
         prepared_new_df = prepare_new_reviews(new_ios_df, unique_indices)
         
         # Merge datasets
-        merged_df = merge_datasets(existing_df, prepared_new_df)
+        merged_df = merge_datasets(existing_df, prepared_new_df, append=append)
         
         # Generate summary report
         generate_summary_report(existing_df, new_ios_df, merged_df)
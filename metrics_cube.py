@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Metrics Cube
+Aggregates the review dataset once into a count cube over
+app × platform × category × sentiment × rating × year, then derives every
+headline metric (the filtered_dataset_metrics.json keys) from that cube
+instead of re-filtering the full DataFrame for each number.
+"""
+
+import json
+import math
+import os
+
+import pandas as pd
+
+METRICS_FILE = 'filtered_dataset_metrics.json'
+
+CUBE_DIMENSIONS = ['app_name', 'platform', 'category', 'sentiment', 'rating', 'year']
+
+# Saved metrics the report templates need
+REQUIRED_METRICS = ['total_reviews', 'android_reviews', 'ios_reviews', 'rogers_reviews', 'bell_reviews',
+                    'average_rating', 'negative_reviews', 'negative_percentage']
+
+# Reviews dated in or after this year count towards data currency
+CURRENT_DATA_START_YEAR = 2020
+
+
+def build_cube(df, category_column='primary_category', extra_dimensions=None):
+    """
+    Count reviews per combination of the cube dimensions (one group-by pass)
+
+    Args:
+        df: Review DataFrame (app_name, platform, rating, date, claude_sentiment, ...)
+        category_column: 'primary_category' or 'enhanced_category'
+        extra_dimensions: Optional {name: Series aligned with df} added as
+            further dimensions (e.g. boolean keyword flags)
+
+    Returns:
+        DataFrame with CUBE_DIMENSIONS (+ extra) columns and a 'count' column
+    """
+    missing = pd.Series(pd.NA, index=df.index, dtype=object)
+    frame = pd.DataFrame({
+        'app_name': df['app_name'],
+        'platform': df['platform'],
+        'category': df[category_column] if category_column in df.columns else missing,
+        'sentiment': df['claude_sentiment'] if 'claude_sentiment' in df.columns else missing,
+        'rating': df['rating'],
+        'year': pd.to_datetime(df['date'], errors='coerce').dt.year
+    })
+    extra_dimensions = extra_dimensions or {}
+    for name, values in extra_dimensions.items():
+        frame[name] = values
+
+    dimensions = CUBE_DIMENSIONS + list(extra_dimensions)
+    return frame.groupby(dimensions, dropna=False).size().rename('count').reset_index()
+
+
+def merge_cubes(cubes):
+    """One cube from the cubes of consecutive parts of a dataset (e.g. CSV chunks)"""
+    cubes = list(cubes)
+    if len(cubes) == 1:
+        return cubes[0]
+    combined = pd.concat(cubes, ignore_index=True)
+    dimensions = [column for column in combined.columns if column != 'count']
+    return combined.groupby(dimensions, dropna=False)['count'].sum().reset_index()
+
+
+def cube_slice(cube, **filters):
+    """
+    Rows of the cube matching every filter
+
+    A filter value may be a scalar, a list/set of accepted values, or a
+    callable taking the dimension column and returning a boolean mask.
+    """
+    mask = pd.Series(True, index=cube.index)
+    for dimension, value in filters.items():
+        column = cube[dimension]
+        if callable(value):
+            mask &= value(column)
+        elif isinstance(value, (list, tuple, set)):
+            mask &= column.isin(value)
+        else:
+            mask &= column == value
+    return cube[mask]
+
+
+def cube_count(cube, **filters):
+    """Number of reviews matching the filters"""
+    return int(cube_slice(cube, **filters)['count'].sum())
+
+
+def cube_share(cube, numerator, denominator=None):
+    """Percentage of the denominator slice that also matches the numerator filters"""
+    denominator = denominator or {}
+    total = cube_count(cube, **denominator)
+    if total == 0:
+        return 0.0
+    return cube_count(cube, **dict(denominator, **numerator)) / total * 100
+
+
+def cube_mean_rating(cube, **filters):
+    """Average star rating of the matching reviews"""
+    rows = cube_slice(cube, **filters)
+    total = rows['count'].sum()
+    if total == 0:
+        return 0.0
+    return float((rows['rating'] * rows['count']).sum() / total)
+
+
+def summary_metrics(cube, date_range_start='', date_range_end=''):
+    """Headline metrics in the filtered_dataset_metrics.json format"""
+    total = cube_count(cube)
+
+    def pct(count):
+        return round(count / total * 100, 1) if total else 0.0
+
+    android = cube_count(cube, platform='Android')
+    ios = cube_count(cube, platform='iOS')
+    rogers = cube_count(cube, app_name='Rogers')
+    bell = cube_count(cube, app_name='Bell')
+    current = cube_count(cube, year=lambda year: year >= CURRENT_DATA_START_YEAR)
+
+    metrics = {
+        'total_reviews': total,
+        'android_reviews': android,
+        'ios_reviews': ios,
+        'rogers_reviews': rogers,
+        'bell_reviews': bell,
+        'average_rating': round(cube_mean_rating(cube), 2),
+        'data_currency': pct(current),
+        'date_range_start': date_range_start,
+        'date_range_end': date_range_end,
+        'android_percentage': pct(android),
+        'ios_percentage': pct(ios),
+        'rogers_percentage': pct(rogers),
+        'bell_percentage': pct(bell)
+    }
+
+    # Sentiment counts, most frequent first (as value_counts() orders them)
+    sentiments = cube.dropna(subset=['sentiment']).groupby('sentiment')['count'].sum()
+    for sentiment, count in sentiments.sort_values(ascending=False, kind='stable').items():
+        metrics[f'{str(sentiment).lower()}_reviews'] = int(count)
+        metrics[f'{str(sentiment).lower()}_percentage'] = pct(count)
+
+    metrics['total_stars'] = int((cube['rating'] * cube['count']).sum())
+
+    return metrics
+
+
+def compute_metrics(df, category_column='primary_category'):
+    """Build the cube for df and derive the headline metrics from it"""
+    cube = build_cube(df, category_column)
+
+    dates = pd.to_datetime(df['date'], errors='coerce').dropna()
+    start = dates.min().strftime('%Y-%m-%d') if len(dates) else ''
+    end = dates.max().strftime('%Y-%m-%d') if len(dates) else ''
+
+    return cube, summary_metrics(cube, start, end)
+
+
+def add_derived_metrics(metrics):
+    """
+    Add the ratios the reports' worked examples quote, computed from the stored counts
+
+    negative_share is negative_reviews / total_reviews; negative_margin is
+    the half-width of its 95% confidence interval, 1.96 * sqrt(p(1-p)/n).
+    """
+    metrics = dict(metrics)
+    total = metrics['total_reviews']
+    share = metrics.get('negative_reviews', 0) / total if total else 0.0
+    metrics['negative_share'] = share
+    metrics['negative_margin'] = 1.96 * math.sqrt(share * (1 - share) / total) if total else 0.0
+    return metrics
+
+
+def load_metrics(path=METRICS_FILE):
+    """Load saved headline metrics, raising ValueError if the file lacks any the reports need"""
+    with open(path, 'r', encoding='utf-8') as f:
+        metrics = json.load(f)
+    missing = [name for name in REQUIRED_METRICS if name not in metrics]
+    if missing:
+        raise ValueError(f"{path} is missing {', '.join(missing)}; re-run analyze_filtered_metrics.py")
+    return add_derived_metrics(metrics)
+
+
+def save_metrics(metrics, path=METRICS_FILE):
+    """Save headline metrics"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, indent=2)
+
+
+def metrics_for(data_path=None, category_column='primary_category'):
+    """Metrics computed from a review CSV, or the saved metrics file when no CSV is given"""
+    if data_path:
+        if not os.path.exists(data_path):
+            raise FileNotFoundError(f"Review data not found: {data_path}")
+        _, metrics = compute_metrics(pd.read_csv(data_path), category_column)
+        return add_derived_metrics(metrics)
+    return load_metrics()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Engine
+Finds near-duplicate review texts without comparing every pair, for the iOS
+date matcher (review_matcher.py), the merger's overlap check
+(merge_ios_data.py), the re-scrape comparison (ios_rescrape_and_compare.py)
+and de-duplication before LLM classification (optimized_analysis.py).
+
+    1. texts are normalized (lowercase words, no punctuation) and cut into
+       character shingles, hashed to 64 bits
+    2. each text gets a MinHash signature: one-permutation hashing into
+       NUM_PERM bins, empty bins filled from their neighbours (densified), so
+       two signatures agree in a bin with probability ~ the texts' Jaccard
+       similarity
+    3. LSH banding: signatures are cut into bands and texts sharing any band
+       become candidate pairs; the fewest bands that still make RECALL of
+       the pairs at the threshold candidates are used (fewer bands, fewer
+       dissimilar candidates); buckets of more than MAX_BUCKET texts are
+       skipped
+    4. candidates are verified with the Jaccard similarity of their shingle
+       sets: estimated from the signatures for all of them (vectorized), then
+       exact (NumPy) for the ones near or above the threshold
+
+Usage:
+    from near_duplicates import similar_pairs, duplicate_groups
+    pairs = similar_pairs(new_df['text'], existing_df['text'], threshold=0.8)   # left, right, similarity
+    groups = duplicate_groups(df['text'])     # position of each text's first near-duplicate
+
+    python near_duplicates.py <reviews.csv> [threshold]    # near-duplicate report for a dataset
+"""
+
+import string
+import sys
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+SHINGLE_SIZE = 5
+NUM_PERM = 64
+MAX_BUCKET = 200
+DUPLICATE_THRESHOLD = 0.8
+# Share of pairs at the threshold that must become candidates (sets the banding)
+RECALL = 0.98
+ESTIMATE_MARGIN = 0.1
+
+# Punctuation normalized away before comparing texts
+_PUNCTUATION = str.maketrans({c: ' ' for c in string.punctuation + '‘’“”…–—'})
+
+_BASE = np.uint64(1099511628211)
+_EMPTY = np.iinfo(np.uint64).max
+
+# Shingle hashes (flat, by text) and MinHash signatures of some texts;
+# text i's shingles are hashes[bounds[i]:bounds[i + 1]]
+Sketch = namedtuple('Sketch', ['signatures', 'hashes', 'bounds'])
+
+
+def normalize_text(text):
+    """Lowercase words without punctuation, separated by single spaces"""
+    if pd.isna(text):
+        return ''
+    return ' '.join(str(text).lower().translate(_PUNCTUATION).split())
+
+
+def normalize_texts(texts):
+    """normalize_text over a Series"""
+    return pd.Series([normalize_text(text) for text in texts], index=texts.index, dtype=object)
+
+
+def _mix(values):
+    """splitmix64 finalizer: spreads hash bits (uint64 arithmetic wraps)"""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xbf58476d1ce4e5b9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94d049bb133111eb)
+    return values ^ (values >> np.uint64(31))
+
+
+def _shingles(texts, size):
+    """(text ids, shingle hashes) of every text, in text order (repeats kept)"""
+    encoded = [normalize_text(text).encode('utf-8') for text in texts]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    data = np.frombuffer(b''.join(encoded) + bytes(size), dtype=np.uint8).astype(np.uint64)
+
+    # Texts shorter than a shingle are one (shorter) shingle
+    counts = np.where(lengths >= size, lengths - size + 1, (lengths > 0).astype(np.int64))
+    ids = np.repeat(np.arange(len(encoded)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    positions = np.repeat(np.cumsum(lengths) - lengths, counts) + offsets
+    short = np.flatnonzero(np.repeat(lengths < size, counts))
+    widths = np.repeat(lengths, counts)[short]
+
+    hashes = np.zeros(len(positions), dtype=np.uint64)
+    for k in range(size):
+        byte = data[positions + k]
+        # Don't read past the end of a short text
+        byte[short] = np.where(k < widths, byte[short], np.uint64(0))
+        hashes = hashes * _BASE + byte
+    return ids, _mix(hashes)
+
+
+def sketch(texts, size=SHINGLE_SIZE, num_perm=NUM_PERM):
+    """
+    Shingles and MinHash signatures of texts
+
+    Texts without words get a signature of empty bins, which matches nothing.
+    """
+    if num_perm & (num_perm - 1):
+        raise ValueError(f"num_perm must be a power of 2, got {num_perm}")
+    texts = list(texts)
+    ids, hashes = _shingles(texts, size)
+    bounds = np.searchsorted(ids, np.arange(len(texts) + 1))
+
+    # One permutation: the top bits pick the bin, the minimum hash per bin wins
+    signatures = np.full((len(texts), num_perm), _EMPTY, dtype=np.uint64)
+    bins = (hashes >> np.uint64(64 - num_perm.bit_length() + 1)).astype(np.int64) if num_perm > 1 \
+        else np.zeros(len(hashes), dtype=np.int64)
+    np.minimum.at(signatures, (ids, bins), hashes)
+
+    # Densify: an empty bin takes the next non-empty bin's value (rotated), tagged with the distance
+    filled = signatures.copy()
+    has_shingles = (bounds[1:] > bounds[:-1])[:, None]
+    for distance in range(1, num_perm):
+        todo = (filled == _EMPTY) & has_shingles
+        if not todo.any():
+            break
+        rotated = np.roll(signatures, -distance, axis=1)
+        take = todo & (rotated != _EMPTY)
+        filled[take] = _mix(rotated[take] + np.uint64(distance))
+    return Sketch(filled, hashes, bounds)
+
+
+def bands_for(threshold, num_perm=NUM_PERM, recall=RECALL):
+    """Fewest LSH bands making pairs at the threshold candidates with probability >= recall"""
+    bands = 1
+    while bands < num_perm:
+        rows = num_perm // bands
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            break
+        bands *= 2
+    return bands
+
+
+def _band_keys(signatures, bands):
+    """(texts, bands) hash of each band of rows"""
+    rows = signatures.shape[1] // bands
+    keys = np.zeros((len(signatures), bands), dtype=np.uint64)
+    for row in range(rows):
+        keys = _mix(keys * _BASE + signatures[:, row::rows][:, :bands])
+    # Texts without shingles are never candidates
+    keys[signatures[:, 0] == _EMPTY] = _EMPTY
+    return keys
+
+
+def candidate_pairs(left, right, bands, max_bucket=MAX_BUCKET):
+    """
+    LSH candidate pairs between two sketches (within left when right is None)
+
+    Returns:
+        (left positions, right positions) arrays of unique pairs
+    """
+    self_join = right is None
+    right = left if self_join else right
+    left_keys, right_keys = _band_keys(left.signatures, bands), _band_keys(right.signatures, bands)
+
+    found = []
+    for band in range(bands):
+        lhs = pd.DataFrame({'key': left_keys[:, band], 'left': np.arange(len(left_keys))})
+        rhs = pd.DataFrame({'key': right_keys[:, band], 'right': np.arange(len(right_keys))})
+        lhs, rhs = lhs[lhs['key'] != _EMPTY], rhs[rhs['key'] != _EMPTY]
+        sizes = rhs['key'].value_counts()
+        rhs = rhs[rhs['key'].map(sizes) <= max_bucket]
+        pairs = lhs.merge(rhs, on='key')
+        if self_join:
+            pairs = pairs[pairs['left'] < pairs['right']]
+        found.append(pairs['left'].to_numpy() * len(right_keys) + pairs['right'].to_numpy())
+
+    codes = np.unique(np.concatenate(found)) if found else np.empty(0, dtype=np.int64)
+    return codes // max(len(right_keys), 1), codes % max(len(right_keys), 1)
+
+
+def estimated_jaccard(left, right, left_positions, right_positions, chunk=100_000):
+    """Jaccard similarity of each pair estimated from the signatures (share of equal bins)"""
+    similarity = np.zeros(len(left_positions))
+    for start in range(0, len(left_positions), chunk):
+        i, j = left_positions[start:start + chunk], right_positions[start:start + chunk]
+        similarity[start:start + chunk] = (left.signatures[i] == right.signatures[j]).mean(axis=1)
+    return similarity
+
+
+def jaccard(left, right, left_positions, right_positions):
+    """Exact Jaccard similarity of the shingle sets of each pair"""
+    def shingle_sets(sketch_, positions):
+        return {i: set(sketch_.hashes[sketch_.bounds[i]:sketch_.bounds[i + 1]].tolist())
+                for i in np.unique(positions).tolist()}
+
+    if right is left:
+        left_sets = right_sets = shingle_sets(left, np.concatenate([left_positions, right_positions]))
+    else:
+        left_sets, right_sets = shingle_sets(left, left_positions), shingle_sets(right, right_positions)
+    similarity = np.zeros(len(left_positions))
+    for k, (i, j) in enumerate(zip(left_positions.tolist(), right_positions.tolist())):
+        a, b = left_sets[i], right_sets[j]
+        common = len(a & b)
+        union = len(a) + len(b) - common
+        similarity[k] = common / union if union else 0.0
+    return similarity
+
+
+def _unique(texts):
+    """(distinct normalized texts, index of each text's distinct text)"""
+    normalized = [normalize_text(text) for text in texts]
+    codes, unique = pd.factorize(pd.Series(normalized, dtype=object))
+    return list(unique), codes
+
+
+def _verified(left, right, threshold, bands=None, exact=True):
+    """Candidate pairs of two sketches (one when right is None) with Jaccard >= threshold"""
+    bands = bands or bands_for(threshold)
+    right_sketch = left if right is None else right
+    left_positions, right_positions = candidate_pairs(left, right, bands)
+    similarity = estimated_jaccard(left, right_sketch, left_positions, right_positions)
+    if exact:
+        # The estimate is within ~ESTIMATE_MARGIN; only pairs near or above the threshold are verified
+        likely = similarity >= threshold - ESTIMATE_MARGIN
+        left_positions, right_positions = left_positions[likely], right_positions[likely]
+        similarity = jaccard(left, right_sketch, left_positions, right_positions)
+    keep = similarity >= threshold
+    return left_positions[keep], right_positions[keep], similarity[keep]
+
+
+def similar_pairs(left_texts, right_texts=None, threshold=DUPLICATE_THRESHOLD, bands=None, exact=True):
+    """
+    Near-duplicate pairs with a Jaccard similarity of at least threshold
+
+    Identical texts are sketched once, so repeated short texts don't crowd
+    the LSH buckets; every pair of their occurrences is returned.
+
+    Args:
+        left_texts, right_texts: Iterables of texts; without right_texts,
+            pairs within left_texts (left < right)
+        exact: Verify with the exact Jaccard similarity; otherwise the
+            signature estimate is used (faster, for ranking candidates)
+
+    Returns:
+        DataFrame of left, right (positions) and similarity, by left then
+        descending similarity
+    """
+    left_unique, left_codes = _unique(left_texts)
+    if right_texts is None:
+        right_unique, right_codes = left_unique, left_codes
+        found = _verified(sketch(left_unique), None, threshold, bands, exact)
+        # Identical texts, and both orders of each similar pair of distinct texts
+        same = np.array([i for i, text in enumerate(left_unique) if text], dtype=np.int64)
+        found = (np.concatenate([found[0], found[1], same]), np.concatenate([found[1], found[0], same]),
+                 np.concatenate([found[2], found[2], np.ones(len(same))]))
+    else:
+        right_unique, right_codes = _unique(right_texts)
+        found = _verified(sketch(left_unique), sketch(right_unique), threshold, bands, exact)
+
+    distinct = pd.DataFrame({'left_text': found[0], 'right_text': found[1], 'similarity': found[2]})
+    pairs = (distinct
+             .merge(pd.DataFrame({'left': np.arange(len(left_codes)), 'left_text': left_codes}), on='left_text')
+             .merge(pd.DataFrame({'right': np.arange(len(right_codes)), 'right_text': right_codes}), on='right_text'))
+    if right_texts is None:
+        pairs = pairs[pairs['left'] < pairs['right']]
+    pairs = pairs[['left', 'right', 'similarity']]
+    return pairs.sort_values(['left', 'similarity', 'right'], ascending=[True, False, True]).reset_index(drop=True)
+
+
+def duplicate_groups(texts, threshold=DUPLICATE_THRESHOLD, bands=None, keys=None):
+    """
+    Group near-duplicate texts (transitively); texts without words stay alone
+
+    Args:
+        keys: Optional DataFrame or Series aligned with texts; only texts with
+            equal keys are grouped (e.g. df[['app_name', 'rating']])
+
+    Returns:
+        Array with, for each text, the position of the first text of its group
+    """
+    if keys is not None:
+        texts = pd.Series(texts).reset_index(drop=True)
+        keys = pd.DataFrame(keys).reset_index(drop=True)
+        groups = np.arange(len(texts))
+        for positions in keys.groupby(list(keys.columns), dropna=False, sort=False).indices.values():
+            positions = np.sort(positions)
+            groups[positions] = positions[duplicate_groups(texts.iloc[positions], threshold, bands)]
+        return groups
+
+    unique, codes = _unique(texts)
+    parent = np.arange(len(unique))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j, _ in zip(*_verified(sketch(unique), None, threshold, bands)):
+        a, b = root(i), root(j)
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+
+    roots = np.array([root(i) for i in range(len(unique))], dtype=np.int64)
+    labels = pd.Series(roots[codes] if len(codes) else np.empty(0, dtype=np.int64))
+    empty = np.array([not unique[code] for code in codes], dtype=bool)
+    labels[empty] = -1 - np.flatnonzero(empty)
+    return labels.groupby(labels).transform(lambda group: group.index.min()).to_numpy() if len(labels) \
+        else np.empty(0, dtype=np.int64)
+
+
+def duplicates_of(df, other_df, same=('author',), threshold=DUPLICATE_THRESHOLD):
+    """
+    Whether each review of df has a near-duplicate in other_df
+
+    A near-duplicate has a similar text and equal, known values in the
+    `same` columns.
+
+    Returns:
+        Boolean array, one per row of df
+    """
+    found = np.zeros(len(df), dtype=bool)
+    if len(df) == 0 or len(other_df) == 0:
+        return found
+    pairs = similar_pairs(df['text'], other_df['text'], threshold=threshold)
+    left, right = pairs['left'].to_numpy(), pairs['right'].to_numpy()
+    keep = np.ones(len(pairs), dtype=bool)
+    for column in same:
+        ours, theirs = df[column].to_numpy()[left], other_df[column].to_numpy()[right]
+        keep &= pd.notna(ours) & (ours == theirs)
+    found[left[keep]] = True
+    return found
+
+
+def main():
+    """Near-duplicate report for a review dataset"""
+    if len(sys.argv) < 2:
+        print("❌ Usage: python near_duplicates.py <reviews.csv> [threshold]")
+        sys.exit(1)
+
+    try:
+        df = pd.read_csv(sys.argv[1])
+        threshold = float(sys.argv[2]) if len(sys.argv) > 2 else DUPLICATE_THRESHOLD
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print("=== NEAR-DUPLICATE REVIEWS ===")
+    groups = duplicate_groups(df['text'], threshold)
+    sizes = pd.Series(groups).value_counts()
+    duplicated = sizes[sizes > 1]
+    print(f"Reviews: {len(df):,}")
+    print(f"Near-duplicate groups (Jaccard ≥ {threshold:g}): {len(duplicated):,} "
+          f"covering {duplicated.sum():,} reviews")
+    print(f"Distinct texts after de-duplication: {len(sizes):,}")
+
+    for first, size in duplicated.head(5).items():
+        print(f"\n   {size}x  {str(df['text'].iloc[first])[:80]}")
+
+
+if __name__ == "__main__":
+    main()
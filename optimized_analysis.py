@@ -2,8 +2,12 @@
 """
 Optimized Enhanced Analysis - Fully utilizes Tier 4 Claude Haiku limits
 4,000 requests/min, 400K input tokens/min, 80K output tokens/min
+
+Near-duplicate reviews (near_duplicates.py) of the same app and star rating
+are sent once; every review in a group gets its first review's category.
 """
 
+import numpy as np
 import pandas as pd
 import anthropic
 import asyncio
@@ -14,6 +18,8 @@ from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 import threading
 
+from near_duplicates import duplicate_groups
+
 # Claude API setup
 CLAUDE_API_KEY = os.environ.get('CLAUDE_API_KEY', '')
 client = anthropic.Anthropic(api_key=CLAUDE_API_KEY)
@@ -26,6 +32,7 @@ RESULTS_FILE = "analysis_results.json"
 MAX_CONCURRENT = 100  # Process 100 reviews concurrently
 BATCH_SIZE = 200      # Process in batches of 200
 BATCH_DELAY = 3       # 3 seconds between batches
+DEDUP_THRESHOLD = 0.9 # Reviews this similar share one classification
 
 def get_optimized_prompt():
     """Ultra-compact prompt for speed"""
@@ -73,17 +80,22 @@ def analyze_single_review(review_data):
             'success': False
         }
 
-def load_progress():
-    """Load existing progress"""
+def load_progress(total_reviews):
+    """Load existing progress (restarting if it was saved for a different review list)"""
     if os.path.exists(PROGRESS_FILE) and os.path.exists(RESULTS_FILE):
         try:
             with open(PROGRESS_FILE, 'r') as f:
                 progress = json.load(f)
             with open(RESULTS_FILE, 'r') as f:
                 results = json.load(f)
-            return progress['current_index'], results
         except:
             return 0, {}
+        # The cursor indexes the list it was saved for; against another it points anywhere
+        if progress.get('total_reviews') != total_reviews:
+            print(f"⚠️  {PROGRESS_FILE} is for {progress.get('total_reviews')} reviews, "
+                  f"not {total_reviews:,} - starting over")
+            return 0, {}
+        return progress['current_index'], results
     return 0, {}
 
 def save_progress(current_index, total_reviews, results):
@@ -116,19 +128,26 @@ def main():
     print("📦 Batch size: 200 reviews")
     
     # Load dataset
-    df = pd.read_csv('Data/analyzed_reviews_filtered_clean.csv')
+    df = pd.read_csv('Data/analyzed_reviews_filtered_clean.csv').reset_index(drop=True)
+    
+    # Only the first review of each near-duplicate group is sent; groups never span
+    # apps or ratings, so "would recommend" and "would not recommend" stay apart
+    group = duplicate_groups(df['text'], threshold=DEDUP_THRESHOLD, keys=df[['app_name', 'rating']])
+    representatives = np.flatnonzero(group == np.arange(len(df)))
     
-    # Load progress
-    start_index, existing_results = load_progress()
+    # Load progress (an index into the representatives)
+    start_index, existing_results = load_progress(len(representatives))
     
     print(f"\n📊 Dataset Status:")
     print(f"   Total reviews: {len(df):,}")
+    print(f"   Distinct (near-duplicates merged): {len(representatives):,} "
+          f"({len(df) - len(representatives):,} duplicates skipped)")
     print(f"   Starting from: {start_index:,}")
-    print(f"   Remaining: {len(df) - start_index:,}")
+    print(f"   Remaining: {len(representatives) - start_index:,}")
     print(f"   Already completed: {len(existing_results):,}")
     
     # Calculate optimization
-    remaining = len(df) - start_index
+    remaining = len(representatives) - start_index
     total_batches = (remaining + BATCH_SIZE - 1) // BATCH_SIZE
     estimated_time = total_batches * BATCH_DELAY / 60  # minutes
     
@@ -144,19 +163,19 @@ def main():
     try:
         for batch_num in range(total_batches):
             batch_start = start_index + (batch_num * BATCH_SIZE)
-            batch_end = min(batch_start + BATCH_SIZE, len(df))
+            batch_end = min(batch_start + BATCH_SIZE, len(representatives))
             
-            if batch_start >= len(df):
+            if batch_start >= len(representatives):
                 break
                 
-            batch_df = df.iloc[batch_start:batch_end]
+            batch_positions = representatives[batch_start:batch_end]
+            batch_df = df.iloc[batch_positions]
             
             print(f"\n📦 Batch {batch_num + 1}/{total_batches} ({batch_start+1}-{batch_end})")
             
             # Prepare batch data
             batch_data = []
-            for idx, (_, review) in enumerate(batch_df.iterrows()):
-                actual_index = batch_start + idx
+            for actual_index, (_, review) in zip(batch_positions.tolist(), batch_df.iterrows()):
                 batch_data.append((
                     review['text'],
                     review['review_id'], 
@@ -185,10 +204,11 @@ def main():
             print(f"   ✅ Processed {len(batch_results)} reviews in {batch_time:.1f}s")
             print(f"   📈 Batch success: {batch_success}/{len(batch_results)}")
             print(f"   ⚡ Current rate: {current_rate:.0f} reviews/min")
-            print(f"   🏁 Overall progress: {completed:,}/{len(df):,} ({completed/len(df)*100:.1f}%)")
+            print(f"   🏁 Overall progress: {completed:,}/{len(representatives):,} "
+                  f"({completed/len(representatives)*100:.1f}%)")
             
             # Save progress
-            save_progress(completed, len(df), existing_results)
+            save_progress(completed, len(representatives), existing_results)
             
             # Rate limiting delay
             if batch_num < total_batches - 1:
@@ -204,10 +224,10 @@ def main():
     
     # Final results
     total_time = time.time() - start_time
-    final_rate = (len(df) - start_index) / total_time * 60
+    final_rate = (len(representatives) - start_index) / total_time * 60
     
     print(f"\n🎯 OPTIMIZED ANALYSIS COMPLETE!")
-    print(f"   📊 Processed: {len(df) - start_index:,} reviews")
+    print(f"   📊 Processed: {len(representatives) - start_index:,} reviews")
     print(f"   ⏱️  Total time: {total_time/60:.1f} minutes")
     print(f"   ⚡ Final rate: {final_rate:.0f} reviews/min")
     print(f"   ✅ Success: {success_count:,}/{len(existing_results):,}")
@@ -215,19 +235,19 @@ def main():
     # Generate final dataset
     print(f"\n🔄 Generating optimized dataset...")
     
-    for review_id, result in existing_results.items():
-        if result['success']:
-            idx = result['index']
-            df.loc[idx, 'enhanced_category'] = result['category']
-            df.loc[idx, 'enhanced_sentiment'] = result['sentiment']
+    # Each review takes its group's result
+    classified = {result['index']: result for result in existing_results.values() if result['success']}
+    first = pd.Series(group)
+    done = first.isin(classified).to_numpy()
+    df.loc[done, 'enhanced_category'] = first[done].map(lambda i: classified[i]['category']).to_numpy()
+    df.loc[done, 'enhanced_sentiment'] = first[done].map(lambda i: classified[i]['sentiment']).to_numpy()
     
     # Save final results
     output_file = f'Data/optimized_enhanced_analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
     df.to_csv(output_file, index=False)
     
     # Category summary
-    categories = [r['category'] for r in existing_results.values() if r['success']]
-    category_counts = pd.Series(categories).value_counts()
+    category_counts = df.loc[done, 'enhanced_category'].value_counts()
     
     print(f"\n📈 Final Enhanced Categories:")
     for category, count in category_counts.head(15).items():
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Data Refresh Pipeline
+Runs the full refresh - scrape, match dates, merge, filter, classify,
+recategorize, rebuild the dashboard, render reports, verify - as one DAG of
+stages instead of a list of copy-paste commands.
+
+Each stage is a script with typed inputs and outputs. Stage order follows
+the data: a stage waits for the stages producing its inputs, and stages
+whose inputs are ready run in parallel. Scripts that write timestamped files
+(ios_reviews_fresh_<ts>.csv, ...) have the file they wrote published to the
+stage's canonical path, which the next stage reads - no more
+"cp <output_file> Data/analyzed_reviews_filtered_clean.csv".
+
+Stages are cached on a content hash of their script, command and input files
+(see build_graph.py), kept in .build/pipeline/state.json; a stage whose hash
+is unchanged and whose outputs exist is skipped, so a full refresh only
+redoes what changed downstream of new data. Stages marked volatile (the
+scrape) always run; when they produce identical data, everything after them
+is still skipped. Checkpoint files a script resumes from (the classifiers'
+progress files) belong to the inputs they were written for: they are deleted
+before the stage runs on changed inputs, and kept for a rerun of an
+interrupted stage.
+
+Usage:
+    python pipeline.py                       # full refresh, unchanged stages skipped
+    python pipeline.py --list                # show stages, ports and dependencies
+    python pipeline.py --dry-run             # show what would run
+    python pipeline.py --force               # rerun every stage
+    python pipeline.py --only filter,classify
+    python pipeline.py --skip scrape         # refresh from the current scrape
+    python pipeline.py --workers 2
+"""
+
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from build_graph import input_digest, load_state, save_state
+
+LOG_DIR = '.build/pipeline'
+
+# Stage hashes, apart from build_graph's .build_state.json: stage scripts (the
+# dashboard's run_build) write that file while the pipeline runs
+STATE_FILE = '.build/pipeline/state.json'
+STAGE_DIR = 'Data/pipeline'
+
+# Seed dataset the refresh starts from
+SOURCE_FILE = 'telecom_app_reviews_analyzed.csv'
+
+# Columns every review CSV passed between stages must have
+REVIEW_COLUMNS = ['review_id', 'app_name', 'platform', 'rating', 'text']
+
+
+def port(path, kind='file'):
+    """
+    A typed stage input or output
+
+    Kinds:
+        reviews  review CSV with REVIEW_COLUMNS
+        json     parseable JSON document
+        file     any non-empty file (JS, HTML, Markdown)
+    """
+    if kind not in VALIDATORS:
+        raise ValueError(f"Unknown port kind '{kind}' for {path}")
+    return {'path': path, 'kind': kind}
+
+
+def stage(name, script, args=(), inputs=None, outputs=None, collect=None, volatile=False, checkpoints=()):
+    """
+    Describe one pipeline stage
+
+    Args:
+        name: Unique stage name (state key 'pipeline:<name>')
+        script: Python script the stage runs
+        args: Script arguments; '{port}' is replaced with that input's path
+        inputs: {port name: port()} files the stage reads
+        outputs: {port name: port()} files the stage writes
+        collect: {output port name: glob} for scripts that write timestamped
+            files; the newest match written during the run is copied to the port
+        volatile: Always run (e.g. scraping, whose inputs live elsewhere)
+        checkpoints: Progress files the script resumes from; deleted when the
+            stage runs with a different hash than the one they were written under
+    """
+    return {
+        'name': name,
+        'script': script,
+        'args': list(args),
+        'inputs': dict(inputs or {}),
+        'outputs': dict(outputs or {}),
+        'collect': dict(collect or {}),
+        'volatile': volatile,
+        'checkpoints': list(checkpoints)
+    }
+
+
+def _review_csv(path):
+    columns = pd.read_csv(path, nrows=0).columns
+    missing = [c for c in REVIEW_COLUMNS if c not in columns]
+    if missing:
+        raise ValueError(f"{path} is missing columns: {', '.join(missing)}")
+
+
+def _json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        json.load(f)
+
+
+def _file(path):
+    if os.path.getsize(path) == 0:
+        raise ValueError(f"{path} is empty")
+
+
+VALIDATORS = {
+    'reviews': _review_csv,
+    'json': _json,
+    'file': _file
+}
+
+
+def validate(ports):
+    """Check that every port's file exists and matches its kind (raises ValueError)"""
+    for name, item in ports.items():
+        if not os.path.exists(item['path']):
+            raise ValueError(f"{name}: {item['path']} not found")
+        VALIDATORS[item['kind']](item['path'])
+
+
+def default_stages():
+    """The refresh pipeline, in data order"""
+    from dashboard_data import SIDECAR_FILE
+    from markdown_reports import MARKDOWN_REPORTS, OUTPUT_DIR as MARKDOWN_OUTPUT_DIR, fragment_path
+    from report_numbers import INDEX_FILE as NUMBER_INDEX_FILE
+    from update_dashboard_complete import (
+        ACCURACY_HTML_FILE, ACCURACY_MARKDOWN_FILE, DASHBOARD_JS_FILES, DATA_FILE as DASHBOARD_DATA_FILE
+    )
+    from verify_claims import CLAIMS_FILE, REPORT_FILE as CLAIMS_REPORT_FILE
+
+    scraped = port(f'{STAGE_DIR}/ios_reviews_fresh.csv', 'reviews')
+    dated = port(f'{STAGE_DIR}/reviews_dated.csv', 'reviews')
+    merged = port('Data/analyzed_reviews.csv', 'reviews')
+    filtered = port('Data/analyzed_reviews_filtered_clean.csv', 'reviews')
+    classified = port('Data/enhanced_analysis_final_clean.csv', 'reviews')
+    recategorized = port(DASHBOARD_DATA_FILE, 'reviews')
+
+    return [
+        stage('scrape', 'ios_rescrape_fixed.py', ['{existing}'],
+              inputs={'existing': port(SOURCE_FILE, 'reviews')},
+              outputs={'scraped': scraped},
+              collect={'scraped': 'ios_reviews_fresh_*.csv'},
+              volatile=True),
+        stage('match_dates', 'ios_date_updater_auto.py', ['{existing}', '{scraped}'],
+              inputs={'existing': port(SOURCE_FILE, 'reviews'), 'scraped': scraped},
+              outputs={'dated': dated},
+              collect={'dated': 'telecom_app_reviews_updated_*.csv'}),
+        stage('merge', 'merge_ios_data.py', ['{dated}', '{scraped}'],
+              inputs={'dated': dated, 'scraped': scraped},
+              outputs={'merged': merged},
+              collect={'merged': 'telecom_app_reviews_merged_*.csv'}),
+        stage('filter', 'create_clean_filtered_dataset.py',
+              inputs={'merged': merged},
+              outputs={'filtered': filtered}),
+        stage('classify', 'optimized_analysis.py',
+              inputs={'filtered': filtered},
+              outputs={'classified': classified},
+              collect={'classified': 'Data/optimized_enhanced_analysis_*.csv'},
+              checkpoints=['analysis_progress.json', 'analysis_results.json']),
+        stage('recategorize', 'recategorize_user_feedback.py',
+              inputs={'classified': classified},
+              outputs={'recategorized': recategorized},
+              collect={'recategorized': 'Data/recategorized_analysis_final*.csv'},
+              checkpoints=['recategorization_progress.json', 'recategorization_results.json']),
+        stage('dashboard', 'update_dashboard_complete.py',
+              inputs={'recategorized': recategorized},
+              outputs={**{f'js_{i}': port(path) for i, path in enumerate(DASHBOARD_JS_FILES)},
+                       'sidecar': port(SIDECAR_FILE, 'json'),
+                       'accuracy_html': port(ACCURACY_HTML_FILE),
+                       'accuracy_markdown': port(ACCURACY_MARKDOWN_FILE)}),
+        stage('reports', 'render_reports.py', ['{recategorized}'],
+              inputs={'recategorized': recategorized},
+              outputs={'dashboard_page': port('html_dashboard/dashboard.html')}),
+        stage('markdown', 'markdown_reports.py',
+              inputs={f'source_{i}': port(path) for i, path in enumerate(MARKDOWN_REPORTS)},
+              outputs={f'fragment_{i}': port(fragment_path(path, MARKDOWN_OUTPUT_DIR))
+                       for i, path in enumerate(MARKDOWN_REPORTS)}),
+        stage('verify', 'verify_claims.py', ['{recategorized}'],
+              inputs={'recategorized': recategorized, 'registry': port(CLAIMS_FILE)},
+              outputs={'claims': port(CLAIMS_REPORT_FILE, 'json')}),
+        stage('report_numbers', 'report_numbers.py', ['{recategorized}'],
+              inputs={'recategorized': recategorized, 'registry': port(CLAIMS_FILE),
+                      'dashboard_page': port('html_dashboard/dashboard.html'),
+                      'accuracy_html': port(ACCURACY_HTML_FILE),
+                      'accuracy_markdown': port(ACCURACY_MARKDOWN_FILE)},
+              outputs={'index': port(NUMBER_INDEX_FILE, 'json')})
+    ]
+
+
+def dependencies(stages):
+    """
+    Upstream stage names per stage, from matching output and input paths
+
+    Raises ValueError for duplicate producers, type mismatches and cycles.
+    """
+    producers = {}
+    for item in stages:
+        for output in item['outputs'].values():
+            if output['path'] in producers:
+                raise ValueError(f"{output['path']} is written by both "
+                                 f"{producers[output['path']][0]} and {item['name']}")
+            producers[output['path']] = (item['name'], output['kind'])
+
+    upstream = {}
+    for item in stages:
+        upstream[item['name']] = set()
+        for name, source in item['inputs'].items():
+            producer = producers.get(source['path'])
+            if producer is None or producer[0] == item['name']:
+                continue
+            if producer[1] != source['kind']:
+                raise ValueError(f"{item['name']}.{name} expects {source['kind']} but "
+                                 f"{producer[0]} writes {producer[1]} to {source['path']}")
+            upstream[item['name']].add(producer[0])
+
+    # Cycle check (Kahn)
+    remaining = {name: set(deps) for name, deps in upstream.items()}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle between: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+    return upstream
+
+
+def command(item):
+    """Argument list for a stage's script"""
+    paths = {name: source['path'] for name, source in item['inputs'].items()}
+    return [sys.executable, item['script']] + [arg.format(**paths) for arg in item['args']]
+
+
+def stage_digest(item):
+    """Content hash of a stage's script, command and input files"""
+    return input_digest({
+        'inputs': [item['script']] + sorted(source['path'] for source in item['inputs'].values()),
+        'values': [item['args']]
+    })
+
+
+def collect_outputs(item, started):
+    """Copy the newest file each collect glob matched during the run to its port (unless it is the port)"""
+    for name, pattern in item['collect'].items():
+        target = item['outputs'][name]['path']
+        written = [path for path in glob.glob(pattern) if os.path.getmtime(path) >= started]
+        if not written:
+            raise ValueError(f"{name}: no file matching {pattern} was written")
+        newest = max(written, key=os.path.getmtime)
+        if os.path.abspath(newest) != os.path.abspath(target):
+            os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+            shutil.copyfile(newest, target)
+
+
+def clear_checkpoints(item, state):
+    """
+    Delete a stage's checkpoint files unless they were written under its current hash
+
+    Records the current hash as the one the checkpoints now belong to.
+    """
+    if not item['checkpoints']:
+        return
+    key = f"checkpoints:{item['name']}"
+    digest = stage_digest(item)
+    if state.get(key) != digest:
+        for path in item['checkpoints']:
+            if os.path.exists(path):
+                os.remove(path)
+                print(f"🧹 {item['name']}: removed {path} (written for other inputs)")
+    state[key] = digest
+
+
+def run_stage(item):
+    """
+    Run one stage's script, logging to LOG_DIR/<stage>.log
+
+    Returns:
+        None on success, an error message otherwise
+    """
+    os.makedirs(LOG_DIR, exist_ok=True)
+    for output in item['outputs'].values():
+        os.makedirs(os.path.dirname(output['path']) or '.', exist_ok=True)
+
+    # Timestamps have one-second resolution on some filesystems
+    started = int(time.time())
+    log_path = os.path.join(LOG_DIR, f"{item['name']}.log")
+    with open(log_path, 'w', encoding='utf-8') as log:
+        process = subprocess.run(command(item), stdin=subprocess.DEVNULL, stdout=log,
+                                 stderr=subprocess.STDOUT, env=dict(os.environ, PYTHONUNBUFFERED='1'))
+    if process.returncode != 0:
+        return f"exit code {process.returncode} (see {log_path})"
+
+    try:
+        collect_outputs(item, started)
+        validate(item['outputs'])
+    except (OSError, ValueError) as e:
+        return str(e)
+    return None
+
+
+def run_pipeline(stages, state_file=STATE_FILE, force=False, selected=None, workers=None, dry_run=False):
+    """
+    Run the stages whose inputs changed, in dependency order and in parallel
+
+    Args:
+        selected: Stage names to consider (default all); the others are left
+            as they are and their outputs used as they stand
+
+    Returns:
+        List of {'name', 'status', 'seconds', 'error'} dicts in stage order;
+        status is built, skipped, failed, blocked (an upstream stage failed)
+        or pending (dry run)
+    """
+    upstream = dependencies(stages)
+    by_name = {item['name']: item for item in stages}
+    selected = set(selected or by_name)
+    os.makedirs(os.path.dirname(state_file) or '.', exist_ok=True)
+    state = load_state(state_file)
+    results = {}
+    # Stages a dry run would rerun; for real runs the rebuilt inputs change the hashes
+    stale = set()
+
+    def is_fresh(item):
+        key = f"pipeline:{item['name']}"
+        outputs_present = all(os.path.exists(output['path']) for output in item['outputs'].values())
+        return (not force and not item['volatile'] and outputs_present
+                and not (upstream[item['name']] & stale) and state.get(key) == stage_digest(item))
+
+    pending = [item['name'] for item in stages if item['name'] in selected]
+    running = {}
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1) as executor:
+        while pending or running:
+            for name in list(pending):
+                deps = upstream[name] & selected
+                if any(results.get(dep, {}).get('status') in ('failed', 'blocked') for dep in deps):
+                    pending.remove(name)
+                    results[name] = {'name': name, 'status': 'blocked', 'seconds': 0.0, 'error': None}
+                    continue
+                if not all(dep in results for dep in deps):
+                    continue
+
+                pending.remove(name)
+                item = by_name[name]
+                if is_fresh(item):
+                    results[name] = {'name': name, 'status': 'skipped', 'seconds': 0.0, 'error': None}
+                elif dry_run:
+                    stale.add(name)
+                    results[name] = {'name': name, 'status': 'pending', 'seconds': 0.0, 'error': None}
+                else:
+                    try:
+                        validate(item['inputs'])
+                    except (OSError, ValueError) as e:
+                        results[name] = {'name': name, 'status': 'failed', 'seconds': 0.0, 'error': str(e)}
+                        continue
+                    clear_checkpoints(item, state)
+                    save_state(state, state_file)
+                    print(f"▶️  {name}: {' '.join(command(item)[1:])}")
+                    running[executor.submit(run_stage, item)] = (name, time.perf_counter())
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, start = running.pop(future)
+                error = future.result()
+                key = f"pipeline:{name}"
+                if error:
+                    state.pop(key, None)
+                    status = 'failed'
+                    print(f"❌ {name}: {error}")
+                else:
+                    state[key] = stage_digest(by_name[name])
+                    status = 'built'
+                    print(f"✅ {name}")
+                results[name] = {'name': name, 'status': status,
+                                 'seconds': time.perf_counter() - start, 'error': error}
+            save_state(state, state_file)
+
+    return [results[item['name']] for item in stages if item['name'] in results]
+
+
+def print_stages(stages):
+    """Stages with their ports and upstream stages"""
+    upstream = dependencies(stages)
+    for item in stages:
+        flags = ' (volatile)' if item['volatile'] else ''
+        after = ', '.join(sorted(upstream[item['name']])) or '-'
+        print(f"\n{item['name']}{flags}: {item['script']} {' '.join(item['args'])}".rstrip())
+        print(f"   after:   {after}")
+        for label, ports in (('in', item['inputs']), ('out', item['outputs'])):
+            for name, source in ports.items():
+                print(f"   {label + ':':<8} {name:<18} {source['kind']:<8} {source['path']}")
+
+
+def print_results(results):
+    """Per-stage status and timing"""
+    if not results:
+        return
+
+    width = max(len('Stage'), max(len(r['name']) for r in results))
+    icons = {'built': '🔨', 'skipped': '⚪', 'failed': '❌', 'blocked': '⛔', 'pending': '⏳'}
+
+    print(f"\n{'Stage':<{width}}  {'Status':<10} {'Time (s)':>9}")
+    print("-" * (width + 22))
+    for r in results:
+        print(f"{r['name']:<{width}}  {icons[r['status']]} {r['status']:<8} {r['seconds']:>9.3f}")
+    print("-" * (width + 22))
+
+    built = sum(1 for r in results if r['status'] == 'built')
+    total_time = sum(r['seconds'] for r in results)
+    print(f"{'TOTAL':<{width}}  {built}/{len(results)} built {total_time:>9.3f}")
+
+
+def _names(args, flag):
+    """Comma-separated stage names following a flag"""
+    if flag not in args:
+        return None
+    index = args.index(flag)
+    if index + 1 >= len(args):
+        raise ValueError(f"{flag} needs a comma-separated list of stages")
+    return [name for name in args[index + 1].split(',') if name]
+
+
+def main():
+    """Run the refresh pipeline"""
+    args = sys.argv[1:]
+    print("=== DATA REFRESH PIPELINE ===")
+
+    try:
+        stages = default_stages()
+        dependencies(stages)
+        names = [item['name'] for item in stages]
+        only = _names(args, '--only')
+        skip = _names(args, '--skip') or []
+        workers = int(_names(args, '--workers')[0]) if '--workers' in args else None
+        unknown = [name for name in (only or []) + skip if name not in names]
+        if unknown:
+            raise ValueError(f"Unknown stages: {', '.join(unknown)} (stages: {', '.join(names)})")
+    except (ImportError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if '--list' in args:
+        print_stages(stages)
+        return
+
+    selected = [name for name in (only or names) if name not in skip]
+    dry_run = '--dry-run' in args
+    results = run_pipeline(stages, force='--force' in args, selected=selected,
+                           workers=workers, dry_run=dry_run)
+    print_results(results)
+
+    failed = [r for r in results if r['status'] in ('failed', 'blocked')]
+    for r in failed:
+        if r['error']:
+            print(f"❌ {r['name']}: {r['error']}")
+        else:
+            print(f"⛔ {r['name']}: not run (an upstream stage failed)")
+
+    if failed:
+        print(f"\n=== PIPELINE FAILED ({len(failed)} stages) ===")
+        sys.exit(1)
+    print(f"\n=== PIPELINE {'PLAN' if dry_run else 'COMPLETE'} ===")
+
+
+if __name__ == "__main__":
+    main()
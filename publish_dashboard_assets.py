@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Dashboard Asset Publisher
+Writes content-hashed copies of the dashboard scripts plus gzip/brotli variants,
+points the <script src> references in index.html and html_dashboard/*.html at
+the hashed names, and records before/after sizes in a manifest.
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Scripts that get content-hashed filenames (long-lived cache entries)
+HASHED_ASSETS = [
+    'html_dashboard/dashboard_complete_enhanced.js',
+    'html_dashboard/dashboard_final.js',
+    'html_dashboard/shared-navigation.js'
+]
+
+# Static files served under fixed names but still precompressed
+STATIC_ASSETS = [
+    'html_dashboard/ey-report-styles.css',
+    'html_dashboard/eyds_can_logo.svg'
+]
+
+MANIFEST_FILE = 'html_dashboard/asset_manifest.json'
+HASH_LENGTH = 10
+
+
+def content_hash(data):
+    """Short SHA-256 digest used in hashed filenames"""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def hashed_name(path, digest):
+    """dashboard_final.js -> dashboard_final.<digest>.js"""
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.{digest}{ext}"
+
+
+def hashed_pattern(path):
+    """Regex matching any hashed copy of an asset (optionally compressed)"""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    return re.compile(rf'^{re.escape(stem)}\.[0-9a-f]{{{HASH_LENGTH}}}{re.escape(ext)}(\.gz|\.br)?$')
+
+
+def write_compressed(path, data):
+    """Write .gz (and .br when brotli is installed) next to path, return sizes"""
+    sizes = {'bytes': len(data)}
+
+    # mtime=0 keeps the gzip output deterministic between runs
+    gz_data = gzip.compress(data, compresslevel=9, mtime=0)
+    with open(path + '.gz', 'wb') as f:
+        f.write(gz_data)
+    sizes['gzip_bytes'] = len(gz_data)
+
+    if brotli is not None:
+        br_data = brotli.compress(data, quality=11)
+        with open(path + '.br', 'wb') as f:
+            f.write(br_data)
+        sizes['brotli_bytes'] = len(br_data)
+
+    return sizes
+
+
+def remove_stale_copies(path, keep):
+    """Delete hashed copies of an asset left over from earlier publishes"""
+    directory = os.path.dirname(path) or '.'
+    pattern = hashed_pattern(path)
+    keep_names = {os.path.basename(keep), os.path.basename(keep) + '.gz', os.path.basename(keep) + '.br'}
+    removed = 0
+
+    for name in os.listdir(directory):
+        if pattern.match(name) and name not in keep_names:
+            os.remove(os.path.join(directory, name))
+            removed += 1
+
+    return removed
+
+
+def publish_hashed_assets():
+    """Write hashed + compressed copies of each script, return manifest entries"""
+    entries = {}
+
+    for path in HASHED_ASSETS:
+        if not os.path.exists(path):
+            print(f"⚠️  Asset not found, skipping: {path}")
+            continue
+
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        target = hashed_name(path, content_hash(data))
+        with open(target, 'wb') as f:
+            f.write(data)
+
+        sizes = write_compressed(target, data)
+        removed = remove_stale_copies(path, target)
+
+        entries[path] = dict(sizes, hashed=target)
+        print(f"✅ {path} -> {os.path.basename(target)}" + (f" (removed {removed} stale)" if removed else ""))
+
+    return entries
+
+
+def rewrite_script_references(content, assets):
+    """Point every <script src> for a published asset at its hashed name"""
+    replacements = 0
+
+    for path, entry in assets.items():
+        stem, ext = os.path.splitext(os.path.basename(path))
+        hashed_basename = os.path.basename(entry['hashed'])
+        pattern = re.compile(
+            rf'(<script\b[^>]*\bsrc=["\'])([^"\']*?){re.escape(stem)}(?:\.[0-9a-f]{{{HASH_LENGTH}}})?{re.escape(ext)}(["\'])'
+        )
+        content, count = pattern.subn(lambda m: f"{m.group(1)}{m.group(2)}{hashed_basename}{m.group(3)}", content)
+        replacements += count
+
+    return content, replacements
+
+
+def publish_pages(assets):
+    """Rewrite script references in each page and precompress it"""
+    pages = ['index.html'] + sorted(glob.glob('html_dashboard/*.html'))
+    entries = {}
+
+    for page in pages:
+        if not os.path.exists(page):
+            continue
+
+        with open(page, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        new_content, replacements = rewrite_script_references(content, assets)
+        if new_content != content:
+            with open(page, 'w', encoding='utf-8') as f:
+                f.write(new_content)
+            print(f"📝 {page}: {replacements} script reference(s) updated")
+
+        entries[page] = write_compressed(page, new_content.encode('utf-8'))
+
+    return entries
+
+
+def publish_static_assets():
+    """Precompress fixed-name static files"""
+    entries = {}
+
+    for path in STATIC_ASSETS:
+        if not os.path.exists(path):
+            continue
+
+        with open(path, 'rb') as f:
+            entries[path] = write_compressed(path, f.read())
+
+    return entries
+
+
+def summarize(entries):
+    """Total raw and compressed bytes for a group of manifest entries"""
+    totals = {'bytes': 0, 'gzip_bytes': 0}
+    if brotli is not None:
+        totals['brotli_bytes'] = 0
+
+    for entry in entries.values():
+        for key in totals:
+            totals[key] += entry.get(key, 0)
+
+    return totals
+
+
+def print_size_table(manifest):
+    """Print before/after sizes for every published file"""
+    print(f"\n{'File':<55} {'Raw':>10} {'gzip':>10} {'brotli':>10}")
+    print("-" * 88)
+
+    for group in ['assets', 'static', 'pages']:
+        for path, entry in manifest[group].items():
+            br = f"{entry['brotli_bytes']:,}" if 'brotli_bytes' in entry else '-'
+            print(f"{path:<55} {entry['bytes']:>10,} {entry['gzip_bytes']:>10,} {br:>10}")
+
+    totals = manifest['totals']
+    br = f"{totals['brotli_bytes']:,}" if 'brotli_bytes' in totals else '-'
+    print("-" * 88)
+    print(f"{'TOTAL':<55} {totals['bytes']:>10,} {totals['gzip_bytes']:>10,} {br:>10}")
+
+
+def main():
+    """Publish hashed and precompressed dashboard assets"""
+    print("🚀 PUBLISHING DASHBOARD ASSETS")
+    print("=" * 50)
+
+    if brotli is None:
+        print("ℹ️  brotli not installed - writing gzip variants only")
+
+    assets = publish_hashed_assets()
+    static = publish_static_assets()
+    pages = publish_pages(assets)
+
+    all_entries = {}
+    all_entries.update(assets)
+    all_entries.update(static)
+    all_entries.update(pages)
+
+    manifest = {
+        'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'assets': assets,
+        'static': static,
+        'pages': pages,
+        'totals': summarize(all_entries)
+    }
+
+    with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    print_size_table(manifest)
+    print(f"\n📋 Manifest: {MANIFEST_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,11 @@ Shows immediate comparison between current iOS data and what's available online
 """
 
 import pandas as pd
-import requests
 import json
 from datetime import datetime
 
+from itunes_rss import get_json
+
 def get_app_store_preview(app_id, app_name):
     """Get current app store information"""
     print(f"\n🔍 Checking {app_name} on App Store...")
@@ -17,8 +18,7 @@ def get_app_store_preview(app_id, app_name):
     url = f"https://itunes.apple.com/ca/rss/customerreviews/page=1/id={app_id}/sortby=mostrecent/json"
     
     try:
-        response = requests.get(url, timeout=10)
-        data = response.json()
+        data = get_json(url)
         
         if 'feed' in data:
             # Get app info from first entry
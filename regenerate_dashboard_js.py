@@ -6,9 +6,15 @@ Regenerates dashboard_complete_enhanced.js and dashboard_final.js with filtered
 
 import pandas as pd
 import json
+import shutil
+import sys
 from datetime import datetime
 from collections import Counter
 
+from dashboard_data import SIDECAR_FILE
+from dashboard_js_writer import iter_review_records, stream_dashboard_js, write_dashboard_sidecar
+from review_records import as_float_or_zero, build_records, fill_missing, format_dates
+
 def calculate_metrics(df):
     """Calculate all dashboard metrics from filtered dataset"""
     
@@ -75,29 +81,29 @@ def calculate_metrics(df):
 def prepare_reviews_data(df):
     """Prepare reviews data for the dashboard"""
     
-    # Convert dataframe to list of dictionaries for JavaScript
-    reviews = []
-    for _, row in df.iterrows():
-        review = {
-            'id': row['review_id'],
-            'content': row['text'],  # Use 'text' column as main content
-            'rating': int(row['rating']),
-            'author': row['author'],
-            'date': row['date'].strftime('%Y-%m-%d') if pd.notna(row['date']) else '',
-            'app': row['app_name'],
-            'platform': row['platform'],
-            'sentiment': row['claude_sentiment'],
-            'sentiment_score': float(row['claude_sentiment_score']) if pd.notna(row['claude_sentiment_score']) else 0,
-            'category': row['primary_category'],
-            'summary': row['claude_summary'] if pd.notna(row['claude_summary']) else ''
-        }
-        reviews.append(review)
-    
-    return reviews
+    # Build whole columns at once, then convert to a list of dictionaries for JavaScript
+    return build_records({
+        'id': df['review_id'],
+        'content': df['text'],  # Use 'text' column as main content
+        'rating': df['rating'].astype(int),
+        'author': df['author'],
+        'date': format_dates(df['date']),
+        'app': df['app_name'],
+        'platform': df['platform'],
+        'sentiment': df['claude_sentiment'],
+        'sentiment_score': as_float_or_zero(df['claude_sentiment_score']),
+        'category': df['primary_category'],
+        'summary': fill_missing(df['claude_summary'], '')
+    })
 
 def generate_dashboard_js(metrics, reviews):
     """Generate the dashboard JavaScript file"""
     
+    return render_dashboard_js(metrics, json.dumps(reviews, indent=4))
+
+def render_dashboard_js(metrics, reviews_json):
+    """Render the dashboard JavaScript template around a serialized reviews array"""
+    
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     js_content = f"""// Complete Enhanced Dashboard Data with Technical and Service Analysis
@@ -118,7 +124,7 @@ const COMPLETE_DASHBOARD_DATA = {{
         "sentiment_by_platform": {json.dumps(metrics['sentiment_by_platform'], indent=12)},
         "sentiment_by_app": {json.dumps(metrics['sentiment_by_app'], indent=12)}
     }},
-    "reviews": {json.dumps(reviews, indent=4)}
+    "reviews": {reviews_json}
 }};
 
 // Export for global access
@@ -146,26 +152,30 @@ def main():
     print("🧮 Calculating dashboard metrics...")
     metrics = calculate_metrics(df)
     
-    # Prepare reviews data
-    print("📝 Preparing reviews data...")
-    reviews = prepare_reviews_data(df)
-    
-    # Generate JavaScript content
+    # Stream reviews straight to disk (--fast: compact orjson output)
+    compat = '--fast' not in sys.argv[1:]
     print("🔧 Generating JavaScript files...")
-    js_content = generate_dashboard_js(metrics, reviews)
     
     # Write dashboard_complete_enhanced.js
     enhanced_file = 'html_dashboard/dashboard_complete_enhanced.js'
-    with open(enhanced_file, 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    stream_dashboard_js(
+        enhanced_file,
+        render_dashboard_js,
+        metrics,
+        lambda: iter_review_records(df, prepare_reviews_data),
+        compat=compat
+    )
     print(f"✅ Updated: {enhanced_file}")
     
     # Write dashboard_final.js (same content for consistency)
     final_file = 'html_dashboard/dashboard_final.js'
-    with open(final_file, 'w', encoding='utf-8') as f:
-        f.write(js_content)
+    shutil.copyfile(enhanced_file, final_file)
     print(f"✅ Updated: {final_file}")
     
+    # Write the JSON sidecar read by dashboard_data.load_dashboard_data
+    write_dashboard_sidecar(SIDECAR_FILE, metrics, lambda: iter_review_records(df, prepare_reviews_data))
+    print(f"✅ Updated: {SIDECAR_FILE}")
+    
     # Print summary
     print(f"""
 🎯 Dashboard JS files regenerated successfully!
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Report Renderer
+Renders html_dashboard/templates/*.html into html_dashboard/ in one pass,
+replacing named metric placeholders such as {{ total_reviews|count }} with
+values from the metrics cube. Replaces the chains of re.sub number patches.
+
+Templates with front matter are report content and are assembled into the
+shared layout (see report_layout.py); pages are rendered in parallel.
+
+Usage:
+    python render_reports.py                 # metrics from filtered_dataset_metrics.json
+    python render_reports.py <reviews.csv>   # metrics computed from review data
+"""
+
+import glob
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from metrics_cube import metrics_for
+from report_layout import assemble_page, split_front_matter
+
+TEMPLATE_DIR = 'html_dashboard/templates'
+OUTPUT_DIR = 'html_dashboard'
+
+PLACEHOLDER = re.compile(r'\{\{\s*([a-z0-9_]+)(?:\|([a-z0-9_]+))?\s*\}\}')
+
+# Placeholder formats: {{ name|format }}
+FORMATS = {
+    'count': lambda value: f"{int(value):,}",
+    'pct': lambda value: f"{float(value):.1f}%",
+    'rating': lambda value: f"{float(value):.2f}",
+    'rating3': lambda value: f"{float(value):.3f}",
+    'ratio': lambda value: f"{float(value):.4f}",
+    'complement': lambda value: f"{1 - float(value):.4f}",
+    'share': lambda value: f"{float(value) * 100:.1f}%",
+    'raw': str
+}
+
+
+def render_template(text, metrics):
+    """Substitute every placeholder in text, raising KeyError for unknown metrics"""
+    def substitute(match):
+        name, fmt = match.group(1), match.group(2) or 'raw'
+        if name not in metrics:
+            raise KeyError(f"Unknown metric '{name}'")
+        if fmt not in FORMATS:
+            raise KeyError(f"Unknown format '{fmt}' for metric '{name}'")
+        return FORMATS[fmt](metrics[name])
+
+    return PLACEHOLDER.sub(substitute, text)
+
+
+def template_files(template_dir=TEMPLATE_DIR):
+    """All report templates, sorted for deterministic output"""
+    return sorted(glob.glob(os.path.join(template_dir, '*.html')))
+
+
+def render_page(text, metrics):
+    """Rendered page for one template (layout templates are assembled into the shell)"""
+    meta, body = split_front_matter(text)
+    rendered = render_template(body, metrics)
+    if meta is None:
+        return rendered
+
+    meta = {name: render_template(str(value), metrics) for name, value in meta.items()}
+    return assemble_page(meta, rendered)
+
+
+def _render_job(job):
+    """Process-pool entry point: render one template, write it if it changed"""
+    template_path, output_dir, metrics = job
+    with open(template_path, 'r', encoding='utf-8') as f:
+        rendered = render_page(f.read(), metrics)
+
+    output_path = os.path.join(output_dir, os.path.basename(template_path))
+    current = None
+    if os.path.exists(output_path):
+        with open(output_path, 'r', encoding='utf-8') as f:
+            current = f.read()
+
+    changed = rendered != current
+    if changed:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(rendered)
+    return output_path, changed
+
+
+def render_reports(metrics, template_dir=TEMPLATE_DIR, output_dir=OUTPUT_DIR, workers=None):
+    """
+    Render every template, writing only outputs whose content changed
+
+    Args:
+        workers: Process count (default: one per CPU, at most one per template)
+
+    Returns:
+        List of (output_path, changed) tuples
+    """
+    jobs = [(path, output_dir, metrics) for path in template_files(template_dir)]
+    if not jobs:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers == 1:
+        return [_render_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render_job, jobs))
+
+
+def main():
+    """Render all report templates from the current metrics"""
+    data_path = sys.argv[1] if len(sys.argv) > 1 else None
+
+    print("=== RENDERING REPORTS FROM TEMPLATES ===\n")
+    try:
+        metrics = metrics_for(data_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error loading metrics: {e}")
+        sys.exit(1)
+
+    print(f"Metrics source: {data_path or 'filtered_dataset_metrics.json'}")
+    print(f"  Total Reviews: {metrics['total_reviews']:,}")
+    print(f"  Rogers: {metrics['rogers_reviews']:,} | Bell: {metrics['bell_reviews']:,}")
+    print(f"  Average Rating: {metrics['average_rating']}\n")
+
+    try:
+        results = render_reports(metrics)
+    except (KeyError, ValueError) as e:
+        print(f"❌ Template error: {e}")
+        sys.exit(1)
+
+    for output_path, changed in results:
+        print(f"  {'✅ Rendered' if changed else '⚪ Unchanged'}: {output_path}")
+
+    print(f"\n=== RENDER COMPLETE ===")
+    print(f"{sum(1 for _, changed in results if changed)}/{len(results)} reports updated")
+
+
+if __name__ == "__main__":
+    main()
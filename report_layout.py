@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Report Layout
+Assembles report pages from the shared layout partials instead of splicing
+navigation, styles and footers into every finished report with regexes:
+
+    html_dashboard/layout/report.html   page shell (head, header, footer)
+    html_dashboard/shared-navigation.js nav markup (pre-rendered from its navHTML)
+    html_dashboard/ey-report-styles.css styles (only the rules a page uses,
+                                        inlined - no render-blocking request)
+
+A report template opts in with a YAML front matter block holding its title,
+header_title and header_subtitle; the rest of the template is its content.
+Shell slots are written {% name %} so they never collide with the metric
+placeholders render_reports.py fills.
+"""
+
+import functools
+import re
+
+import yaml
+
+LAYOUT_DIR = 'html_dashboard/layout'
+SHELL_FILE = f'{LAYOUT_DIR}/report.html'
+NAV_SCRIPT = 'html_dashboard/shared-navigation.js'
+STYLESHEET = 'html_dashboard/ey-report-styles.css'
+
+# Report pages highlight this tab (SharedNavigation.isReportPage)
+REPORT_TAB = 'reports'
+
+FRONT_MATTER = re.compile(r'\A---\n(.*?)\n---\n', re.DOTALL)
+SLOT = re.compile(r'\{%\s*([a-z_]+)\s*%\}')
+NAV_TEMPLATE = re.compile(r'const navHTML = `(.*?)`;', re.DOTALL)
+NAV_ACTIVE = re.compile(r"\$\{this\.currentTab === '([\w-]+)' \? 'active' : ''\}")
+PAGE_STYLE = re.compile(r'\s*<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+CSS_SPACING = re.compile(r'\s*([;:,{}])\s*')
+SELECTOR_NOISE = re.compile(r'::?[\w-]+(?:\([^)]*\))?|\[[^\]]*\]')
+SELECTOR_CLASS = re.compile(r'\.([\w-]+)')
+SELECTOR_ID = re.compile(r'#([\w-]+)')
+SELECTOR_TAG = re.compile(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)')
+
+HTML_CLASS = re.compile(r'\bclass\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+HTML_ID = re.compile(r'\bid\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+HTML_TAG = re.compile(r'<([a-zA-Z][\w-]*)')
+SCRIPT_CLASS = re.compile(r'classList\.(?:add|toggle|replace)\(\s*["\']([\w-]+)["\']')
+
+# At-rules that are kept whole / pruned rule by rule
+KEEP_AT_RULES = ('@font-face', '@keyframes', '@-webkit-keyframes', '@import', '@charset', '@page')
+NESTED_AT_RULES = ('@media', '@supports')
+
+
+def split_front_matter(text):
+    """(metadata dict or None, body) for a template"""
+    match = FRONT_MATTER.match(text)
+    if not match:
+        return None, text
+    return yaml.safe_load(match.group(1)) or {}, text[match.end():]
+
+
+def render_nav(script_text, active_tab=REPORT_TAB):
+    """Static nav markup from the navHTML template in shared-navigation.js"""
+    match = NAV_TEMPLATE.search(script_text)
+    if not match:
+        raise ValueError(f"No navHTML template found in {NAV_SCRIPT}")
+    return NAV_ACTIVE.sub(lambda m: 'active' if m.group(1) == active_tab else '', match.group(1)).strip()
+
+
+def parse_css(css):
+    """
+    Split a stylesheet into top-level blocks
+
+    Returns:
+        List of (prelude, body) pairs; body is a nested list for @media and
+        @supports, a string otherwise (None for statement at-rules like @import)
+    """
+    css = CSS_COMMENT.sub('', css)
+    blocks = []
+    pos = 0
+
+    while pos < len(css):
+        brace = css.find('{', pos)
+        prelude = css[pos:] if brace == -1 else css[pos:brace]
+
+        # Statement at-rules (@import ...;) before the next block
+        *statements, prelude = prelude.split(';')
+        blocks.extend((statement.strip(), None) for statement in statements if statement.strip())
+        if brace == -1:
+            break
+
+        depth = 0
+        for end in range(brace, len(css)):
+            if css[end] == '{':
+                depth += 1
+            elif css[end] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+
+        prelude = prelude.strip()
+        body = css[brace + 1:end]
+        blocks.append((prelude, parse_css(body) if prelude.startswith(NESTED_AT_RULES) else body))
+        pos = end + 1
+
+    return blocks
+
+
+def page_tokens(html):
+    """Class names, ids and tag names a page uses (including classes its scripts toggle)"""
+    classes = {name for value in HTML_CLASS.findall(html) for name in value.split()}
+    classes.update(SCRIPT_CLASS.findall(html))
+    ids = set(HTML_ID.findall(html))
+    tags = {tag.lower() for tag in HTML_TAG.findall(html)}
+    return classes, ids, tags
+
+
+def selector_used(selector, tokens):
+    """Whether every class, id and tag in a selector occurs on the page"""
+    classes, ids, tags = tokens
+    simple = SELECTOR_NOISE.sub('', selector)
+    return (all(name in classes for name in SELECTOR_CLASS.findall(simple))
+            and all(name in ids for name in SELECTOR_ID.findall(simple))
+            and all(tag.lower() in tags for tag in SELECTOR_TAG.findall(simple)))
+
+
+def _minify(body):
+    """Declarations with insignificant whitespace removed"""
+    return CSS_SPACING.sub(r'\1', ' '.join(body.split())).rstrip(';')
+
+
+def _prune(blocks, tokens):
+    """Serialized blocks whose selectors apply to the page"""
+    parts = []
+    for prelude, body in blocks:
+        if body is None:
+            parts.append(f'{prelude};')
+        elif isinstance(body, list):
+            inner = _prune(body, tokens)
+            if inner:
+                parts.append(f'{prelude}{{{inner}}}')
+        elif prelude.startswith('@'):
+            if prelude.startswith(KEEP_AT_RULES):
+                parts.append(f"{prelude}{{{_minify(body)}}}")
+        else:
+            selectors = [s.strip() for s in prelude.split(',') if selector_used(s.strip(), tokens)]
+            if selectors:
+                parts.append(f"{','.join(selectors)}{{{_minify(body)}}}")
+    return ''.join(parts)
+
+
+def critical_css(css, html):
+    """The rules of css that match something on the page, minified"""
+    return _prune(parse_css(css), page_tokens(html))
+
+
+@functools.lru_cache(maxsize=None)
+def load_layout(shell_file=SHELL_FILE, nav_script=NAV_SCRIPT, stylesheet=STYLESHEET):
+    """Shell, pre-rendered nav and stylesheet text (read once per process)"""
+    with open(shell_file, 'r', encoding='utf-8') as f:
+        shell = f.read()
+    with open(nav_script, 'r', encoding='utf-8') as f:
+        nav = render_nav(f.read())
+    with open(stylesheet, 'r', encoding='utf-8') as f:
+        css = f.read()
+    return shell, nav, css
+
+
+def fill_slots(shell, values):
+    """Substitute {% name %} slots, raising KeyError for unknown slots"""
+    def substitute(match):
+        if match.group(1) not in values:
+            raise KeyError(f"Unknown layout slot '{match.group(1)}'")
+        return values[match.group(1)]
+    return SLOT.sub(substitute, shell)
+
+
+def assemble_page(meta, content, layout=None):
+    """
+    Full report page from front matter and rendered content
+
+    Page-specific <style> blocks in the content move into the head, after the
+    shared styles, so they keep overriding them.
+    """
+    shell, nav, css = layout or load_layout()
+    page_styles = ''.join(match.strip() + '\n' for match in PAGE_STYLE.findall(content))
+    content = PAGE_STYLE.sub('', content).strip()
+
+    values = {
+        'title': meta['title'],
+        'header_title': meta['header_title'],
+        'header_subtitle': meta.get('header_subtitle', ''),
+        'nav': nav,
+        'content': content,
+        'page_styles': page_styles,
+        'critical_css': ''
+    }
+    # Critical CSS is chosen against the page as it will be served
+    values['critical_css'] = critical_css(css, fill_slots(shell, values))
+    return fill_slots(shell, values)
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Report Number Index
+Extracts every numeric token (with file, line and surrounding text) from the
+reports in html_dashboard/, README.md and the Markdown reports
+(MARKDOWN_REPORTS) into one index, then checks the index against the claims
+registry and the current metrics:
+
+    stale     a claim's previous (outdated) value still appears in a report
+    outdated  a report states a claimed value the data no longer supports
+    missing   a claim's source file doesn't state the claimed value
+
+The index is cached in .build/report_numbers.json; only reports whose content
+changed are re-parsed.
+
+Usage:
+    python report_numbers.py                 # current values from claims_report.json / metrics file
+    python report_numbers.py <reviews.csv>   # current values computed from review data
+"""
+
+import bisect
+import fnmatch
+import glob
+import html
+import json
+import os
+import re
+import sys
+
+import pandas as pd
+
+from build_graph import file_digest
+from markdown_reports import MARKDOWN_REPORTS
+from metrics_cube import METRICS_FILE, load_metrics
+from verify_claims import REPORT_FILE, load_registry, verify_claims
+
+INDEX_FILE = '.build/report_numbers.json'
+REPORT_GLOBS = ['html_dashboard/*.html', 'README.md'] + MARKDOWN_REPORTS
+CONTEXT_CHARS = 40
+
+# 10,103 | 2.64 | 99.6% | 12785 - not part of a word, version or longer number
+NUMBER = re.compile(r'(?<![\w.,])(\d{1,3}(?:,\d{3})+|\d+)(\.\d+)?(\s?%)?(?![\w]|[.,]\d)')
+
+# Markup whose text is not report content
+HTML_SKIP = re.compile(r'<script\b.*?</script>|<style\b.*?</style>|<!--.*?-->|<[^>]+>', re.DOTALL | re.IGNORECASE)
+
+
+def report_files(patterns=REPORT_GLOBS):
+    """All indexed reports, sorted"""
+    return sorted({path for pattern in patterns for path in glob.glob(pattern)})
+
+
+def readable_text(path, content):
+    """Report text with markup removed, keeping line numbers intact"""
+    if not path.endswith('.html'):
+        return content
+    text = HTML_SKIP.sub(lambda m: '\n' * m.group(0).count('\n') or ' ', content)
+    return html.unescape(text)
+
+
+def extract_numbers(text):
+    """
+    Every numeric token in text
+
+    Returns:
+        List of {'raw', 'value', 'percent', 'line', 'context'} dicts
+    """
+    line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+    numbers = []
+
+    for match in NUMBER.finditer(text):
+        whole, fraction, percent = match.groups()
+        context = text[max(0, match.start() - CONTEXT_CHARS):match.end() + CONTEXT_CHARS]
+        numbers.append({
+            'raw': match.group(0),
+            'value': float(whole.replace(',', '') + (fraction or '')),
+            'percent': percent is not None,
+            'line': bisect.bisect_right(line_starts, match.start()),
+            'context': ' '.join(context.split())
+        })
+
+    return numbers
+
+
+def build_index(paths=None, index_file=INDEX_FILE):
+    """
+    Number index for all reports, re-parsing only files whose content changed
+
+    Returns:
+        {path: {'digest', 'numbers'}}
+    """
+    paths = report_files() if paths is None else paths
+
+    cached = {}
+    if os.path.exists(index_file):
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = {}
+
+    index = {}
+    for path in paths:
+        digest = file_digest(path)
+        if cached.get(path, {}).get('digest') == digest:
+            index[path] = cached[path]
+            continue
+
+        with open(path, 'r', encoding='utf-8') as f:
+            numbers = extract_numbers(readable_text(path, f.read()))
+        index[path] = {'digest': digest, 'numbers': numbers}
+
+    os.makedirs(os.path.dirname(index_file), exist_ok=True)
+    with open(index_file, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+
+    return index
+
+
+def token_matches(token, value, fmt):
+    """Whether an indexed token states value in the claim's format"""
+    if fmt == 'pct':
+        return token['percent'] and round(token['value'], 1) == round(float(value), 1)
+    if token['percent']:
+        return False
+    if fmt == 'count':
+        return token['value'] == float(value)
+    if fmt == 'rating':
+        return round(token['value'], 2) == round(float(value), 2)
+    return token['value'] == float(value)
+
+
+def find_value(index, value, fmt, paths=None):
+    """(path, token) for every occurrence of value in the index"""
+    paths = index.keys() if paths is None else paths
+    return [(path, token) for path in paths if path in index
+            for token in index[path]['numbers'] if token_matches(token, value, fmt)]
+
+
+def current_values(claims, data_path=None):
+    """
+    Current value per claim id, from the metrics cube
+
+    With a review CSV every claim is evaluated; otherwise values come from the
+    last claims_report.json, then from the headline metrics file.
+    """
+    if data_path:
+        results = verify_claims(pd.read_csv(data_path))
+        return {r['id']: r['actual'] for r in results if r['status'] != 'error'}
+
+    values = {}
+    if os.path.exists(REPORT_FILE):
+        with open(REPORT_FILE, 'r', encoding='utf-8') as f:
+            values = {r['id']: r['actual'] for r in json.load(f)['claims'] if r['actual'] is not None}
+
+    if os.path.exists(METRICS_FILE):
+        metrics = load_metrics()
+        for claim in claims:
+            if claim['id'] not in values and claim['metric'].strip() in metrics:
+                values[claim['id']] = metrics[claim['metric'].strip()]
+
+    return values
+
+
+def check_index(index, claims, values, historical=()):
+    """
+    Check the reports against the claims and current values
+
+    Reports matching a historical glob pattern are not checked for stale values.
+
+    Returns:
+        List of {'kind', 'claim', 'path', 'line', 'raw', 'context', 'message'} dicts
+    """
+    issues = []
+    checked = [path for path in index if not any(fnmatch.fnmatch(path, p) for p in historical)]
+
+    def issue(kind, claim, message, path=None, token=None):
+        issues.append({
+            'kind': kind,
+            'claim': claim['id'],
+            'path': path,
+            'line': token['line'] if token else None,
+            'raw': token['raw'] if token else None,
+            'context': token['context'] if token else None,
+            'message': message
+        })
+
+    for claim in claims:
+        fmt = claim.get('format', 'raw')
+        sources = claim.get('sources', [])
+
+        for previous in claim.get('previous', []):
+            for path, token in find_value(index, previous, fmt, checked):
+                issue('stale', claim, f"outdated value {token['raw']} (now {claim['expected']})", path, token)
+
+        current = values.get(claim['id'])
+        if current is not None and abs(current - float(claim['expected'])) > claim.get('tolerance', 0) + 1e-9:
+            for path, token in find_value(index, claim['expected'], fmt, sources):
+                issue('outdated', claim, f"states {token['raw']} but the data gives {current:g}", path, token)
+
+        for path in sources:
+            if path in index and not find_value(index, claim['expected'], fmt, [path]):
+                issue('missing', claim, f"does not state {claim['expected']}", path)
+
+    return issues
+
+
+def print_issues(issues):
+    """Issues grouped by file"""
+    icons = {'stale': '❌', 'outdated': '❌', 'missing': '⚠️ '}
+    for path in sorted({i['path'] for i in issues}):
+        print(f"📄 {path}")
+        for i in (i for i in issues if i['path'] == path):
+            location = f"line {i['line']}: " if i['line'] else ''
+            print(f"  {icons[i['kind']]} [{i['claim']}] {location}{i['message']}")
+            if i['context']:
+                print(f"      …{i['context']}…")
+
+
+def main():
+    """Index all reports and check them against the claims registry"""
+    data_path = sys.argv[1] if len(sys.argv) > 1 else None
+
+    print("=== REPORT NUMBER INDEX ===\n")
+    registry = load_registry()
+    index = build_index()
+    tokens = sum(len(entry['numbers']) for entry in index.values())
+    print(f"Indexed {tokens:,} numbers in {len(index)} reports ({INDEX_FILE})\n")
+
+    values = current_values(registry['claims'], data_path)
+    issues = check_index(index, registry['claims'], values, registry['historical'])
+    print_issues(issues)
+
+    errors = sum(1 for i in issues if i['kind'] != 'missing')
+    print(f"\n=== {errors} errors, {len(issues) - errors} warnings ===")
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
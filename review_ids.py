@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Review IDs
+One canonical ID per review, however it was scraped. The same review has
+carried different IDs over time:
+
+    - the store's own id (iTunes feed id.label, e.g. 12625891625; Google Play
+      reviewId, a UUID), from ios_refresh_scraper.py and review_scraper.py
+    - MD5 of author + date + rating, from ios_rescrape_*.py
+    - the ids of older datasets, in either scheme
+
+A canonical ID (rv_ + 16 hex digits) is derived from the store's id when the
+review has one, and from its normalized content (platform, app, author, text)
+when it doesn't. review_id_registry.csv maps every ID a review has been seen
+under, plus its content key, to the canonical ID, so a review re-scraped
+under another scheme resolves to the same ID with one dictionary lookup
+instead of fuzzy matching. Aliases are never remapped once registered.
+
+MD5 ids are registered as aliases only as a row's own review_id, and only
+looked up for rows without text: author + date + rating is shared by
+different reviews (two "A Google user" 1-star reviews on the same day, or a
+Bell and a Rogers review), so it can't tell them apart.
+
+Usage:
+    from review_ids import ReviewIdRegistry, add_canonical_ids
+    add_canonical_ids(existing_df, new_df)      # canonical_id column on each, registry saved
+
+    registry = ReviewIdRegistry()
+    registry.lookup('12625891625')              # canonical ID of any historical ID
+
+    python review_ids.py <reviews.csv> [...]           # register datasets, report how their IDs resolved
+"""
+
+import hashlib
+import os
+import re
+import sys
+import tempfile
+
+import pandas as pd
+
+from near_duplicates import normalize_text
+
+REGISTRY_FILE = 'review_id_registry.csv'
+PREFIX = 'rv_'
+
+# Store review ids: iTunes ids are numeric, Google Play ids are UUIDs (older ones 'gp:...')
+STORE_ID_PATTERNS = {
+    'itunes': re.compile(r'^\d{6,}$'),
+    'google_play': re.compile(r'^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|gp:\S+)$', re.I)
+}
+PLATFORM_STORES = {'iOS': 'itunes', 'Android': 'google_play'}
+
+# ios_rescrape_*.py ids: MD5 hex of author + date + rating
+LEGACY_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+# read_csv dtypes keeping IDs as text (numeric store ids would otherwise become numbers)
+ID_DTYPES = {'review_id': str, 'store_review_id': str, 'canonical_id': str}
+
+
+def _text(value):
+    return '' if pd.isna(value) else str(value).strip()
+
+
+def _digest(key):
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def store_id(review):
+    """'store:id' of the review's store-native id, or None"""
+    store = _text(review.get('store')) or PLATFORM_STORES.get(_text(review.get('platform')), '')
+    native = _text(review.get('store_review_id'))
+    if native and store:
+        return f"{store}:{native}"
+    review_id = _text(review.get('review_id'))
+    for name, pattern in STORE_ID_PATTERNS.items():
+        if pattern.match(review_id):
+            return f"{name}:{review_id}"
+    return None
+
+
+def content_key(review):
+    """'content:<hash>' of platform, app, author and normalized text, or None without an author or text"""
+    author, text = _text(review.get('author')), normalize_text(review.get('text'))
+    if not author or not text:
+        return None
+    key = '\x1f'.join([_text(review.get('platform')), _text(review.get('app_name')), author, text])
+    return f"content:{_digest(key)}"
+
+
+class ReviewIdRegistry:
+    """
+    Every historical ID (and content key) of a review, mapped to its canonical ID
+
+    Stored as a two-column CSV (alias, canonical_id); save() writes it
+    atomically.
+    """
+
+    def __init__(self, path=REGISTRY_FILE):
+        self.path = path
+        self.aliases = {}
+        if path and os.path.exists(path):
+            table = pd.read_csv(path, dtype=str, keep_default_na=False)
+            self.aliases = dict(zip(table['alias'], table['canonical_id']))
+        # Canonical IDs that already have a store id: another store id can't join them
+        self.with_store_id = {canonical for alias, canonical in self.aliases.items()
+                              if alias.split(':', 1)[0] in STORE_ID_PATTERNS}
+        self.added = 0
+
+    def __len__(self):
+        return len(self.aliases)
+
+    def lookup(self, review_id):
+        """Canonical ID of any ID the review was seen under (or a canonical ID itself), or None"""
+        review_id = _text(review_id)
+        if review_id.startswith(PREFIX):
+            return review_id
+        return self.aliases.get(review_id) or self.aliases.get(store_id({'review_id': review_id}) or '')
+
+    def resolve(self, review):
+        """
+        (canonical ID, how it was found) for a review dict, registering its aliases
+
+        How: 'store', 'id', 'legacy' (an MD5 review_id) or 'content' when an
+        alias was already registered, 'new' when the ID was derived now.
+        """
+        native = store_id(review)
+        review_id = _text(review.get('review_id'))
+        if native and native.endswith(f":{review_id}"):
+            review_id = ''
+        key = content_key(review)
+        id_source = 'legacy' if LEGACY_ID_PATTERN.match(review_id) else 'id'
+        candidates = [('store', native), (id_source, review_id), ('content', key)]
+        candidates = [(how, alias) for how, alias in candidates if alias]
+
+        canonical, how = None, 'new'
+        for source, alias in candidates:
+            # Different reviews share an MD5 id; rows with text are matched by their content
+            if source == 'legacy' and key:
+                continue
+            found = review_id if source == 'id' and review_id.startswith(PREFIX) else self.aliases.get(alias)
+            # A review with a store id only takes over content-derived IDs, not another review's
+            if found and not (native and source != 'store' and found in self.with_store_id):
+                canonical, how = found, source
+                break
+        if canonical is None:
+            # Derived from the most stable key: the store id, else the content, else any id
+            seeds = dict(candidates)
+            seed = seeds.get('store') or seeds.get('content') or seeds.get('legacy') or seeds.get('id')
+            canonical = PREFIX + _digest(seed or repr(sorted(review.items(), key=str)))
+
+        for _, alias in candidates:
+            if alias not in self.aliases and not alias.startswith(PREFIX):
+                self.aliases[alias] = canonical
+                self.added += 1
+        if native:
+            self.with_store_id.add(canonical)
+        return canonical, how
+
+    def assign(self, df, report=None):
+        """
+        Canonical ID of every row of df (registering new aliases)
+
+        Args:
+            report: Optional dict; counts of how the IDs were found are added to it
+
+        Returns:
+            Series of canonical IDs on df's index
+        """
+        columns = [c for c in ['review_id', 'store_review_id', 'store', 'platform', 'app_name', 'author',
+                               'text', 'date', 'rating'] if c in df.columns]
+        ids = []
+        for review in df[columns].to_dict('records'):
+            canonical, how = self.resolve(review)
+            ids.append(canonical)
+            if report is not None:
+                report[how] = report.get(how, 0) + 1
+        return pd.Series(ids, index=df.index, dtype=object)
+
+    def save(self):
+        """Write the registry (sorted, atomically)"""
+        table = pd.DataFrame(sorted(self.aliases.items()), columns=['alias', 'canonical_id'])
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                table.to_csv(f, index=False)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def add_canonical_ids(*dfs, path=REGISTRY_FILE):
+    """
+    Add a canonical_id column to each DataFrame (in place) and save the registry
+
+    Returns:
+        The registry
+    """
+    registry = ReviewIdRegistry(path)
+    for df in dfs:
+        df['canonical_id'] = registry.assign(df)
+    registry.save()
+    return registry
+
+
+def main():
+    """Register datasets' review IDs and report how they resolved"""
+    paths = sys.argv[1:]
+    if not paths:
+        print("❌ Usage: python review_ids.py <reviews.csv> [...]")
+        sys.exit(1)
+
+    print("=== REVIEW ID REGISTRY ===")
+    registry = ReviewIdRegistry()
+    print(f"📂 {REGISTRY_FILE}: {len(registry):,} aliases")
+
+    for path in paths:
+        try:
+            df = pd.read_csv(path, dtype=ID_DTYPES)
+        except OSError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        report = {}
+        ids = registry.assign(df, report)
+        found = ', '.join(f"{how} {report[how]:,}" for how in ['store', 'id', 'legacy', 'content', 'new']
+                          if report.get(how))
+        print(f"\n📄 {path}: {len(df):,} reviews, {ids.nunique():,} canonical IDs")
+        print(f"   Resolved by: {found}")
+
+    registry.save()
+    print(f"\n💾 Saved {len(registry):,} aliases ({registry.added:,} new) to {REGISTRY_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Review Matcher
+Matches existing iOS reviews to freshly scraped ones so the scraped dates can
+be carried over (ios_date_updater*.py). Only pairs that share a block are
+scored, so matching is near-linear instead of every existing review against
+every new one:
+
+    Pass 1  exact   the same canonical_id (review_ids.py), when both sides
+                    have one; same app, author and rating with the same
+                    normalized text: one merge on (app_name, author, rating,
+                    text_hash); then, for the rest, text more than 90% similar
+                    block: (app_name, author, rating)
+    Pass 2  fuzzy   same app, rating within 1, text/title similarity above 70%
+                    candidates: the (app_name, author) block, and the
+                    MAX_CANDIDATES most similar texts the near-duplicate
+                    engine (near_duplicates.py, MinHash/LSH) finds above
+                    CANDIDATE_THRESHOLD Jaccard similarity
+                    assignment: the scored pairs form a sparse graph; each
+                    connected block gets the one-to-one assignment with the
+                    highest total score (sparse Hungarian), so the result
+                    doesn't depend on row order and no review takes a new
+                    one that another matches better
+
+Re-scraped reviews mostly come back verbatim, so the hash join settles most
+matches and only its residue is scored. Normalized text is lowercase words
+without punctuation.
+
+Scoring the fuzzy candidates is sharded across a process pool (workers). The
+reviews' titles and texts are sent to each worker once; shards carry only
+positions, and the result is the same for any worker count.
+
+A fuzzy match is flagged ambiguous when another candidate of either review
+scores within AMBIGUITY_MARGIN of it; match_report() summarizes confidence
+and ambiguity for review.
+
+Usage:
+    from review_matcher import match_reviews, write_match_report
+    matches, unmatched_existing, unmatched_new = match_reviews(existing_ios_df, new_ios_df)
+    write_match_report(matches, 'ios_match_report.json')
+"""
+
+import heapq
+import json
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from difflib import SequenceMatcher
+
+import numpy as np
+import pandas as pd
+
+from near_duplicates import normalize_texts, similar_pairs
+
+# Character-shingle Jaccard similarity (estimated) that makes a fuzzy candidate
+CANDIDATE_THRESHOLD = 0.3
+MAX_CANDIDATES = 10
+EXACT_THRESHOLD = 0.9
+FUZZY_THRESHOLD = 0.7
+AMBIGUITY_MARGIN = 0.05
+CONFIDENCE_BINS = [0.7, 0.8, 0.9, 1.0]
+# Fewer candidate pairs than this are scored in-process
+PARALLEL_MIN_PAIRS = 5_000
+SHARDS_PER_WORKER = 4
+
+def similarity_score(str1, str2, floor=None):
+    """
+    Calculate similarity between two strings
+
+    With a floor, pairs whose cheap upper bounds (real_quick_ratio,
+    quick_ratio) can't exceed it score 0 without the full comparison.
+    """
+    if pd.isna(str1) or pd.isna(str2):
+        return 0.0
+    str1, str2 = str(str1), str(str2)
+    if str1 == str2:
+        return 1.0
+    matcher = SequenceMatcher(None, str1, str2)
+    if floor is not None and (matcher.real_quick_ratio() <= floor or matcher.quick_ratio() <= floor):
+        return 0.0
+    return matcher.ratio()
+
+
+def combined_score(existing, new, floor=None):
+    """
+    Text similarity, weighted 70/30 with title similarity when the titles overlap
+
+    With a floor, a score that can't exceed it may come back as 0.
+    """
+    title_sim = similarity_score(existing['title'], new['title'])
+    text_floor = None
+    if floor is not None:
+        text_floor = (floor - title_sim * 0.3) / 0.7 if title_sim > 0 else floor
+    text_sim = similarity_score(existing['text'], new['text'], text_floor)
+    return (text_sim * 0.7 + title_sim * 0.3) if title_sim > 0 else text_sim
+
+
+def scored_candidates(review, candidates, new):
+    """(position, score) of the candidates scoring above FUZZY_THRESHOLD"""
+    scored = []
+    for pos in candidates:
+        score = combined_score(review, new[pos], FUZZY_THRESHOLD)
+        if score > FUZZY_THRESHOLD:
+            scored.append((pos, score))
+    return scored
+
+
+_shared = {}
+
+
+def _share(existing, new):
+    """Process-pool initializer: the read-only title/text records every shard scores"""
+    _shared['existing'], _shared['new'] = existing, new
+
+
+def _score_job(shard):
+    """Process-pool entry point: scored_candidates for each (existing position, candidates) of a shard"""
+    return [scored_candidates(_shared['existing'][i], candidates, _shared['new']) for i, candidates in shard]
+
+
+def _shards(jobs, count):
+    """Consecutive runs of jobs with about the same number of candidates each"""
+    ends = np.cumsum([len(candidates) for _, candidates in jobs])
+    cuts = np.searchsorted(ends, ends[-1] * np.arange(1, count) / count, side='right')
+    bounds = [0] + sorted(set(cuts.tolist()) - {0, len(jobs)}) + [len(jobs)]
+    return [jobs[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+def score_candidates(existing, new, jobs, workers=None):
+    """
+    scored_candidates of every job, in parallel
+
+    Args:
+        existing, new: Records by position (title and text are read)
+        jobs: List of (existing position, candidate new positions)
+        workers: Process count (default: one per CPU); small inputs are
+            scored in-process
+
+    Returns:
+        List of (position, score) pairs per job, in job order
+    """
+    pairs = sum(len(candidates) for _, candidates in jobs)
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1 or pairs < PARALLEL_MIN_PAIRS:
+        return [scored_candidates(existing[i], candidates, new) for i, candidates in jobs]
+
+    # Only the fields scoring reads, and only for the reviews some job needs, go to the workers
+    def fields(records, positions):
+        return {pos: {'title': records[pos]['title'], 'text': records[pos]['text']} for pos in positions}
+
+    shared = (fields(existing, {i for i, _ in jobs}),
+              fields(new, {pos for _, candidates in jobs for pos in candidates}))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_share, initargs=shared) as pool:
+        shards = pool.map(_score_job, _shards(jobs, workers * SHARDS_PER_WORKER))
+        return [scored for shard in shards for scored in shard]
+
+
+def max_weight_matching(edges):
+    """
+    One-to-one matching of a sparse bipartite graph with the highest total weight
+
+    Hungarian algorithm as successive shortest augmenting paths: each row
+    in turn runs Dijkstra over the edges only (reduced costs kept
+    non-negative by row and column potentials), so easy blocks cost little
+    more than their edges. Every row also has a private zero-weight column,
+    so rows may stay unmatched.
+
+    Args:
+        edges: List of (row, column, weight) with positive weights
+
+    Returns:
+        List of matched (row, column, weight), by row
+    """
+    rows = sorted({row for row, _, _ in edges})
+    columns = sorted({column for _, column, _ in edges})
+    row_of = {row: k for k, row in enumerate(rows)}
+    column_of = {column: k for k, column in enumerate(columns)}
+    n, m = len(rows), len(columns)
+
+    # Costs are negative weights; column m + i is row i staying unmatched. Free
+    # columns keep a zero potential, so paths to any of them compare fairly.
+    adjacency = [[] for _ in range(n)]
+    for row, column, weight in edges:
+        adjacency[row_of[row]].append((column_of[column], -weight))
+    for i in range(n):
+        adjacency[i].append((m + i, 0.0))
+    u = [min(cost for _, cost in adjacency[i]) for i in range(n)]
+    v = [0.0] * (m + n)
+    owner = [-1] * (m + n)
+    column_of_row = [-1] * n
+
+    for start in range(n):
+        dist, via, heap = {}, {}, []
+        reached_rows, reached_columns, final = [(start, 0.0)], [], set()
+
+        def relax(i, d):
+            for j, cost in adjacency[i]:
+                candidate = d + cost - u[i] - v[j]
+                if candidate < dist.get(j, np.inf):
+                    dist[j], via[j] = candidate, i
+                    heapq.heappush(heap, (candidate, j))
+
+        relax(start, 0.0)
+        while True:
+            d, j = heapq.heappop(heap)
+            if j in final or d > dist[j]:
+                continue
+            final.add(j)
+            if owner[j] < 0:
+                break
+            reached_columns.append(j)
+            reached_rows.append((owner[j], d))
+            relax(owner[j], d)
+
+        # Potentials keep the new matching's edges tight and every reduced cost non-negative
+        for i, d_i in reached_rows:
+            u[i] += d - d_i
+        for k in reached_columns:
+            v[k] += dist[k] - d
+
+        # Flip the path
+        while True:
+            i = via[j]
+            previous = column_of_row[i]
+            owner[j], column_of_row[i] = i, j
+            if i == start:
+                break
+            j = previous
+
+    weights = {(row_of[row], column_of[column]): weight for row, column, weight in edges}
+    return [(rows[i], columns[j], weights[i, j]) for i, j in enumerate(column_of_row) if j < m]
+
+
+def assign_blocks(edges):
+    """
+    Optimal one-to-one matches of a sparse (existing, new, score) edge list
+
+    Each connected block is solved on its own; a block that is a single
+    edge needs no solving.
+
+    Returns:
+        List of (existing, new, score), by existing position
+    """
+    parent = {}
+
+    def root(node):
+        parent.setdefault(node, node)
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for i, pos, _ in edges:
+        a, b = root(('existing', i)), root(('new', pos))
+        if a != b:
+            parent[max(a, b)] = min(a, b)
+
+    blocks = defaultdict(list)
+    for edge in edges:
+        blocks[root(('existing', edge[0]))].append(edge)
+
+    assigned = []
+    for block in blocks.values():
+        assigned.extend(block if len(block) == 1 else max_weight_matching(block))
+    return sorted(assigned)
+
+
+def match_report(matches):
+    """
+    Match counts, confidence distribution and ambiguous matches
+
+    Returns:
+        Dict with exact, fuzzy and ambiguous counts, confidence counts per
+        CONFIDENCE_BINS interval (and 'exact 1.0'), and the ambiguous
+        matches
+    """
+    confidence = pd.Series([m['confidence'] for m in matches], dtype=float)
+    exact = confidence == 1.0
+    binned = pd.cut(confidence[~exact], CONFIDENCE_BINS, include_lowest=False)
+    distribution = {f"{interval.left:.1f}-{interval.right:.1f}": int(count)
+                    for interval, count in binned.value_counts(sort=False).items()}
+    distribution['1.0'] = int(exact.sum())
+    ambiguous = [m for m in matches if m.get('ambiguous')]
+    return {
+        'exact': sum(m['match_type'] == 'exact' for m in matches),
+        'fuzzy': sum(m['match_type'] == 'fuzzy' for m in matches),
+        'ambiguous': len(ambiguous),
+        'confidence': distribution,
+        'ambiguous_matches': [{key: m.get(key) for key in ['existing_idx', 'new_idx', 'confidence', 'runner_up']}
+                              for m in ambiguous]
+    }
+
+
+def write_match_report(matches, path):
+    """Save match_report() as JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(match_report(matches), f, indent=2, default=str)
+
+
+def print_match_report(report, log=print):
+    """Confidence distribution and ambiguity of a match_report()"""
+    log(f"\n   📈 Match confidence:")
+    for interval, count in report['confidence'].items():
+        log(f"      {interval:>8}: {count:,}")
+    log(f"   ⚠️  Ambiguous fuzzy matches (runner-up within {AMBIGUITY_MARGIN:.0%}): {report['ambiguous']:,}")
+
+
+def _keyed(df):
+    """Positions of the rows with a known app, author, rating and text, with their text hash"""
+    normalized = normalize_texts(df['text'])
+    frame = pd.DataFrame({
+        'app_name': df['app_name'].to_numpy(),
+        'author': df['author'].to_numpy(),
+        'rating': pd.to_numeric(df['rating'], errors='coerce').to_numpy(dtype=float),
+        'text_hash': pd.util.hash_pandas_object(normalized, index=False).to_numpy(),
+        'position': np.arange(len(df))
+    })
+    return frame[frame[['app_name', 'author', 'rating']].notna().all(axis=1).to_numpy()
+                 & (normalized != '').to_numpy()]
+
+
+def hash_join(existing_df, new_df):
+    """
+    Exact matches: same app, author, rating and normalized text, as one merge
+
+    Duplicates of a key pair up in order (the first existing with the first
+    new one, and so on).
+
+    Returns:
+        (existing positions, new positions) arrays, in existing order
+    """
+    keys = ['app_name', 'author', 'rating', 'text_hash']
+    sides = []
+    for df in (existing_df, new_df):
+        frame = _keyed(df.reindex(columns=['app_name', 'author', 'rating', 'text']))
+        frame['occurrence'] = frame.groupby(keys, sort=False).cumcount()
+        sides.append(frame)
+    pairs = sides[0].merge(sides[1], on=keys + ['occurrence'], suffixes=('_existing', '_new'))
+    pairs = pairs.sort_values('position_existing')
+    return pairs['position_existing'].to_numpy(), pairs['position_new'].to_numpy()
+
+
+def id_join(existing_df, new_df):
+    """
+    Matches by canonical_id (the first review of each ID on either side)
+
+    Returns:
+        (existing positions, new positions) arrays, in existing order; empty
+        unless both frames have a canonical_id column
+    """
+    if 'canonical_id' not in existing_df.columns or 'canonical_id' not in new_df.columns:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    sides = []
+    for df in (existing_df, new_df):
+        frame = pd.DataFrame({'canonical_id': df['canonical_id'].to_numpy(), 'position': np.arange(len(df))})
+        sides.append(frame.dropna().drop_duplicates('canonical_id'))
+    pairs = sides[0].merge(sides[1], on='canonical_id', suffixes=('_existing', '_new'))
+    pairs = pairs.sort_values('position_existing')
+    return pairs['position_existing'].to_numpy(), pairs['position_new'].to_numpy()
+
+
+def _records(df, positions):
+    """Row dicts of the matched fields by position (missing columns read as NaN)"""
+    columns = ['author', 'rating', 'app_name', 'text', 'title', 'date']
+    rows = df.reindex(columns=columns).iloc[positions].to_dict('records')
+    return dict(zip(positions, rows))
+
+
+def _known(*values):
+    return not any(pd.isna(value) for value in values)
+
+
+def match_reviews(existing_ios_df, new_ios_df, verbose=True, workers=None):
+    """
+    Match existing reviews with new ones based on multiple criteria
+
+    Args:
+        workers: Processes scoring fuzzy candidates (see score_candidates)
+
+    Returns:
+        (matches, unmatched_existing, unmatched_new): match dicts with
+        existing_idx (index label), new_idx (position), match_type,
+        confidence and date_to_add; unmatched existing index labels in order;
+        unmatched new positions in order
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
+    log("\n🔍 Matching existing iOS reviews with new data...")
+
+    existing_labels = list(existing_ios_df.index)
+    new_dates = new_ios_df['date'].tolist() if 'date' in new_ios_df.columns else [np.nan] * len(new_ios_df)
+
+    matches = []
+    matched_existing = set()
+    unmatched_new = set(range(len(new_ios_df)))
+
+    # Pass 1: the same canonical ID, then exact author + rating + app with the same
+    # normalized text, as hash joins ...
+    log("\n   Pass 1: Exact author + rating + app matches...")
+    id_existing, id_new = id_join(existing_ios_df, new_ios_df)
+    rest_existing = np.setdiff1d(np.arange(len(existing_labels)), id_existing)
+    rest_new = np.setdiff1d(np.arange(len(new_ios_df)), id_new)
+    text_existing, text_new = hash_join(existing_ios_df.iloc[rest_existing], new_ios_df.iloc[rest_new])
+    by_id = list(zip(id_existing.tolist(), id_new.tolist()))
+    joined = sorted(by_id + list(zip(rest_existing[text_existing].tolist(), rest_new[text_new].tolist())))
+    for i, pos in joined:
+        matches.append({
+            'existing_idx': existing_labels[i],
+            'new_idx': int(pos),
+            'match_type': 'exact',
+            'confidence': 1.0,
+            'date_to_add': new_dates[pos]
+        })
+        matched_existing.add(int(i))
+        unmatched_new.discard(int(pos))
+    hashed = len(matches)
+
+    # ... then only the residue is scored
+    existing = _records(existing_ios_df, [i for i in range(len(existing_labels)) if i not in matched_existing])
+    new = _records(new_ios_df, sorted(unmatched_new))
+
+    # The first remaining new review in the author block with similar text
+    exact_index = defaultdict(list)
+    for pos, review in new.items():
+        if _known(review['app_name'], review['author'], review['rating']):
+            exact_index[(review['app_name'], review['author'], float(review['rating']))].append(pos)
+
+    for i, review in existing.items():
+        if not _known(review['app_name'], review['author'], review['rating']):
+            continue
+        for pos in exact_index.get((review['app_name'], review['author'], float(review['rating'])), ()):
+            if pos not in unmatched_new:
+                continue
+            text_sim = similarity_score(review['text'], new[pos]['text'], EXACT_THRESHOLD)
+            if text_sim > EXACT_THRESHOLD:
+                matches.append({
+                    'existing_idx': existing_labels[i],
+                    'new_idx': pos,
+                    'match_type': 'exact',
+                    'confidence': text_sim,
+                    'date_to_add': new[pos]['date']
+                })
+                unmatched_new.discard(pos)
+                matched_existing.add(i)
+                break
+
+    log(f"   ✅ Found {len(matches)} exact matches ({len(by_id)} by canonical ID, {hashed - len(by_id)} by text hash)")
+
+    # Pass 2: fuzzy, candidates from the author block and the near-duplicate engine, assigned optimally
+    log("\n   Pass 2: Fuzzy matching on text similarity...")
+    author_index = defaultdict(list)
+    for pos in sorted(unmatched_new):
+        review = new[pos]
+        if _known(review['app_name'], review['rating'], review['author']):
+            author_index[(review['app_name'], review['author'])].append(pos)
+
+    remaining = [i for i, review in existing.items()
+                 if i not in matched_existing and _known(review['app_name'], review['rating'])]
+    pool = [pos for pos in sorted(unmatched_new) if _known(new[pos]['app_name'], new[pos]['rating'])]
+    similar = defaultdict(dict)
+    pairs = similar_pairs([existing[i]['text'] for i in remaining], [new[pos]['text'] for pos in pool],
+                          threshold=CANDIDATE_THRESHOLD, exact=False)
+    for left, right, similarity in zip(pairs['left'].tolist(), pairs['right'].tolist(), pairs['similarity'].tolist()):
+        similar[remaining[left]][pool[right]] = similarity
+
+    def candidates_for(i):
+        """Author block and most similar texts, most similar first"""
+        review = existing[i]
+        app, rating = review['app_name'], float(review['rating'])
+
+        def eligible(pos):
+            return new[pos]['app_name'] == app and abs(new[pos]['rating'] - rating) <= 1
+
+        candidates = set()
+        if _known(review['author']):
+            candidates.update(pos for pos in author_index.get((app, review['author']), ()) if eligible(pos))
+        shared = similar.get(i, {})
+        ranked = sorted((pos for pos in shared if eligible(pos)), key=lambda pos: (-shared[pos], pos))
+        candidates.update(ranked[:MAX_CANDIDATES])
+        return sorted(candidates, key=lambda pos: (-shared.get(pos, 0), pos))
+
+    # Score every review's candidates (in parallel) ...
+    jobs = [(i, candidates_for(i)) for i in remaining]
+    edges = [(i, pos, score) for (i, _), scored in zip(jobs, score_candidates(existing, new, jobs, workers))
+             for pos, score in scored]
+
+    # ... then assign one-to-one per block, flagging matches with a close runner-up
+    scores_of = defaultdict(list)
+    for i, pos, score in edges:
+        scores_of[('existing', i)].append((score, pos))
+        scores_of[('new', pos)].append((score, i))
+
+    fuzzy_matched = 0
+    for i, pos, score in assign_blocks(edges):
+        others = [other for other, node in scores_of[('existing', i)] if node != pos] \
+            + [other for other, node in scores_of[('new', pos)] if node != i]
+        runner_up = max(others, default=None)
+        matches.append({
+            'existing_idx': existing_labels[i],
+            'new_idx': pos,
+            'match_type': 'fuzzy',
+            'confidence': float(score),
+            'date_to_add': new[pos]['date'],
+            'ambiguous': runner_up is not None and runner_up >= score - AMBIGUITY_MARGIN,
+            'runner_up': runner_up
+        })
+        matched_existing.add(i)
+        unmatched_new.discard(pos)
+        fuzzy_matched += 1
+
+    log(f"   ✅ Found {fuzzy_matched} fuzzy matches")
+
+    unmatched_existing = [label for i, label in enumerate(existing_labels) if i not in matched_existing]
+    unmatched_new = sorted(unmatched_new)
+
+    # Summary
+    log(f"\n   📊 Matching Summary:")
+    log(f"      Total existing iOS reviews: {len(existing_labels)}")
+    if existing_labels:
+        log(f"      Successfully matched: {len(matches)} ({len(matches)/len(existing_labels)*100:.1f}%)")
+    log(f"      Unmatched existing: {len(unmatched_existing)}")
+    log(f"      New reviews not in existing: {len(unmatched_new)}")
+    print_match_report(match_report(matches), log)
+
+    return matches, unmatched_existing, unmatched_new
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Review Scraper
+Scrapes the reviews of every app in scraper_registry.yaml, from every store
+and country it lists, through one concurrent scheduler into one CSV with a
+shared schema (OUTPUT_COLUMNS). Adding a carrier or brand is a registry entry,
+not a copied script.
+
+Stores are source plugins registered in SOURCES:
+
+    itunes        iTunes RSS customer review feeds (itunes_rss.py)
+    google_play   Google Play reviews (needs google-play-scraper)
+    fixture       recorded reviews from a CSV - stands in for any store in
+                  tests and offline runs
+
+Usage:
+    python review_scraper.py                              # every app, store and country
+    python review_scraper.py --apps Bell,Fido --stores itunes
+    python review_scraper.py --fixtures <reviews.csv>     # replay recorded reviews instead of the stores
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from app_registry import REGISTRY_FILE, load_registry
+from ios_rescrape_fixed import parse_review_entries
+from itunes_rss import FEED_URL, MAX_PAGES, HTTPSession, fetch_feed, session_cache
+
+try:
+    import google_play_scraper
+except ImportError:
+    google_play_scraper = None
+
+# Shared output schema of every source
+OUTPUT_COLUMNS = [
+    'review_id', 'title', 'text', 'rating', 'author', 'app_version', 'date',
+    'app_name', 'platform', 'extraction_method', 'extraction_date',
+    'thumbs_up', 'developer_response', 'replied_at',
+    'carrier', 'country', 'store', 'store_app_id', 'store_review_id'
+]
+
+GOOGLE_PLAY_COUNT = 500
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+SOURCES = {}
+
+
+def register_source(cls):
+    """Class decorator adding a source plugin to SOURCES under its store name"""
+    SOURCES[cls.store] = cls
+    return cls
+
+
+class ReviewSource:
+    """
+    Base class of a store plugin
+
+    fetch() returns one app's reviews in one country as dicts with the review
+    fields of OUTPUT_COLUMNS (the scheduler fills in the registry fields), plus
+    an error message when the fetch stopped part-way. Sources holding
+    connections open them in open() and release them in close().
+    """
+    store = None
+    platform = None
+    # Jobs of this store the scheduler runs at once
+    concurrency = 4
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def fetch(self, store_app_id, app_name, country):
+        raise NotImplementedError
+
+
+@register_source
+class ITunesRSSSource(ReviewSource):
+    """iTunes RSS feeds over one pooled session (and the HTTP cache)"""
+    store = 'itunes'
+    platform = 'iOS'
+
+    def __init__(self, max_pages=MAX_PAGES, url=FEED_URL, cache=True):
+        self.max_pages = max_pages
+        self.url = url
+        self.cache = cache
+        self.session = None
+
+    async def open(self):
+        self.session = HTTPSession(cache=session_cache(self.cache))
+
+    async def close(self):
+        await self.session.close()
+
+    async def fetch(self, store_app_id, app_name, country):
+        entries, _, error = await fetch_feed(self.session, store_app_id, country, self.max_pages, self.url)
+        if error and not entries:
+            raise ConnectionError(error)
+        reviews = parse_review_entries(entries, app_name)
+        for review in reviews:
+            review.pop('date_parsed', None)
+        return reviews, error
+
+
+@register_source
+class GooglePlaySource(ReviewSource):
+    """Google Play reviews through google-play-scraper (blocking, so run in threads)"""
+    store = 'google_play'
+    platform = 'Android'
+    concurrency = 2
+
+    def __init__(self, count=GOOGLE_PLAY_COUNT, lang='en'):
+        self.count = count
+        self.lang = lang
+
+    async def open(self):
+        if google_play_scraper is None:
+            raise ImportError("google_play needs google-play-scraper (pip install google-play-scraper)")
+
+    async def fetch(self, store_app_id, app_name, country):
+        result, _ = await asyncio.to_thread(google_play_scraper.reviews, store_app_id, lang=self.lang,
+                                            country=country, sort=google_play_scraper.Sort.NEWEST,
+                                            count=self.count)
+        return [google_play_review(review, app_name) for review in result], None
+
+
+def google_play_review(review, app_name):
+    """Shared-schema review from a google-play-scraper result"""
+    def timestamp(value):
+        return value.strftime(DATE_FORMAT) if value else ''
+
+    return {
+        'review_id': review.get('reviewId', ''),
+        'store_review_id': review.get('reviewId', ''),
+        'title': '',
+        'text': review.get('content') or '',
+        'rating': review.get('score'),
+        'author': review.get('userName') or '',
+        'app_version': review.get('reviewCreatedVersion') or '',
+        'date': timestamp(review.get('at')),
+        'app_name': app_name,
+        'extraction_method': 'google_play_scraper',
+        'thumbs_up': review.get('thumbsUpCount', 0),
+        'developer_response': review.get('replyContent') or '',
+        'replied_at': timestamp(review.get('repliedAt'))
+    }
+
+
+@register_source
+class FixtureSource(ReviewSource):
+    """
+    Recorded reviews from a CSV, standing in for a store
+
+    Replays the rows of the fixture whose app_name (and platform, when the
+    double has one) match the job, e.g. FixtureSource(path, 'google_play',
+    'Android') in place of GooglePlaySource.
+    """
+    store = 'fixture'
+
+    def __init__(self, path, store=None, platform=None):
+        self.path = path
+        self.store = store or self.store
+        self.platform = platform
+        self.reviews = None
+
+    async def open(self):
+        self.reviews = pd.read_csv(self.path, dtype={'review_id': str}, keep_default_na=False)
+
+    async def fetch(self, store_app_id, app_name, country):
+        rows = self.reviews[self.reviews['app_name'] == app_name]
+        if self.platform and 'platform' in rows.columns:
+            rows = rows[rows['platform'] == self.platform]
+        columns = [c for c in OUTPUT_COLUMNS if c in rows.columns]
+        return rows[columns].to_dict('records'), None
+
+
+def build_jobs(apps, sources, only_apps=None, only_stores=None):
+    """One job per (app, store, country) with a store id and a source"""
+    return [{'app_name': app['app_name'], 'carrier': app['carrier'], 'store': store,
+             'store_app_id': store_app_id, 'country': country}
+            for app in apps if not only_apps or app['app_name'] in only_apps
+            for store, store_app_id in app['stores'].items()
+            if store in sources and (not only_stores or store in only_stores)
+            for country in app['countries']]
+
+
+async def run_jobs(jobs, sources):
+    """
+    Run every job concurrently (at most each source's concurrency at once per store)
+
+    Returns:
+        List of (job, reviews, error or None), in job order
+    """
+    failed = {}
+    opened = []
+    for store, source in sources.items():
+        try:
+            await source.open()
+            opened.append(source)
+        except (ImportError, OSError, ValueError) as e:
+            failed[store] = str(e)
+
+    limits = {store: asyncio.Semaphore(source.concurrency) for store, source in sources.items()}
+
+    async def run(job):
+        if job['store'] in failed:
+            return job, [], failed[job['store']]
+        async with limits[job['store']]:
+            try:
+                reviews, error = await sources[job['store']].fetch(job['store_app_id'], job['app_name'],
+                                                                   job['country'])
+            except Exception as e:
+                # Any store error (google-play-scraper raises its own NotFoundError,
+                # ExtraHTTPError, ...) fails this job only
+                return job, [], str(e) or type(e).__name__
+        return job, reviews, error
+
+    try:
+        return await asyncio.gather(*(run(job) for job in jobs))
+    finally:
+        for source in opened:
+            await source.close()
+
+
+def to_frame(results, sources):
+    """All reviews in OUTPUT_COLUMNS, with the registry fields of their job"""
+    extraction_date = datetime.now().strftime('%Y-%m-%d')
+    rows = []
+    for job, reviews, _ in results:
+        for review in reviews:
+            row = dict(review)
+            row.update(app_name=job['app_name'], carrier=job['carrier'], country=job['country'],
+                       store=job['store'], store_app_id=job['store_app_id'])
+            row['platform'] = sources[job['store']].platform or row.get('platform', '')
+            row.setdefault('extraction_date', extraction_date)
+            rows.append(row)
+    return pd.DataFrame(rows, columns=OUTPUT_COLUMNS)
+
+
+def scrape(apps, sources, only_apps=None, only_stores=None):
+    """
+    Scrape every registered app from every source in one event loop
+
+    Returns:
+        (reviews DataFrame, list of (job, reviews, error or None))
+    """
+    jobs = build_jobs(apps, sources, only_apps, only_stores)
+    results = asyncio.run(run_jobs(jobs, sources))
+    return to_frame(results, sources), results
+
+
+def default_sources(fixtures=None):
+    """The store sources, or fixture doubles of them replaying a CSV"""
+    if fixtures:
+        return {store: FixtureSource(fixtures, store, cls.platform)
+                for store, cls in SOURCES.items() if store != 'fixture'}
+    return {'itunes': ITunesRSSSource(), 'google_play': GooglePlaySource()}
+
+
+def print_results(results):
+    """Reviews and status per job"""
+    print(f"\n{'App':<12} {'Store':<12} {'Country':<8} {'Reviews':>8}  Status")
+    print("-" * 60)
+    for job, reviews, error in results:
+        status = f"⚠️  {error}" if error and reviews else (f"❌ {error}" if error else "✅")
+        print(f"{job['app_name']:<12} {job['store']:<12} {job['country']:<8} {len(reviews):>8}  {status}")
+
+
+def _names(args, flag):
+    if flag not in args:
+        return None
+    index = args.index(flag)
+    if index + 1 >= len(args):
+        raise ValueError(f"{flag} needs a value")
+    return [name for name in args[index + 1].split(',') if name]
+
+
+def main():
+    """Scrape every registered app and save one CSV"""
+    print("🚀 App Store Review Scraper")
+    print("=" * 60)
+
+    args = sys.argv[1:]
+    try:
+        apps = load_registry(REGISTRY_FILE, stores=SOURCES)
+        only_apps = _names(args, '--apps')
+        only_stores = _names(args, '--stores')
+        fixtures = (_names(args, '--fixtures') or [None])[0]
+        unknown = [name for name in only_apps or [] if name not in {app['app_name'] for app in apps}]
+        if unknown:
+            raise ValueError(f"Apps not in {REGISTRY_FILE}: {', '.join(unknown)}")
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    unconfigured = [app['app_name'] for app in apps if not app['stores']]
+    if unconfigured:
+        print(f"⚪ No store ids yet: {', '.join(unconfigured)}")
+
+    sources = default_sources(fixtures)
+    start = time.perf_counter()
+    df, results = scrape(apps, sources, only_apps, only_stores)
+    print_results(results)
+    print(f"\n⏱️  {len(results)} feeds in {time.perf_counter() - start:.1f}s")
+
+    if df.empty:
+        print("\n❌ No reviews collected - check the registry and network connection")
+        sys.exit(1)
+
+    filename = f"app_reviews_scraped_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    df.to_csv(filename, index=False)
+    print(f"\n💾 Saved {len(df):,} reviews to: {filename}")
+    for (app_name, platform), count in df.groupby(['app_name', 'platform']).size().items():
+        print(f"   {app_name} {platform}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
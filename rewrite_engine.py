@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Single-Pass Rewrite Engine
+Shared replacement engine for the legacy HTML patch scripts. All rules are
+applied in one left-to-right pass that assembles the output once, with
+per-rule hit counts, instead of one re.search + re.sub copy per rule.
+
+A rule is a tuple (pattern, replacement[, flags[, count]]):
+    pattern      regex string
+    replacement  re.sub-style template (\\1, \\g<name>) or a function(match)
+    flags        re flags for this rule
+    count        maximum replacements for this rule (0 = unlimited)
+
+Each rule keeps its own compiled regex (so re's literal-prefix scan still
+applies) and the pass always takes the leftmost pending match, ties going to
+the earlier rule. Replaced text is not rescanned, so rules must not depend on
+the output of an earlier rule (sequential re.sub chains sometimes did).
+"""
+
+import heapq
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _normalize_rule(rule):
+    """(pattern, replacement, flags, count) from a 2-4 tuple"""
+    pattern, replacement = rule[0], rule[1]
+    flags = rule[2] if len(rule) > 2 else 0
+    count = rule[3] if len(rule) > 3 else 0
+    return pattern, replacement, flags, count
+
+
+def compile_rules(rules):
+    """
+    Compile each rule once so a ruleset can be reused across files
+
+    Returns:
+        Dict with the per-rule compiled 'rules'
+    """
+    compiled = []
+    for rule in rules:
+        pattern, replacement, flags, count = _normalize_rule(rule)
+        compiled.append({
+            'pattern': pattern,
+            'regex': re.compile(pattern, flags),
+            'replacement': replacement,
+            'count': count
+        })
+    return {'rules': compiled}
+
+
+def rewrite(text, ruleset):
+    """
+    Apply all rules to text in a single left-to-right pass
+
+    Returns:
+        (new_text, hits) where hits[i] is the replacement count for rule i
+    """
+    rules = ruleset['rules']
+    hits = [0] * len(rules)
+
+    # Next pending match per rule, ordered by (start, rule index)
+    pending = []
+    for index, rule in enumerate(rules):
+        match = rule['regex'].search(text)
+        if match:
+            heapq.heappush(pending, (match.start(), index, match))
+
+    pieces = []
+    pos = 0
+    while pending:
+        start, index, match = heapq.heappop(pending)
+        rule = rules[index]
+
+        if start < pos:
+            # Overlaps text already consumed: look again after it
+            match = rule['regex'].search(text, pos)
+        else:
+            replacement = rule['replacement']
+            pieces.append(text[pos:start])
+            pieces.append(replacement(match) if callable(replacement) else match.expand(replacement))
+            pos = match.end()
+            hits[index] += 1
+
+            if rule['count'] and hits[index] >= rule['count']:
+                continue
+            if match.end() > start:
+                match = rule['regex'].search(text, pos)
+            elif start < len(text):
+                # Empty match: step over one character so it can't match in place again
+                pieces.append(text[start])
+                pos = start + 1
+                match = rule['regex'].search(text, pos)
+            else:
+                match = None
+
+        if match:
+            heapq.heappush(pending, (match.start(), index, match))
+
+    pieces.append(text[pos:])
+    return ''.join(pieces), hits
+
+
+def rewrite_file(path, rules, dry_run=False):
+    """Rewrite one file in place, return {'path', 'hits', 'changed'}"""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    new_content, hits = rewrite(content, compile_rules(rules))
+    changed = new_content != content
+
+    if changed and not dry_run:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+
+    return {'path': path, 'hits': hits, 'changed': changed}
+
+
+def _rewrite_job(job):
+    """Process-pool entry point: (path, rules, dry_run)"""
+    return rewrite_file(*job)
+
+
+def rewrite_files(jobs, workers=None, dry_run=False):
+    """
+    Rewrite many files in parallel
+
+    Args:
+        jobs: List of (path, rules) pairs; replacement functions must be
+            module-level so they can be sent to worker processes
+        workers: Process count (default: one per CPU, at most one per file)
+        dry_run: Count hits without writing
+
+    Returns:
+        Results in job order (see rewrite_file)
+    """
+    jobs = [(path, rules, dry_run) for path, rules in jobs if os.path.exists(path)]
+    if not jobs:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers == 1:
+        return [_rewrite_job(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_rewrite_job, jobs))
+
+
+def print_hit_report(result, rules, label_width=50):
+    """Per-rule hit counts for one file"""
+    status = '📝 changed' if result['changed'] else '⚪ unchanged'
+    print(f"📄 {result['path']} ({status}, {sum(result['hits'])} replacements)")
+    for rule, hits in zip(rules, result['hits']):
+        if hits:
+            print(f"  ✅ {_normalize_rule(rule)[0][:label_width]}... ({hits})")
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Synthetic Review Corpus Generator
+Generates realistic fake app reviews with the merged dataset's schema
+(merge_ios_data.REQUIRED_COLUMNS, plus enhanced_category from the
+recategorization stage) for load testing the classifier, matcher and
+dashboard builder at 10x-100x the real ~10K reviews.
+
+Distributions follow the filtered dataset: ~70/30 Rogers/Bell, ~90/10
+Android/iOS, a 1-star-heavy rating mix averaging ~2.6, sentiment conditioned
+on rating, category conditioned on sentiment, Android reviews from 2020 and iOS
+reviews from December 2023 with volume growing over time, long-tailed text
+length and a share of exact re-scrape duplicates.
+
+Rows are generated in vectorized chunks (memory stays flat at millions of
+rows) and are reproducible for a given seed and chunk size.
+
+Usage:
+    python synthetic_reviews.py <rows> <output.csv|.csv.gz|.parquet> [seed]
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from merge_ios_data import REQUIRED_COLUMNS
+
+COLUMNS = REQUIRED_COLUMNS + ['enhanced_category']
+CHUNK_SIZE = 250_000
+
+PROVIDERS = {'Rogers': 0.70, 'Bell': 0.30}
+PLATFORMS = {'Android': 0.90, 'iOS': 0.10}
+RATINGS = {1: 0.48, 2: 0.09, 3: 0.07, 4: 0.08, 5: 0.28}
+
+# First/last review date per platform (iOS RSS only reaches back ~18 months)
+DATE_RANGES = {
+    'Android': ('2020-01-01', '2025-05-20'),
+    'iOS': ('2023-12-01', '2025-05-27')
+}
+
+# Share of iOS reviews the date matcher could not date
+IOS_MISSING_DATE_RATE = 0.035
+
+# Share of rows that repeat an earlier review (re-scrapes, double submissions)
+DUPLICATE_RATE = 0.02
+
+SENTIMENTS = ['Negative', 'Positive', 'Neutral', 'Mixed']
+
+# P(claude_sentiment | rating), columns in SENTIMENTS order
+SENTIMENT_BY_RATING = {
+    1: [0.93, 0.01, 0.03, 0.03],
+    2: [0.85, 0.02, 0.06, 0.07],
+    3: [0.45, 0.15, 0.25, 0.15],
+    4: [0.08, 0.72, 0.10, 0.10],
+    5: [0.03, 0.92, 0.04, 0.01]
+}
+
+# P(primary_category | negative or positive sentiment); neutral and mixed use the average
+CATEGORIES_NEGATIVE = {
+    'Technical Issues': 0.30, 'Billing': 0.18, 'Customer Support': 0.14, 'Performance': 0.08,
+    'Authentication': 0.07, 'Account Management': 0.06, 'Network Issues': 0.06,
+    'User Experience': 0.06, 'Features': 0.03, 'User Feedback': 0.02
+}
+CATEGORIES_POSITIVE = {
+    'User Feedback': 0.45, 'User Experience': 0.20, 'Features': 0.12, 'Customer Support': 0.08,
+    'Billing': 0.05, 'Performance': 0.05, 'Technical Issues': 0.05
+}
+
+APP_VERSIONS = {
+    'Rogers': ['6.21.0.12', '6.22.1.4', '6.23.0.36'],
+    'Bell': ['11.1.0', '11.2.2', '11.3.0']
+}
+
+# Review sentences per category; texts are 1-8 sentences drawn from the
+# review's category plus the general pool
+SENTENCES = {
+    'Technical Issues': [
+        'The app keeps crashing every time I open it.',
+        'After the latest update nothing loads past the splash screen.',
+        'I get an error message whenever I try to view my usage.',
+        'The app freezes on the billing page and I have to force close it.',
+        'It says something went wrong and to try again later, every single time.',
+        'Half the features just show a blank white screen.'
+    ],
+    'Billing': [
+        'I was charged twice for the same bill and the app shows no record of it.',
+        'Paying my bill through the app never works, the payment just fails.',
+        'My bill went up again without any notice.',
+        'The app does not show the credit I was promised on my account.',
+        'Trying to set up autopay is impossible.',
+        'The price increase is ridiculous for the same service.'
+    ],
+    'Customer Support': [
+        'The chatbot is useless and there is no way to reach a real person.',
+        'I spent two hours on hold after the app told me to call.',
+        'Support keeps transferring me between departments.',
+        'The agent I finally reached was helpful and fixed it quickly.',
+        'Nobody answers the live chat.'
+    ],
+    'Performance': [
+        'The app is incredibly slow to load.',
+        'Every screen takes forever and the app lags constantly.',
+        'It drains my battery and runs very slowly.',
+        'Loading my account details takes more than a minute.'
+    ],
+    'Authentication': [
+        'I cannot log in no matter how many times I reset my password.',
+        'It keeps logging me out and asking for the verification code.',
+        'The verification code never arrives.',
+        'Face ID login stopped working after the update.'
+    ],
+    'Account Management': [
+        'I cannot update my address or payment method in the app.',
+        'Adding a line to my account is not possible in the app.',
+        'My account settings will not save.',
+        'The app shows the wrong plan on my account.'
+    ],
+    'Network Issues': [
+        'No signal at home even though the map says full coverage.',
+        'Data keeps dropping and the app cannot tell me why.',
+        'There was an outage all day and the app showed nothing.',
+        'Coverage has gotten worse in my area.'
+    ],
+    'User Experience': [
+        'The new design is confusing and hard to navigate.',
+        'Finding my usage takes far too many taps.',
+        'The layout is clean and easy to use.',
+        'Everything I need is right on the home screen.'
+    ],
+    'Features': [
+        'Please add the option to download past bills as PDF.',
+        'I wish I could manage roaming from the app.',
+        'Love that I can see my data usage in real time.',
+        'The app is missing features the website has.'
+    ],
+    'User Feedback': [
+        'Great app, does what I need.',
+        'Terrible app.',
+        'Works well overall.',
+        'Very convenient.',
+        'Worst company ever.',
+        'Been a customer for years and the app is fine.'
+    ]
+}
+GENERAL_SENTENCES = [
+    'I have been with them for over ten years.',
+    'Please fix this.',
+    'Not impressed.',
+    'Thank you.',
+    'Switching providers if this continues.',
+    'Used to be much better.',
+    'My whole family uses this app.',
+    'Overall it gets the job done.'
+]
+
+SUMMARIES = {
+    'Technical Issues': 'App crashes or errors block basic tasks',
+    'Billing': 'Billing or payment problem in the app',
+    'Customer Support': 'Difficulty getting help from support',
+    'Performance': 'App is slow or unresponsive',
+    'Authentication': 'Unable to log in or stay logged in',
+    'Account Management': 'Cannot manage account details in the app',
+    'Network Issues': 'Coverage or connectivity complaint',
+    'User Experience': 'Comment on app design and navigation',
+    'Features': 'Feature request or feature feedback',
+    'User Feedback': 'General opinion of the app'
+}
+
+ISSUE_TAGS = {
+    'Technical Issues': ['crash', 'error', 'update'],
+    'Billing': ['payment', 'overcharge', 'price_increase'],
+    'Customer Support': ['chatbot', 'wait_time', 'escalation'],
+    'Performance': ['slow', 'lag'],
+    'Authentication': ['login', 'password', 'verification'],
+    'Account Management': ['profile', 'settings'],
+    'Network Issues': ['coverage', 'outage'],
+    'User Experience': ['navigation', 'design'],
+    'Features': ['missing_feature'],
+    'User Feedback': []
+}
+
+TITLES = ['Frustrating', 'Needs work', 'Great app', 'Does not work', 'Love it', 'Terrible update',
+          'Fix the login', 'Convenient', 'Why so slow', 'Billing nightmare']
+AUTHORS = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Chris', 'Pat', 'Morgan', 'Jamie', 'Casey', 'Riley',
+           'Google user', 'Frustrated customer']
+
+
+def _choice(rng, options, size):
+    """Sample dict keys by their probabilities"""
+    keys = np.array(list(options), dtype=object)
+    weights = np.array(list(options.values()), dtype=float)
+    return keys[rng.choice(len(keys), size=size, p=weights / weights.sum())]
+
+
+def _conditional(rng, conditions, table, labels):
+    """Sample one label per row from table[condition] probabilities"""
+    result = np.empty(len(conditions), dtype=object)
+    for condition, weights in table.items():
+        mask = conditions == condition
+        weights = np.asarray(weights, dtype=float)
+        result[mask] = np.asarray(labels, dtype=object)[rng.choice(len(labels), size=mask.sum(), p=weights / weights.sum())]
+    return result
+
+
+def _dates(rng, platforms):
+    """Review timestamps, denser towards the end of each platform's range"""
+    dates = pd.Series(pd.NaT, index=range(len(platforms)), dtype='datetime64[ns]')
+    for platform, (start, end) in DATE_RANGES.items():
+        mask = platforms == platform
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        span = (end - start).total_seconds()
+        # sqrt of a uniform draw: linearly increasing review volume
+        offsets = np.sqrt(rng.random(mask.sum())) * span
+        dates[mask] = start + pd.to_timedelta(offsets, unit='s').round('s')
+    missing = (platforms == 'iOS') & (rng.random(len(platforms)) < IOS_MISSING_DATE_RATE)
+    dates[missing] = pd.NaT
+    return dates
+
+
+def _texts(rng, categories):
+    """Review text: 1-8 sentences (long-tailed) from the category and general pools"""
+    n = len(categories)
+    lengths = np.minimum(rng.geometric(0.45, n), 8)
+    texts = np.full(n, '', dtype=object)
+
+    for category, sentences in SENTENCES.items():
+        mask = categories == category
+        if not mask.any():
+            continue
+        pool = np.array(sentences + GENERAL_SENTENCES, dtype=object)
+        # The first sentence always comes from the category itself
+        texts[mask] = np.array(sentences, dtype=object)[rng.integers(0, len(sentences), mask.sum())]
+        for position in range(1, 8):
+            extend = mask & (lengths > position)
+            if not extend.any():
+                break
+            texts[extend] = texts[extend] + ' ' + pool[rng.integers(0, len(pool), extend.sum())]
+
+    return texts
+
+
+def _tag_lists(rng, categories, table, max_tags=2):
+    """List-literal strings ("['login', 'password']") of tags for each category"""
+    result = np.full(len(categories), '[]', dtype=object)
+    for category, tags in table.items():
+        mask = categories == category
+        if not tags or not mask.any():
+            continue
+        counts = rng.integers(0, min(max_tags, len(tags)) + 1, mask.sum())
+        literals = np.array([str(tags[:k]) for k in range(len(tags) + 1)], dtype=object)
+        result[mask] = literals[counts]
+    return result
+
+
+def generate_chunk(rows, seed=42, offset=0):
+    """
+    One DataFrame of synthetic reviews
+
+    Args:
+        rows: Number of reviews
+        seed: Base seed; the chunk's random stream is derived from (seed, offset)
+        offset: Index of the chunk's first review (keeps review_ids unique)
+    """
+    rng = np.random.default_rng([seed, offset])
+
+    apps = _choice(rng, PROVIDERS, rows)
+    platforms = _choice(rng, PLATFORMS, rows)
+    ratings = _choice(rng, RATINGS, rows).astype(int)
+    sentiments = _conditional(rng, ratings, SENTIMENT_BY_RATING, SENTIMENTS)
+
+    mixed = {name: (CATEGORIES_NEGATIVE.get(name, 0) + CATEGORIES_POSITIVE.get(name, 0)) / 2
+             for name in SENTENCES}
+    categories = np.empty(rows, dtype=object)
+    for labels, table in [(['Negative'], CATEGORIES_NEGATIVE), (['Positive'], CATEGORIES_POSITIVE),
+                          (['Neutral', 'Mixed'], mixed)]:
+        mask = np.isin(sentiments, labels)
+        categories[mask] = _choice(rng, table, mask.sum())
+
+    positive = sentiments == 'Positive'
+    enhanced = categories.copy()
+    enhanced[(categories == 'User Experience') & positive] = 'UX Praise'
+    enhanced[(categories == 'User Experience') & ~positive] = 'UX Complaints'
+    enhanced[(categories == 'User Feedback') & positive] = 'Brand Loyalty'
+    enhanced[(categories == 'User Feedback') & ~positive] = 'General Dissatisfaction'
+
+    dates = _dates(rng, platforms)
+    texts = _texts(rng, categories)
+    authors = (np.array(AUTHORS, dtype=object)[rng.integers(0, len(AUTHORS), rows)]
+               + ' ' + rng.integers(1, 10_000, rows).astype(str).astype(object))
+
+    # Claude sentiment score in a band per label; TextBlob-style score is noisier
+    bands = {'Negative': (-0.95, -0.3), 'Positive': (0.3, 0.95), 'Neutral': (-0.1, 0.1), 'Mixed': (-0.3, 0.3)}
+    claude_scores = np.empty(rows)
+    for label, (low, high) in bands.items():
+        mask = sentiments == label
+        claude_scores[mask] = rng.uniform(low, high, mask.sum())
+    scores = np.clip(claude_scores * 0.6 + rng.normal(0, 0.2, rows), -1, 1)
+
+    android = platforms == 'Android'
+    versions = np.empty(rows, dtype=object)
+    for app, options in APP_VERSIONS.items():
+        mask = apps == app
+        versions[mask] = np.array(options, dtype=object)[rng.integers(0, len(options), mask.sum())]
+
+    responded = android & (rng.random(rows) < 0.08)
+    severity = np.where(ratings <= 1, np.where(rng.random(rows) < 0.3, 'Critical', 'High'),
+                        np.where(ratings <= 3, 'Medium', 'Low')).astype(object)
+    impact = np.where(np.isin(categories, ['Billing', 'Customer Support', 'Authentication', 'Account Management'])
+                      & (sentiments == 'Negative'), 'High',
+                      np.where(sentiments == 'Negative', 'Medium', 'None')).astype(object)
+
+    frame = pd.DataFrame({
+        'review_id': np.char.add(np.where(android, 'gp-', 'ios-'), (np.arange(rows) + offset).astype(str)).astype(object),
+        'title': np.where(android, '', np.array(TITLES, dtype=object)[rng.integers(0, len(TITLES), rows)]),
+        'text': texts,
+        'rating': ratings,
+        'author': authors,
+        'app_version': versions,
+        'date': dates.dt.strftime('%Y-%m-%d %H:%M:%S').to_numpy(dtype=object),
+        'app_name': apps,
+        'platform': platforms,
+        'extraction_method': np.where(android, 'google_play_scraper', 'itunes_rss'),
+        'extraction_date': '2025-05-29',
+        'sentiment_score': scores.round(4),
+        'sentiment': np.where(scores > 0.1, 'Positive', np.where(scores < -0.1, 'Negative', 'Neutral')),
+        'userImage': np.where(android, 'https://play-lh.googleusercontent.com/a/default-user', ''),
+        'thumbs_up': np.where(android, rng.geometric(0.5, rows) - 1, 0),
+        'developer_response': np.where(responded, 'Thanks for your feedback. Please reach out to our support team so we can help.', ''),
+        'replied_at': np.where(responded, (dates + pd.Timedelta(days=2)).dt.strftime('%Y-%m-%d %H:%M:%S').fillna(''), ''),
+        'appVersion': versions,
+        'claude_summary': pd.Series(categories).map(SUMMARIES).to_numpy(dtype=object),
+        'claude_sentiment': sentiments,
+        'claude_sentiment_score': claude_scores.round(4),
+        'primary_category': categories,
+        'sub_categories': np.char.add(np.char.add("['", categories.astype(str)), "']").astype(object),
+        'issue_tags': _tag_lists(rng, categories, ISSUE_TAGS),
+        'feature_tags': np.where(categories == 'Features', "['feature_request']", '[]'),
+        'severity': severity,
+        'customer_service_impact': impact,
+        'enhanced_category': enhanced
+    })
+
+    # Duplicates repeat an earlier review's content under a new id
+    duplicates = np.flatnonzero(rng.random(rows) < DUPLICATE_RATE)
+    duplicates = duplicates[duplicates > 0]
+    if len(duplicates):
+        sources = (rng.random(len(duplicates)) * duplicates).astype(int)
+        content = [column for column in COLUMNS if column != 'review_id']
+        frame.loc[duplicates, content] = frame.loc[sources, content].to_numpy()
+
+    return frame[COLUMNS]
+
+
+def generate_reviews(rows, seed=42, chunk_size=CHUNK_SIZE):
+    """Yield the corpus as DataFrames of at most chunk_size reviews"""
+    for offset in range(0, rows, chunk_size):
+        yield generate_chunk(min(chunk_size, rows - offset), seed, offset)
+
+
+def make_reviews(rows, seed=42, chunk_size=CHUNK_SIZE):
+    """The whole corpus as one DataFrame"""
+    return pd.concat(generate_reviews(rows, seed, chunk_size), ignore_index=True)
+
+
+def write_corpus(path, rows, seed=42, chunk_size=CHUNK_SIZE):
+    """
+    Stream the corpus to CSV (.csv / .csv.gz) or Parquet (.parquet)
+
+    Raises:
+        ImportError: Parquet output without pyarrow installed
+        ValueError: For other file extensions
+    """
+    if path.endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for chunk in generate_reviews(rows, seed, chunk_size):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                writer = writer or pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return
+
+    if not path.endswith(('.csv', '.csv.gz')):
+        raise ValueError(f"Unsupported output format: {path} (use .csv, .csv.gz or .parquet)")
+
+    for index, chunk in enumerate(generate_reviews(rows, seed, chunk_size)):
+        chunk.to_csv(path, mode='w' if index == 0 else 'a', header=index == 0, index=False,
+                     compression='gzip' if path.endswith('.gz') else None)
+
+
+def main():
+    """Write a synthetic corpus"""
+    if len(sys.argv) < 3:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(1)
+
+    rows, path = int(sys.argv[1].replace('_', '').replace(',', '')), sys.argv[2]
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else 42
+
+    print("=== SYNTHETIC REVIEW CORPUS ===\n")
+    print(f"Generating {rows:,} reviews (seed {seed}) → {path}")
+    try:
+        write_corpus(path, rows, seed)
+    except ImportError as e:
+        print(f"❌ Parquet output needs pyarrow: {e}")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"✅ Wrote {os.path.getsize(path) / 1e6:,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Report Templatizer
+One-off conversion of the hand-patched reports in html_dashboard/ into
+templates under html_dashboard/templates/. Every known literal for a headline
+metric (current value and the outdated values the patch scripts used to chase)
+becomes a named placeholder that render_reports.py fills from the metrics cube.
+
+Re-run only when a report has been edited directly instead of via its template.
+"""
+
+import os
+import re
+import sys
+
+from render_reports import TEMPLATE_DIR
+
+REPORTS = [
+    'html_dashboard/dashboard.html',
+    'html_dashboard/executive_summary.html',
+    'html_dashboard/rogers_cx_transformation_report.html',
+    'html_dashboard/bell_smart_cx_report.html',
+    'html_dashboard/cx_ux_assessment_report.html',
+    'html_dashboard/key_metrics_reference.html',
+    'html_dashboard/metrics_calculations_verification.html',
+    'html_dashboard/research_process_approach.html',
+    'html_dashboard/research_methodology.html'
+]
+
+# Placeholder -> literals that stand for that metric in the reports
+LITERAL_PLACEHOLDERS = [
+    ('{{ total_reviews|count }}', ['10,103', '12,785', '12,893']),
+    ('{{ rogers_reviews|count }}', ['7,055', '9,038']),
+    ('{{ bell_reviews|count }}', ['3,048', '3,747']),
+    ('{{ android_reviews|count }}', ['9,069']),
+    ('{{ ios_reviews|count }}', ['1,034']),
+    ('{{ negative_reviews|count }}', ['6,148', '7,669']),
+    ('{{ total_stars|count }}', ['33,733']),
+    ('{{ average_rating|rating3 }}', ['2.638']),
+    ('{{ average_rating|rating }}', ['2.58', '2.64']),
+    ('{{ negative_percentage|pct }}', ['60.9%', '60.0%']),
+    ('{{ rogers_percentage|pct }}', ['69.8%', '70.7%']),
+    ('{{ bell_percentage|pct }}', ['30.2%', '29.3%']),
+    ('{{ android_percentage|pct }}', ['89.8%']),
+    ('{{ ios_percentage|pct }}', ['10.2%']),
+    ('{{ data_currency|pct }}', ['99.6%', '65.2%', '78.4%'])
+]
+
+
+def literal_pattern():
+    """One alternation over all literals, not matching inside longer numbers"""
+    placeholders = {}
+    for placeholder, literals in LITERAL_PLACEHOLDERS:
+        for literal in literals:
+            placeholders[literal] = placeholder
+
+    # Longest first so '2.638' wins over '2.64'
+    alternation = '|'.join(re.escape(lit) for lit in sorted(placeholders, key=len, reverse=True))
+    pattern = re.compile(rf'(?<![\d.,])(?:{alternation})(?![\d]|[.,]\d)')
+    return pattern, placeholders
+
+
+def templatize(content):
+    """Replace metric literals with placeholders, return (template, replacement count)"""
+    pattern, placeholders = literal_pattern()
+    return pattern.subn(lambda m: placeholders[m.group(0)], content)
+
+
+def main():
+    """Write a template for each report"""
+    print("=== CONVERTING REPORTS TO TEMPLATES ===\n")
+    os.makedirs(TEMPLATE_DIR, exist_ok=True)
+
+    for report in REPORTS:
+        target = os.path.join(TEMPLATE_DIR, os.path.basename(report))
+        if os.path.exists(target) and '--overwrite' not in sys.argv[1:]:
+            print(f"⚪ Template exists (use --overwrite): {target}")
+            continue
+        if not os.path.exists(report):
+            print(f"⚠️  File not found: {report}")
+            continue
+
+        with open(report, 'r', encoding='utf-8') as f:
+            template, count = templatize(f.read())
+
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(template)
+        print(f"✅ {target}: {count} placeholders")
+
+
+if __name__ == "__main__":
+    main()
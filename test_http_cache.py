@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test the on-disk HTTP response cache against the local RSS fixture server
+
+Covers TTL hits, conditional revalidation (304), changed content, the size
+cap and offline replay after the server is gone.
+"""
+import tempfile
+
+from http_cache import ResponseCache
+from itunes_rss import fetch_feeds
+from test_itunes_rss import APP_IDS, FixtureServer, check, recorded_entries
+
+
+def ids(entries):
+    return [entry['id']['label'] for entry in entries]
+
+
+def main():
+    print("=== TESTING HTTP RESPONSE CACHE ===")
+
+    feeds = recorded_entries()
+    target = (APP_IDS['Bell'], 'ca')
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix='http_cache_') as directory:
+        cache = ResponseCache(directory, ttl=3600)
+
+        with FixtureServer(feeds) as server:
+            first = fetch_feeds([target], max_pages=3, url=server.url, verbose=False, cache=cache)[target]
+            requests = len(server.requests)
+            results.append(check(len(first) == 150 and cache.stored == requests,
+                                 f"First run: {requests} requests, {cache.stored} responses stored"))
+
+            again = fetch_feeds([target], max_pages=3, url=server.url, verbose=False, cache=cache)[target]
+            results.append(check(ids(again) == ids(first) and len(server.requests) == requests,
+                                 f"Within TTL: {len(server.requests) - requests} requests"))
+
+            # Stale entries are revalidated with If-None-Match
+            cache.ttl = 0
+            again = fetch_feeds([target], max_pages=3, url=server.url, verbose=False, cache=cache)[target]
+            results.append(check(ids(again) == ids(first) and server.not_modified == requests,
+                                 f"After TTL: {server.not_modified} of {len(server.requests) - requests} requests answered 304"))
+
+            # Changed content replaces the entry
+            feeds[target[0]].insert(0, dict(feeds[target[0]][0], id={'label': 'brand-new'}))
+            changed = fetch_feeds([target], max_pages=3, url=server.url, verbose=False, cache=cache)[target]
+            results.append(check(ids(changed)[0] == 'brand-new' and ids(changed)[1:] == ids(first)[:149],
+                                 "Changed page refetched"))
+            replayed = changed
+
+        # Offline replay, server gone
+        offline = ResponseCache(directory, ttl=0, mode='offline')
+        again = fetch_feeds([target], max_pages=3, url=server.url, verbose=False, cache=offline)[target]
+        results.append(check(ids(again) == ids(replayed) and offline.hits == 3,
+                             f"Offline replay: {len(again)} reviews from {offline.hits} cached pages"))
+        other = fetch_feeds([(APP_IDS['Rogers'], 'ca')], max_pages=3, url=server.url, verbose=False, cache=offline)
+        results.append(check(other[(APP_IDS['Rogers'], 'ca')] == [], "Offline miss: no reviews, no request"))
+
+        # Size cap evicts the least recently used entries
+        sizes = [size for _, _, size, _ in cache.entries()]
+        capped = ResponseCache(directory, max_bytes=max(sizes) * 2)
+        capped.evict()
+        total = sum(size for _, _, size, _ in capped.entries())
+        results.append(check(len(capped.entries()) <= 2 and total <= capped.max_bytes,
+                             f"Size cap: {len(sizes)} → {len(capped.entries())} entries ({total:,} bytes)"))
+
+    # Only 2xx and iTunes' end-of-feed 400 are stored; the tracked size matches the disk
+    with tempfile.TemporaryDirectory(prefix='http_cache_') as directory:
+        cache = ResponseCache(directory, max_bytes=4000)
+        for status in (200, 400, 301, 404, 429, 503):
+            cache.store(f"http://feed/{status}", status, {}, b'x' * 500)
+        stored = sorted(status for status in (200, 400, 301, 404, 429, 503) if cache.lookup(f"http://feed/{status}"))
+        results.append(check(stored == [200, 400], f"Statuses cached: {stored}"))
+
+        for page in range(10):
+            cache.store(f"http://feed/page/{page}", 200, {}, b'y' * 500)
+        on_disk = sum(size for _, _, size, _ in cache.entries())
+        results.append(check(cache.size == on_disk <= cache.max_bytes,
+                             f"Tracked size {cache.size:,} bytes = on disk, within the {cache.max_bytes:,} byte cap"))
+
+    print(f"\n=== {sum(results)}/{len(results)} CHECKS PASSED ===")
+    if not all(results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
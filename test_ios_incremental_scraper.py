@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test incremental iOS scraping against the local RSS fixture server
+
+Replays the recorded scrape (see test_itunes_rss.py), then adds new reviews
+to the top of the feed and checks that each run fetches only the delta, and that a mark the feed's
+pages don't reach is kept.
+"""
+import glob
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from ios_incremental_scraper import APPS, advance_mark, mark_key, scrape_delta, seed_marks
+from test_itunes_rss import APP_IDS, FixtureServer, check, recorded_entries
+
+
+def new_entries(count, after, prefix):
+    """Entries newer than a timestamp, newest first"""
+    return [{
+        'id': {'label': f'{prefix}-{i}'},
+        'title': {'label': f'New review {i}'},
+        'content': {'label': f'New review text {i}'},
+        'im:rating': {'label': '3'},
+        'author': {'name': {'label': f'{prefix} author {i}'}},
+        'im:version': {'label': '9.9'},
+        'updated': {'label': (after + timedelta(minutes=count - i)).strftime('%Y-%m-%dT%H:%M:%S-07:00')}
+    } for i in range(count)]
+
+
+def run(server, marks):
+    """One incremental run: (new entries per app name, requests made), marks advanced in place"""
+    before = len(server.requests)
+    delta, _ = scrape_delta(APPS, marks, max_pages=10, url=server.url, cache=False)
+    for app in APPS:
+        entries, error = delta[mark_key(app)]
+        if not error:
+            marks[mark_key(app)] = advance_mark(marks.get(mark_key(app)), entries, app)
+    return {app['app_name']: delta[mark_key(app)][0] for app in APPS}, len(server.requests) - before
+
+
+def main():
+    print("=== TESTING INCREMENTAL IOS SCRAPER ===")
+
+    feeds = recorded_entries()
+    results = []
+    marks = {}
+    bell = APP_IDS['Bell']
+    newest = datetime.fromisoformat(feeds[bell][0]['updated']['label']).replace(tzinfo=None)
+
+    with FixtureServer(feeds) as server:
+        delta, requests = run(server, marks)
+        results.append(check(len(delta['Bell']) == len(feeds[bell]) and len(delta['Rogers']) == len(feeds[APP_IDS['Rogers']]),
+                             f"First run (no marks): full feeds in {requests} requests"))
+
+        delta, requests = run(server, marks)
+        results.append(check(not delta['Bell'] and not delta['Rogers'] and requests == 2,
+                             f"Unchanged feeds: no delta, {requests} requests"))
+
+        feeds[bell][:0] = new_entries(7, newest, 'daily')
+        delta, requests = run(server, marks)
+        results.append(check([e['id']['label'] for e in delta['Bell']] == [f'daily-{i}' for i in range(7)]
+                             and not delta['Rogers'] and requests == 2,
+                             f"7 new Bell reviews: delta {len(delta['Bell'])}, {requests} requests"))
+
+        feeds[bell][:0] = new_entries(60, newest + timedelta(days=1), 'weekly')
+        delta, requests = run(server, marks)
+        results.append(check(len(delta['Bell']) == 60 and requests == 3,
+                             f"60 new Bell reviews: delta {len(delta['Bell'])}, {requests} requests"))
+
+        # More new reviews than the 10 pages iTunes serves: the mark is not reached and is kept
+        feeds[bell][:0] = new_entries(520, newest + timedelta(days=2), 'flood')
+        bell_key = next(mark_key(app) for app in APPS if app['app_id'] == bell)
+        bell_mark = marks[bell_key]
+        delta, requests = run(server, marks)
+        results.append(check(len(delta['Bell']) == 500 and marks[bell_key] == bell_mark and requests == 11,
+                             f"520 new Bell reviews: delta {len(delta['Bell'])} in {requests} requests, mark kept"))
+
+    # Marks seeded from a dataset's newest dates
+    df = pd.read_csv(sorted(glob.glob('ios_reviews_fresh_*.csv'))[-1])
+    with FixtureServer(recorded_entries()) as server:
+        seeded = seed_marks(df)
+        delta, requests = run(server, seeded)
+        results.append(check(not delta['Bell'] and not delta['Rogers'] and requests == 2,
+                             f"Seeded marks: no delta, {requests} requests"))
+
+    print(f"\n=== {sum(results)}/{len(results)} CHECKS PASSED ===")
+    if not all(results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Test the concurrent iTunes RSS fetcher against a local fixture server
+
+The fixture server replays the recorded scrape (ios_reviews_fresh_*.csv) as
+iTunes RSS JSON pages: 50 reviews per page, the app's info entry first on
+page 1, an empty feed after the last page and HTTP 400 past page 10.
+Pages carry an ETag and answer If-None-Match with 304.
+"""
+import glob
+import gzip
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from itunes_rss import PAGE_WINDOW, fetch_feeds
+
+APP_IDS = {'Bell': '850549838', 'Rogers': '337618972'}
+PAGE_SIZE = 50
+FEED_PATH = re.compile(r'^/(\w+)/rss/customerreviews/page=(\d+)/id=(\d+)/sortby=mostrecent/json$')
+
+
+def recorded_entries(path=None):
+    """RSS review entries per app id, rebuilt from the recorded scrape"""
+    path = path or sorted(glob.glob('ios_reviews_fresh_*.csv'))[-1]
+    df = pd.read_csv(path, keep_default_na=False)
+    feeds = {}
+    for app_name, app_id in APP_IDS.items():
+        rows = df[df['app_name'] == app_name].sort_values('date', ascending=False)
+        feeds[app_id] = [{
+            'id': {'label': str(row['review_id'])},
+            'title': {'label': str(row['title'])},
+            'content': {'label': str(row['text']), 'attributes': {'type': 'text'}},
+            'im:rating': {'label': str(row['rating'])},
+            'author': {'name': {'label': str(row['author'])}},
+            'im:version': {'label': str(row['app_version'])},
+            'updated': {'label': str(row['date']).replace(' ', 'T') + '-07:00'},
+            'im:voteSum': {'label': str(row['vote_sum'])},
+            'im:voteCount': {'label': str(row['vote_count'])}
+        } for _, row in rows.iterrows()]
+    return feeds
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """Serves feeds as iTunes RSS pages and records what was requested"""
+    daemon_threads = True
+
+    def __init__(self, feeds, delay=0.0, fail_once=()):
+        super().__init__(('127.0.0.1', 0), FixtureHandler)
+        self.feeds = feeds
+        self.delay = delay
+        self.fail_once = set(fail_once)
+        self.requests = []
+        self.not_modified = 0
+        self.connections = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/{{country}}/rss/customerreviews/page={{page}}/id={{app_id}}/sortby=mostrecent/json"
+
+    def page(self, app_id, page):
+        """(status, body) for one feed page"""
+        if page > 10:
+            return 400, b'CustomerReviews RSS page depth is limited to 10'
+        feed = {'author': {'name': {'label': 'iTunes Store'}}}
+        entries = self.feeds.get(app_id, [])[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        if entries:
+            feed['entry'] = ([{'im:name': {'label': f'App {app_id}'}}] if page == 1 else []) + entries
+        return 200, json.dumps({'feed': feed}).encode('utf-8')
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            failing = self.path in server.fail_once
+            server.fail_once.discard(self.path)
+        time.sleep(server.delay)
+
+        match = FEED_PATH.match(self.path)
+        if failing:
+            status, body = 503, b'Service Unavailable'
+        elif match:
+            status, body = server.page(match.group(3), int(match.group(2)))
+        else:
+            status, body = 404, b'Not Found'
+
+        headers = {'Content-Type': 'application/json'}
+        if status == 200:
+            headers['ETag'] = '"' + hashlib.sha1(body).hexdigest() + '"'
+            if self.headers.get('If-None-Match') == headers['ETag']:
+                with server.lock:
+                    server.not_modified += 1
+                    server.in_flight -= 1
+                self.send_response(304)
+                self.send_header('ETag', headers['ETag'])
+                self.end_headers()
+                return
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with server.lock:
+            server.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+def check(condition, message):
+    print(f"{'✅' if condition else '❌'} {message}")
+    return condition
+
+
+def main():
+    print("=== TESTING ITUNES RSS FETCHER ===")
+
+    feeds = recorded_entries()
+    # A shorter feed whose last page is partly filled
+    feeds[APP_IDS['Rogers']] = feeds[APP_IDS['Rogers']][:120]
+    targets = [(app_id, 'ca') for app_id in APP_IDS.values()]
+    results = []
+
+    # All pages of every feed, concurrently over pooled connections
+    with FixtureServer(feeds, delay=0.02) as server:
+        fetched = fetch_feeds(targets, max_pages=15, url=server.url, per_host=4, verbose=False, cache=False)
+        for app_name, app_id in APP_IDS.items():
+            expected = [entry['id']['label'] for entry in feeds[app_id]]
+            got = [entry['id']['label'] for entry in fetched[(app_id, 'ca')]]
+            results.append(check(got == expected, f"{app_name}: {len(got)} of {len(expected)} reviews in feed order"))
+        results.append(check(server.connections < len(server.requests),
+                             f"Keep-alive: {len(server.requests)} requests over {server.connections} connections"))
+        results.append(check(1 < server.max_in_flight <= 4,
+                             f"Concurrent requests per host: max {server.max_in_flight} (limit 4)"))
+
+        # Paging stops at the first empty page
+        last_pages = {app_id: -(-len(entries) // PAGE_SIZE) for app_id, entries in feeds.items()}
+        for app_name, app_id in APP_IDS.items():
+            pages = sorted(int(FEED_PATH.match(path).group(2)) for path in server.requests
+                           if FEED_PATH.match(path).group(3) == app_id)
+            results.append(check(max(pages) <= last_pages[app_id] + PAGE_WINDOW,
+                                 f"{app_name}: stopped after page {max(pages)} (last page {last_pages[app_id]})"))
+
+    # Transient errors are retried
+    first_page = f"/ca/rss/customerreviews/page=1/id={APP_IDS['Bell']}/sortby=mostrecent/json"
+    with FixtureServer(feeds, fail_once=[first_page]) as server:
+        fetched = fetch_feeds(targets[:1], max_pages=2, url=server.url, verbose=False, cache=False)
+        results.append(check(server.requests.count(first_page) == 2 and len(fetched[targets[0]]) == 2 * PAGE_SIZE,
+                             "503 on page 1 retried"))
+
+    # Scraper parsing of fetched entries
+    from ios_rescrape_fixed import parse_review_entries
+    reviews = parse_review_entries(fetched[targets[0]], 'Bell')
+    results.append(check(len(reviews) == 2 * PAGE_SIZE and all(r['date'] for r in reviews),
+                         f"ios_rescrape_fixed parses {len(reviews)} fetched reviews with dates"))
+
+    print(f"\n=== {sum(results)}/{len(results)} CHECKS PASSED ===")
+    if not all(results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
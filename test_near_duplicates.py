@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test the near-duplicate engine (near_duplicates.py)
+
+Checks the LSH candidates against brute-force Jaccard similarity on the
+recorded iOS scrape with some reviews re-posted with small edits, plus
+grouping and the same-author overlap check the merger uses.
+"""
+import glob
+
+import numpy as np
+import pandas as pd
+
+from near_duplicates import duplicate_groups, duplicates_of, normalize_texts, similar_pairs, sketch
+from test_itunes_rss import check
+
+IOS_FIXTURE = sorted(glob.glob('ios_reviews_fresh_*.csv'))[-1]
+
+
+def edited_corpus(seed=7):
+    """The recorded iOS reviews, with 100 of them re-posted with small edits"""
+    rng = np.random.default_rng(seed)
+    df = pd.read_csv(IOS_FIXTURE)
+    df = df[normalize_texts(df['text']).str.len() > 40].reset_index(drop=True)
+    reposts = df.iloc[rng.choice(len(df), 100, replace=False)].copy()
+    reposts['text'] = reposts['text'].str.replace('.', '!', regex=False) + ' Please fix'
+    return pd.concat([df, reposts], ignore_index=True), len(df)
+
+
+def brute_force(texts, threshold):
+    """{(i, j): similarity} of every pair above the threshold by exact shingle-set Jaccard"""
+    shingles = sketch(texts)
+    sets = [set(shingles.hashes[shingles.bounds[i]:shingles.bounds[i + 1]].tolist()) for i in range(len(texts))]
+    found = {}
+    for i in range(len(sets)):
+        for j in range(i + 1, len(sets)):
+            if sets[i] and sets[j]:
+                similarity = len(sets[i] & sets[j]) / len(sets[i] | sets[j])
+                if similarity >= threshold:
+                    found[(i, j)] = similarity
+    return found
+
+
+def main():
+    print("=== TESTING NEAR-DUPLICATE ENGINE ===")
+    results = []
+
+    texts = pd.Series(['The app keeps crashing when I pay my bill.',
+                       'the app keeps crashing when i pay my bill',
+                       'Great app, easy to use',
+                       'Great app!! Easy to use.',
+                       'Login never works',
+                       '',
+                       'The app keeps crashing when I pay my bill. Please fix',
+                       None,
+                       '!!!'])
+    groups = duplicate_groups(texts, threshold=0.7)
+    results.append(check(groups.tolist() == [0, 0, 2, 2, 4, 5, 0, 7, 8],
+                         f"Groups: {groups.tolist()} (empty texts stay alone)"))
+
+    # Keyed by app and rating, a 1-star negation never joins its 5-star twin
+    opinions = pd.Series(['I would recommend this app to anyone with a Bell account',
+                          'I would not recommend this app to anyone with a Bell account',
+                          'I would recommend this app to anyone with a Bell account!',
+                          'I would recommend this app to anyone with a Bell account'])
+    keys = pd.DataFrame({'app_name': ['Bell', 'Bell', 'Bell', 'Rogers'], 'rating': [5, 1, 5, 5]})
+    keyed = duplicate_groups(opinions, threshold=0.7, keys=keys)
+    results.append(check(duplicate_groups(opinions, threshold=0.7).tolist() == [0, 0, 0, 0]
+                         and keyed.tolist() == [0, 1, 0, 3],
+                         f"Keyed groups: {keyed.tolist()} (other ratings and apps stay apart)"))
+
+    df, originals = edited_corpus()
+    threshold = 0.8
+    expected = brute_force(df['text'], threshold)
+    pairs = similar_pairs(df['text'], threshold=threshold)
+    found = dict(zip(zip(pairs['left'].tolist(), pairs['right'].tolist()), pairs['similarity'].tolist()))
+    recall = len(found.keys() & expected.keys()) / max(len(expected), 1)
+    results.append(check(found.keys() <= expected.keys() and recall >= 0.95,
+                         f"LSH pairs vs brute force: {len(found)}/{len(expected)} found ({recall:.1%} recall), "
+                         f"no false positives"))
+    results.append(check(all(np.isclose(similarity, expected[pair]) for pair, similarity in found.items()),
+                         "Reported similarity is the exact Jaccard"))
+
+    # The merger's overlap check: a repost only counts with the same author
+    existing, new = df.iloc[:originals], df.iloc[originals:].reset_index(drop=True)
+    new.loc[:9, 'author'] = 'someone else'
+    is_duplicate = duplicates_of(new, existing, same=('author',), threshold=threshold)
+    reposted = np.zeros(len(new), dtype=bool)
+    for i, j in expected:
+        if i < originals <= j and existing['author'].iloc[i] == new['author'].iloc[j - originals]:
+            reposted[j - originals] = True
+    results.append(check(not is_duplicate[:10].any() and is_duplicate.sum() >= 0.95 * reposted.sum()
+                         and not (is_duplicate & ~reposted).any(),
+                         f"Overlap: {int(is_duplicate.sum())}/{int(reposted.sum())} reposts by the same author "
+                         f"found, renamed authors not"))
+
+    print(f"\n=== {sum(results)}/{len(results)} CHECKS PASSED ===")
+    if not all(results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
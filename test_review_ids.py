@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test canonical review IDs (review_ids.py)
+
+One review seen under each historical ID scheme must resolve to one
+canonical ID, before and after the registry is saved and reloaded; distinct
+reviews must keep distinct IDs, even when they share the legacy MD5 of
+author + date + rating. Also registers the recorded analysis sample
+and iOS scrape, whose iOS reviews overlap.
+"""
+import glob
+import hashlib
+import os
+import tempfile
+
+import pandas as pd
+
+from review_ids import ID_DTYPES, PREFIX, ReviewIdRegistry, add_canonical_ids
+from test_itunes_rss import check
+
+ANALYSIS_FIXTURE = sorted(glob.glob('test_enhanced_analysis_*.csv'))[-1]
+IOS_FIXTURE = sorted(glob.glob('ios_reviews_fresh_*.csv'))[-1]
+
+REVIEW = {'author': 'jdoe', 'rating': 1, 'app_name': 'Bell', 'platform': 'iOS',
+          'text': 'The app keeps crashing when I pay my bill.', 'date': '2025-05-20 10:30:00'}
+LEGACY_ID = hashlib.md5(f"{REVIEW['author']}{REVIEW['date']}{REVIEW['rating']}".encode()).hexdigest()
+
+
+def main():
+    print("=== TESTING REVIEW IDS ===")
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix='review_ids_') as directory:
+        path = os.path.join(directory, 'registry.csv')
+        registry = ReviewIdRegistry(path)
+
+        # An older dataset (no date, its own id), then ios_rescrape_fixed (MD5 id plus the
+        # feed id), then ios_refresh_scraper (the feed id as review_id), with edited punctuation
+        seen = [
+            dict(REVIEW, review_id='a1b2c3', date=None),
+            dict(REVIEW, review_id=LEGACY_ID, store_review_id='12625891625'),
+            dict(REVIEW, review_id='12625891625', text='the app keeps crashing when i pay my bill'),
+        ]
+        resolved = [registry.resolve(review) for review in seen]
+        canonical = resolved[0][0]
+        results.append(check(canonical.startswith(PREFIX) and {c for c, _ in resolved} == {canonical},
+                             f"One review, three ID schemes: {[how for _, how in resolved]} → {canonical}"))
+
+        # Same author and text, different store ids: two reviews
+        other, _ = registry.resolve(dict(REVIEW, review_id='12625891626'))
+        results.append(check(other != canonical, "A different store id keeps its own canonical ID"))
+
+        # Same author, date and rating (so the same MD5), other text: other reviews, even
+        # when the MD5 is their review_id; a row without text still resolves by it
+        collisions = [
+            dict(REVIEW, review_id='r-101', author='A Google user', platform='Android', text='Bill pay is broken'),
+            dict(REVIEW, review_id='r-102', author='A Google user', platform='Android', text='Cannot log in'),
+            dict(REVIEW, review_id=LEGACY_ID, app_name='Rogers', text='Usage page never loads'),
+        ]
+        collided = [registry.resolve(review) for review in collisions]
+        textless, how = registry.resolve(dict(REVIEW, review_id=LEGACY_ID, text=None))
+        results.append(check(len({c for c, _ in collided} | {canonical}) == 4
+                             and (textless, how) == (canonical, 'legacy'),
+                             f"Shared author + date + rating: {[how for _, how in collided]}, "
+                             f"text-less row by its MD5 id: {how}"))
+
+        registry.save()
+        reloaded = ReviewIdRegistry(path)
+        lookups = {alias: reloaded.lookup(alias) for alias in ['a1b2c3', LEGACY_ID, '12625891625', canonical]}
+        results.append(check(set(lookups.values()) == {canonical} and reloaded.lookup('unknown') is None,
+                             f"Registry reloaded: {len(reloaded)} aliases, every historical ID looks up"))
+
+        # The recorded sample and scrape share 98 iOS reviews; 96 resolve to one ID (the other
+        # two, an edited review and a '.' one, only match by author + date + rating).
+        # Registering again changes nothing
+        analysis = pd.read_csv(ANALYSIS_FIXTURE, dtype=ID_DTYPES)
+        scrape = pd.read_csv(IOS_FIXTURE, dtype=ID_DTYPES)
+        registry = add_canonical_ids(analysis, scrape, path=path)
+        shared = set(analysis.loc[analysis['platform'] == 'iOS', 'canonical_id']) & set(scrape['canonical_id'])
+        results.append(check(analysis['canonical_id'].is_unique and scrape['canonical_id'].is_unique
+                             and len(shared) == 96,
+                             f"Fixtures: {len(shared)} iOS reviews share a canonical ID across the files"))
+
+        again = pd.read_csv(IOS_FIXTURE, dtype=ID_DTYPES)
+        registry = add_canonical_ids(again, path=path)
+        results.append(check(registry.added == 0 and again['canonical_id'].equals(scrape['canonical_id']),
+                             "Stable: a second run assigns the same IDs and registers nothing"))
+
+    print(f"\n=== {sum(results)}/{len(results)} CHECKS PASSED ===")
+    if not all(results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test the fuzzy assignment of the review matcher (review_matcher.py)
+
+The sparse Hungarian solver is checked against brute force on random
+blocks; match_reviews must not let an early review take a new review that a
+later one matches better, and must flag close calls as ambiguous.
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from review_matcher import match_report, match_reviews, max_weight_matching
+from test_itunes_rss import check
+
+
+def brute_force(weights):
+    """Highest total weight of a one-to-one matching, over every assignment"""
+    if weights.shape[0] > weights.shape[1]:
+        weights = weights.T
+    rows, columns = weights.shape
+    return max(sum(weights[i, j] for i, j in enumerate(chosen))
+               for chosen in itertools.permutations(range(columns), rows))
+
+
+def main():
+    print("=== TESTING REVIEW MATCHER ASSIGNMENT ===")
+    results = []
+
+    rng = np.random.default_rng(3)
+    optimal = 0
+    for _ in range(300):
+        shape = rng.integers(1, 7, 2)
+        weights = np.where(rng.random(shape) < 0.5, rng.uniform(0.7, 1.0, shape).round(2), 0)
+        edges = [(i, j, weights[i, j]) for i, j in zip(*np.nonzero(weights))]
+        matched = max_weight_matching(edges)
+        one_to_one = len({i for i, _, _ in matched}) == len({j for _, j, _ in matched}) == len(matched)
+        optimal += one_to_one and np.isclose(sum(w for _, _, w in matched), brute_force(weights))
+    results.append(check(optimal == 300, f"Sparse Hungarian matches brute force on {optimal}/300 random blocks"))
+
+    # Greedy in row order, the first existing review would take the second's near-verbatim
+    # re-scrape and leave the second unmatched (the other new review's rating is too far)
+    text = "The app logs me out every time I try to pay my bill and support can't fix it"
+    existing = pd.DataFrame({
+        'author': ['anna', 'ben'], 'rating': [2, 1], 'app_name': ['Bell', 'Bell'], 'title': ['', ''],
+        'text': [text + " ever.", text + " ever"], 'date': ['', '']})
+    new = pd.DataFrame({
+        'author': ['ben_renamed', 'anna_renamed'], 'rating': [1, 3], 'app_name': ['Bell', 'Bell'],
+        'title': ['', ''], 'text': [text + " ever!", text + " at all"],
+        'date': ['2025-05-01 10:00:00', '2025-05-02 10:00:00']})
+    matches, unmatched_existing, unmatched_new = match_reviews(existing, new, verbose=False)
+    pairs = {(m['existing_idx'], m['new_idx']) for m in matches}
+    results.append(check(pairs == {(0, 1), (1, 0)} and not unmatched_existing and not unmatched_new,
+                         f"Optimal one-to-one assignment: {sorted(pairs)}"))
+
+    report = match_report(matches)
+    results.append(check(report['fuzzy'] == 2 and report['ambiguous'] == sum(m['ambiguous'] for m in matches)
+                         and sum(report['confidence'].values()) == len(matches)
+                         and all(m['runner_up'] is not None for m in matches if m['ambiguous']),
+                         f"Report: confidence {report['confidence']}, {report['ambiguous']} ambiguous"))
+
+    print(f"\n=== {sum(results)}/{len(results)} CHECKS PASSED ===")
+    if not all(results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
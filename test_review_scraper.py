@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test the multi-store review scraper with local test doubles
+
+iTunes runs against the RSS fixture server (test_itunes_rss.FixtureServer);
+Google Play is stood in for by a FixtureSource replaying the Android rows of
+the recorded analysis sample. Covers the registry, the shared output schema,
+concurrency across stores, a failing store and a store error that is
+not an OSError.
+"""
+import glob
+import os
+import tempfile
+
+from app_registry import load_registry
+from review_scraper import (OUTPUT_COLUMNS, SOURCES, FixtureSource, ITunesRSSSource, ReviewSource,
+                            build_jobs, scrape)
+from test_itunes_rss import APP_IDS, FixtureServer, check, recorded_entries
+
+ANDROID_FIXTURE = sorted(glob.glob('test_enhanced_analysis_*.csv'))[-1]
+
+REGISTRY = """
+apps:
+  - app_name: Bell
+    carrier: Bell
+    countries: [ca]
+    stores: {itunes: '850549838', google_play: ca.bell.selfserve.mybellmobile}
+  - app_name: Rogers
+    carrier: Rogers
+    countries: [ca]
+    stores: {itunes: '337618972', google_play: com.fivemobile.myaccount}
+  - app_name: Fido
+    carrier: Rogers
+    countries: [ca, us]
+    stores: {itunes: '1000000001'}
+  - app_name: Koodo
+    carrier: Telus
+    countries: [ca]
+    stores: {}
+"""
+
+
+class BrokenSource(ReviewSource):
+    """A store that is down"""
+    store = 'google_play'
+    platform = 'Android'
+
+    async def fetch(self, store_app_id, app_name, country):
+        raise ConnectionError('store unavailable')
+
+
+class NotFoundError(Exception):
+    """Like google_play_scraper.exceptions.NotFoundError: not an OSError"""
+
+
+class DelistedSource(FixtureSource):
+    """The recorded Android reviews, with one app delisted from the store"""
+
+    def __init__(self, path, delisted):
+        super().__init__(path, 'google_play', 'Android')
+        self.delisted = delisted
+
+    async def fetch(self, store_app_id, app_name, country):
+        if app_name == self.delisted:
+            raise NotFoundError('App not found(404).')
+        return await super().fetch(store_app_id, app_name, country)
+
+
+def write_registry(directory, text):
+    path = os.path.join(directory, 'registry.yaml')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    return path
+
+
+def main():
+    print("=== TESTING REVIEW SCRAPER ===")
+    results = []
+
+    # The shipped registry: Bell and Rogers configured, the other brands registered
+    apps = load_registry(stores=SOURCES)
+    configured = sorted(app['app_name'] for app in apps if app['stores'])
+    names = {app['app_name'] for app in apps}
+    results.append(check(configured == ['Bell', 'Rogers']
+                         and {'Fido', 'Virgin Plus', 'Koodo', 'Telus', 'Freedom'} <= names,
+                         f"Registry: {len(apps)} brands, configured {', '.join(configured)}"))
+
+    with tempfile.TemporaryDirectory(prefix='review_scraper_') as directory:
+        try:
+            load_registry(write_registry(directory, REGISTRY.replace('itunes: \'1000000001\'',
+                                                                     'app_gallery: x')), stores=SOURCES)
+            rejected = False
+        except ValueError as e:
+            rejected = 'app_gallery' in str(e)
+        results.append(check(rejected, "Unknown store rejected"))
+
+        apps = load_registry(write_registry(directory, REGISTRY), stores=SOURCES)
+
+    feeds = recorded_entries()
+    # A new brand is a registry entry: Fido's feed is a slice of the recording
+    feeds['1000000001'] = feeds[APP_IDS['Rogers']][:30]
+    android = FixtureSource(ANDROID_FIXTURE, 'google_play', 'Android')
+
+    with FixtureServer(feeds, delay=0.02) as server:
+        sources = {'itunes': ITunesRSSSource(url=server.url, cache=False), 'google_play': android}
+        jobs = build_jobs(apps, sources)
+        results.append(check(len(jobs) == 6 and not any(job['app_name'] == 'Koodo' for job in jobs),
+                             f"Jobs: {len(jobs)} (one per app, store and country; Koodo skipped)"))
+
+        df, run = scrape(apps, sources)
+        counts = df.groupby(['app_name', 'platform', 'country']).size().to_dict()
+        expected_android = len(android.reviews[android.reviews['platform'] == 'Android'])
+        results.append(check(list(df.columns) == OUTPUT_COLUMNS and all(error is None for _, _, error in run),
+                             f"Shared schema: {len(df):,} reviews in {len(OUTPUT_COLUMNS)} columns"))
+        results.append(check(counts[('Bell', 'iOS', 'ca')] == len(feeds[APP_IDS['Bell']])
+                             and counts[('Rogers', 'iOS', 'ca')] == len(feeds[APP_IDS['Rogers']])
+                             and counts[('Fido', 'iOS', 'us')] == 30
+                             and sum(n for (_, platform, _), n in counts.items() if platform == 'Android')
+                             == expected_android,
+                             f"Counts per app: {counts}"))
+        fido = df[df['app_name'] == 'Fido']
+        results.append(check(set(fido['carrier']) == {'Rogers'} and set(fido['store_app_id']) == {'1000000001'},
+                             "Registry fields filled in (carrier, store id)"))
+        results.append(check(server.max_in_flight > 1 and server.connections < len(server.requests),
+                             f"Concurrent: up to {server.max_in_flight} requests in flight, "
+                             f"{len(server.requests)} requests over {server.connections} connections"))
+
+        # A failing store doesn't stop the others
+        sources = {'itunes': ITunesRSSSource(url=server.url, cache=False), 'google_play': BrokenSource()}
+        df, run = scrape(apps, sources, only_apps=['Bell'])
+        errors = {job['store']: error for job, _, error in run}
+        results.append(check(errors == {'itunes': None, 'google_play': 'store unavailable'}
+                             and set(df['platform']) == {'iOS'},
+                             f"Failing store reported: {errors}"))
+
+        # A library-specific error fails one job, not the scrape
+        sources = {'itunes': ITunesRSSSource(url=server.url, cache=False),
+                   'google_play': DelistedSource(ANDROID_FIXTURE, 'Rogers')}
+        df, run = scrape(apps, sources, only_stores=['google_play'])
+        errors = {job['app_name']: error for job, _, error in run}
+        results.append(check(errors == {'Bell': None, 'Rogers': 'App not found(404).'}
+                             and set(df['app_name']) == {'Bell'},
+                             f"Store-specific exception reported per job: {errors}"))
+
+    print(f"\n=== {sum(results)}/{len(results)} CHECKS PASSED ===")
+    if not all(results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,182 +0,0 @@
-#!/usr/bin/env python3
-"""
-Final Report Update Script
-Updates all HTML reports with correct enhanced dataset numbers
-"""
-
-import os
-import re
-from pathlib import Path
-
-# Updated numbers from enhanced dataset
-ENHANCED_NUMBERS = {
-    '12,785': '10,103',
-    '12,893': '10,103', 
-    '9,038': '7,055',
-    '3,747': '3,048',
-    '2.64': '2.58',
-    '2.638': '2.58',
-    '33,733': '26,095',  # Calculated: 10,103 * 2.58 = 26,065 (rounded)
-    '7,669': '6,148',    # Negative reviews from enhanced dataset
-    '60.0%': '60.9%',    # Updated negative percentage
-    '70.7%': '69.8%',    # Rogers percentage: 7,055/10,103 = 69.8%
-    '29.3%': '30.2%',    # Bell percentage: 3,048/10,103 = 30.2%
-}
-
-def update_file_numbers(file_path):
-    """Update outdated numbers in a single file"""
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        updates_made = []
-        
-        # Update each number
-        for old_num, new_num in ENHANCED_NUMBERS.items():
-            if old_num in content:
-                content = content.replace(old_num, new_num)
-                updates_made.append(f"{old_num} → {new_num}")
-        
-        # Write back if changes were made
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return updates_made
-        
-        return []
-        
-    except Exception as e:
-        print(f"❌ Error updating {file_path}: {e}")
-        return []
-
-def update_methodology_descriptions(file_path):
-    """Update methodology descriptions with enhanced categories info"""
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        
-        # Update methodology descriptions
-        old_methodology = "individually analyzed 10,103 reviews using Anthropic's Claude API to categorize and tag key issues"
-        new_methodology = "individually analyzed 10,103 reviews using Anthropic's Claude API with enhanced categorization into 28 specific categories including Performance, UX Praise/Complaints, Brand Loyalty, and Customer Support"
-        
-        if "individually analyzed" in content and "Claude API" in content:
-            # More flexible replacement
-            content = re.sub(
-                r'individually analyzed \d{1,5}[,\d]* reviews using.*?Claude.*?to categorize and tag key issues',
-                new_methodology,
-                content,
-                flags=re.IGNORECASE
-            )
-        
-        # Update data currency mentions
-        old_currency = "65.2% of data from last 5 years"
-        new_currency = "99.6% of data from 2020-2025 (current, relevant data)"
-        content = content.replace(old_currency, new_currency)
-        
-        # Write back if changes were made
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-        
-        return False
-        
-    except Exception as e:
-        print(f"❌ Error updating methodology in {file_path}: {e}")
-        return False
-
-def main():
-    """Update all HTML reports with enhanced numbers"""
-    
-    print("🔄 FINAL REPORT UPDATES")
-    print("Updating all HTML reports with enhanced dataset numbers")
-    print("=" * 60)
-    
-    # Find all HTML files
-    html_dir = Path('html_dashboard')
-    html_files = list(html_dir.glob('*.html'))
-    
-    print(f"📁 Found {len(html_files)} HTML files to update")
-    
-    total_updates = 0
-    files_updated = 0
-    
-    for html_file in html_files:
-        print(f"\n📝 Updating {html_file.name}...")
-        
-        # Update numbers
-        updates = update_file_numbers(html_file)
-        
-        # Update methodology if applicable
-        methodology_updated = update_methodology_descriptions(html_file)
-        
-        if updates or methodology_updated:
-            files_updated += 1
-            total_updates += len(updates)
-            
-            if updates:
-                print(f"   ✅ Number updates: {', '.join(updates)}")
-            if methodology_updated:
-                print(f"   ✅ Methodology description updated")
-        else:
-            print(f"   ⚪ No updates needed")
-    
-    # Summary
-    print(f"""
-🎯 FINAL UPDATE COMPLETE!
-
-📊 Summary:
-   • Files updated: {files_updated}/{len(html_files)}
-   • Total number updates: {total_updates}
-   • All reports now use enhanced dataset (10,103 reviews)
-
-✅ Key Updates Made:
-   • Total reviews: 12,785/12,893 → 10,103
-   • Rogers reviews: 9,038 → 7,055  
-   • Bell reviews: 3,747 → 3,048
-   • Average rating: 2.64 → 2.58
-   • Enhanced methodology descriptions added
-   • Data currency updated to 99.6%
-
-🔄 Enhanced Dataset Features:
-   • 28 specific categories (vs generic categories)
-   • Performance insights (2,068 reviews)
-   • UX Praise/Complaints (2,729 reviews) 
-   • Brand Loyalty insights (297 reviews)
-   • Customer Support feedback (797 reviews)
-
-📋 All HTML reports now reflect:
-   • Accurate review counts
-   • Enhanced categorization methodology
-   • Improved data currency (99.6%)
-   • Specific actionable insights
-
-🎉 Dashboard and all reports are now consistent and accurate!
-""")
-    
-    # Verification
-    print("🔍 Final Verification:")
-    remaining_old_numbers = []
-    
-    for html_file in html_files:
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        for old_num in ['12,785', '12,893', '9,038', '3,747']:
-            if old_num in content:
-                remaining_old_numbers.append(f"{html_file.name}: {old_num}")
-    
-    if remaining_old_numbers:
-        print("⚠️  Some old numbers still found:")
-        for item in remaining_old_numbers:
-            print(f"   {item}")
-    else:
-        print("✅ No old numbers found - all reports updated successfully!")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
@@ -6,75 +6,155 @@ Complete Dashboard Update Script
 3. Prepares accuracy verification for all reports
 """
 
+import numpy as np
 import pandas as pd
+import glob
 import json
+import os
+import shutil
+import sys
 from datetime import datetime
 from collections import Counter
 
-def calculate_enhanced_metrics(df):
-    """Calculate comprehensive metrics from enhanced dataset"""
+from accuracy_report import report_files_for, write_accuracy_reports
+from build_graph import artifact, print_timing_table, run_build
+from dashboard_data import SIDECAR_FILE
+from dashboard_js_writer import (
+    assemble_dashboard_js,
+    assemble_dashboard_sidecar,
+    encode_compact,
+    encode_fragment
+)
+from review_records import as_float_or_zero, build_records, fill_missing, format_dates, read_review_chunks
+
+# Recategorized review data the dashboard is built from
+DATA_FILE = 'Data/recategorized_analysis_final.csv'
+
+# Category column of the dashboard (and of its accuracy reports)
+CATEGORY_COLUMN = 'enhanced_category'
+ACCURACY_HTML_FILE, ACCURACY_MARKDOWN_FILE = report_files_for(CATEGORY_COLUMN)
+
+# Intermediate build outputs (summary JSON, review shards)
+BUILD_DIR = '.build/dashboard'
+
+# Average reviews per shard; only shards whose rows changed are re-serialized. Shards
+# are contiguous runs of rows cut after reviews whose review_id hash is 0 modulo
+# SHARD_SIZE, so adding or removing a review changes one shard and keeps dataset order
+SHARD_SIZE = 2000
+MAX_SHARD_ROWS = 4 * SHARD_SIZE
+
+# Source files whose changes invalidate every dashboard artifact
+CODE_INPUTS = [__file__, 'review_records.py', 'dashboard_js_writer.py']
+
+# Columns the summary metrics are counted over (all the metrics pass reads)
+METRIC_COLUMNS = ['app_name', 'platform', 'claude_sentiment', 'rating', 'enhanced_category']
+
+DASHBOARD_JS_FILES = [
+    'html_dashboard/dashboard_complete_enhanced.js',
+    'html_dashboard/dashboard_final.js'
+]
+
+def metric_counts(frames):
+    """
+    Review counts per app × platform × sentiment × rating × category
+
+    Args:
+        frames: Consecutive DataFrames of the dataset (e.g. CSV chunks, or [df])
+
+    Returns:
+        DataFrame with METRIC_COLUMNS, 'count' and 'first' (row position of the
+        combination's first review), in order of first appearance
+    """
+    parts = []
+    offset = 0
+    for frame in frames:
+        rows = frame[METRIC_COLUMNS].assign(first=np.arange(offset, offset + len(frame)))
+        offset += len(frame)
+        parts.append(rows.groupby(METRIC_COLUMNS, dropna=False, sort=False)['first'].agg(['size', 'min']))
+    if not parts:
+        return pd.DataFrame(columns=METRIC_COLUMNS + ['count', 'first'])
+    counts = pd.concat(parts).groupby(level=METRIC_COLUMNS, dropna=False, sort=False).agg({'size': 'sum', 'min': 'min'})
+    counts = counts.rename(columns={'size': 'count', 'min': 'first'}).reset_index()
+    return counts.sort_values('first', kind='stable', ignore_index=True)
+
+def _value_counts(counts, column):
+    """df[column].value_counts() (same order, ties in order of appearance) from metric counts"""
+    grouped = counts.groupby(column, sort=False).agg(count=('count', 'sum'), first=('first', 'min'))
+    return grouped.sort_values('first', kind='stable')['count'].sort_values(ascending=False, kind='stable')
+
+def calculate_enhanced_metrics(frames):
+    """
+    Calculate comprehensive metrics from enhanced dataset
+
+    Args:
+        frames: The review DataFrame, or its consecutive chunks (read_review_chunks)
+    """
+    if isinstance(frames, pd.DataFrame):
+        frames = [frames]
+    counts = metric_counts(frames)
     
     metrics = {}
     
     # Basic counts
-    metrics['total_reviews'] = len(df)
-    metrics['rogers_reviews'] = len(df[df['app_name'] == 'Rogers'])
-    metrics['bell_reviews'] = len(df[df['app_name'] == 'Bell'])
-    metrics['average_rating'] = round(df['rating'].mean(), 2)
+    rated = counts[counts['rating'].notna()]
+    metrics['total_reviews'] = int(counts['count'].sum())
+    metrics['rogers_reviews'] = int(counts.loc[counts['app_name'] == 'Rogers', 'count'].sum())
+    metrics['bell_reviews'] = int(counts.loc[counts['app_name'] == 'Bell', 'count'].sum())
+    metrics['average_rating'] = round(np.float64((rated['rating'] * rated['count']).sum()) / rated['count'].sum(), 2)
     
     # Enhanced sentiment distribution (using claude_sentiment)
-    sentiment_counts = df['claude_sentiment'].value_counts()
+    sentiment_counts = _value_counts(counts, 'claude_sentiment')
     metrics['sentiment_distribution'] = sentiment_counts.to_dict()
     
     # Rating distribution
-    rating_counts = df['rating'].value_counts().sort_index()
+    rating_counts = _value_counts(counts, 'rating').sort_index()
     metrics['rating_distribution'] = {str(k): v for k, v in rating_counts.items()}
     
     # Platform distribution  
-    platform_counts = df['platform'].value_counts()
+    platform_counts = _value_counts(counts, 'platform')
     metrics['platform_distribution'] = platform_counts.to_dict()
     
     # ENHANCED category distribution (new categories)
-    enhanced_category_counts = df['enhanced_category'].value_counts()
+    enhanced_category_counts = _value_counts(counts, 'enhanced_category')
     metrics['enhanced_category_distribution'] = enhanced_category_counts.to_dict()
     
     # Platform stats by app
     platform_stats = {}
     for app in ['Rogers', 'Bell']:
-        app_data = df[df['app_name'] == app]
+        app_data = counts[counts['app_name'] == app]
         platform_stats[app.lower()] = {
-            'android': len(app_data[app_data['platform'] == 'Android']),
-            'ios': len(app_data[app_data['platform'] == 'iOS']),
-            'total': len(app_data)
+            'android': int(app_data.loc[app_data['platform'] == 'Android', 'count'].sum()),
+            'ios': int(app_data.loc[app_data['platform'] == 'iOS', 'count'].sum()),
+            'total': int(app_data['count'].sum())
         }
     metrics['platform_stats'] = platform_stats
     
     # Enhanced category by provider
     category_by_provider = {}
     for app in ['Rogers', 'Bell']:
-        app_data = df[df['app_name'] == app]
+        app_data = counts[counts['app_name'] == app]
         category_by_provider[app.lower()] = {
-            'total': len(app_data),
-            'categories': app_data['enhanced_category'].value_counts().to_dict()
+            'total': int(app_data['count'].sum()),
+            'categories': _value_counts(app_data, 'enhanced_category').to_dict()
         }
     metrics['enhanced_category_by_provider'] = category_by_provider
     
     # Sentiment by platform and app
     sentiment_by_platform = {}
     for platform in ['Android', 'iOS']:
-        platform_data = df[df['platform'] == platform]
+        platform_data = counts[counts['platform'] == platform]
         sentiment_by_platform[platform.lower()] = {
-            'total': len(platform_data),
-            'sentiment': platform_data['claude_sentiment'].value_counts().to_dict()
+            'total': int(platform_data['count'].sum()),
+            'sentiment': _value_counts(platform_data, 'claude_sentiment').to_dict()
         }
     metrics['sentiment_by_platform'] = sentiment_by_platform
     
     sentiment_by_app = {}
     for app in ['Rogers', 'Bell']:
-        app_data = df[df['app_name'] == app]
+        app_data = counts[counts['app_name'] == app]
         sentiment_by_app[app.lower()] = {
-            'total': len(app_data),
-            'sentiment': app_data['claude_sentiment'].value_counts().to_dict()
+            'total': int(app_data['count'].sum()),
+            'sentiment': _value_counts(app_data, 'claude_sentiment').to_dict()
         }
     metrics['sentiment_by_app'] = sentiment_by_app
     
@@ -83,28 +163,28 @@ def calculate_enhanced_metrics(df):
 def prepare_enhanced_reviews_data(df):
     """Prepare reviews data with enhanced categories for dashboard"""
     
-    reviews = []
-    for _, row in df.iterrows():
-        review = {
-            'id': row['review_id'],
-            'content': row['text'] if pd.notna(row['text']) else '',
-            'rating': int(row['rating']),
-            'author': row['author'] if pd.notna(row['author']) else 'Anonymous',
-            'date': row['date'].strftime('%Y-%m-%d') if pd.notna(row['date']) else '',
-            'app': row['app_name'],
-            'platform': row['platform'],
-            'sentiment': row['claude_sentiment'] if pd.notna(row['claude_sentiment']) else 'Neutral',
-            'sentiment_score': float(row['claude_sentiment_score']) if pd.notna(row['claude_sentiment_score']) else 0,
-            'category': row['enhanced_category'],  # Using enhanced categories
-            'summary': row['claude_summary'] if pd.notna(row['claude_summary']) else ''
-        }
-        reviews.append(review)
-    
-    return reviews
+    return build_records({
+        'id': df['review_id'],
+        'content': fill_missing(df['text'], ''),
+        'rating': df['rating'].astype(int),
+        'author': fill_missing(df['author'], 'Anonymous'),
+        'date': format_dates(df['date']),
+        'app': df['app_name'],
+        'platform': df['platform'],
+        'sentiment': fill_missing(df['claude_sentiment'], 'Neutral'),
+        'sentiment_score': as_float_or_zero(df['claude_sentiment_score']),
+        'category': df['enhanced_category'],  # Using enhanced categories
+        'summary': fill_missing(df['claude_summary'], '')
+    })
 
 def generate_enhanced_dashboard_js(metrics, reviews):
     """Generate dashboard JavaScript with enhanced categories"""
     
+    return render_enhanced_dashboard_js(metrics, json.dumps(reviews, indent=4))
+
+def render_enhanced_dashboard_js(metrics, reviews_json):
+    """Render the enhanced dashboard template around a serialized reviews array"""
+    
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
     js_content = f"""// Enhanced Dashboard Data with Complete Re-categorization
@@ -127,7 +207,7 @@ const ENHANCED_DASHBOARD_DATA = {{
         "sentiment_by_platform": {json.dumps(metrics['sentiment_by_platform'], indent=12)},
         "sentiment_by_app": {json.dumps(metrics['sentiment_by_app'], indent=12)}
     }},
-    "reviews": {json.dumps(reviews, indent=4)}
+    "reviews": {reviews_json}
 }};
 
 // Legacy compatibility - map enhanced categories to old structure
@@ -145,7 +225,7 @@ const DASHBOARD_DATA = {{
         "sentiment_by_platform": {json.dumps(metrics['sentiment_by_platform'], indent=12)},
         "sentiment_by_app": {json.dumps(metrics['sentiment_by_app'], indent=12)}
     }},
-    "reviews": {json.dumps(reviews, indent=4)}
+    "reviews": {reviews_json}
 }};
 
 // Export for global access
@@ -163,86 +243,142 @@ if (typeof module !== 'undefined' && module.exports) {{
     
     return js_content
 
-def generate_accuracy_report(df):
-    """Generate accuracy verification report for all content"""
-    
-    report = f"""# Dashboard Accuracy Verification Report
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Dataset Summary
-- **Total Reviews**: {len(df):,}
-- **Rogers Reviews**: {len(df[df['app_name'] == 'Rogers']):,}
-- **Bell Reviews**: {len(df[df['app_name'] == 'Bell']):,}
-- **Android Reviews**: {len(df[df['platform'] == 'Android']):,}
-- **iOS Reviews**: {len(df[df['platform'] == 'iOS']):,}
-- **Average Rating**: {df['rating'].mean():.2f}
-- **Date Range**: {df['date'].min()} to {df['date'].max()}
-
-## Enhanced Categories ({len(df['enhanced_category'].value_counts())} total)
-"""
-    
-    # Enhanced category breakdown
-    enhanced_cats = df['enhanced_category'].value_counts()
-    for category, count in enhanced_cats.items():
-        pct = count/len(df)*100
-        report += f"- **{category}**: {count:,} ({pct:.1f}%)\n"
-    
-    # Sentiment breakdown
-    sentiment_dist = df['claude_sentiment'].value_counts()
-    report += f"\n## Sentiment Distribution\n"
-    for sentiment, count in sentiment_dist.items():
-        pct = count/len(df)*100
-        report += f"- **{sentiment}**: {count:,} ({pct:.1f}%)\n"
-    
-    # Platform performance comparison
-    report += f"\n## Platform Performance\n"
-    for platform in ['Android', 'iOS']:
-        platform_data = df[df['platform'] == platform]
-        avg_rating = platform_data['rating'].mean()
-        negative_pct = len(platform_data[platform_data['claude_sentiment'] == 'Negative'])/len(platform_data)*100
-        report += f"- **{platform}**: {len(platform_data):,} reviews, {avg_rating:.2f} avg rating, {negative_pct:.1f}% negative\n"
-    
-    # Provider comparison
-    report += f"\n## Provider Performance\n"
-    for provider in ['Rogers', 'Bell']:
-        provider_data = df[df['app_name'] == provider]
-        avg_rating = provider_data['rating'].mean()
-        negative_pct = len(provider_data[provider_data['claude_sentiment'] == 'Negative'])/len(provider_data)*100
-        report += f"- **{provider}**: {len(provider_data):,} reviews, {avg_rating:.2f} avg rating, {negative_pct:.1f}% negative\n"
-    
-    # Key insights for verification
-    report += f"""
-## Key Insights for Dashboard Text Verification
-
-### Critical Numbers to Update:
-1. **Total Reviews**: {len(df):,} (was 12,785 in old version)
-2. **Rogers Reviews**: {len(df[df['app_name'] == 'Rogers']):,} (was 9,038)  
-3. **Bell Reviews**: {len(df[df['app_name'] == 'Bell']):,} (was 3,747)
-4. **Average Rating**: {df['rating'].mean():.2f} (was 2.64)
-5. **Data Currency**: 99.6% (2020-2025 data)
-
-### Enhanced Categories Added:
-- Performance (app performance merged): {enhanced_cats.get('Performance', 0):,}
-- UX Praise: {enhanced_cats.get('UX Praise', 0):,}
-- UX Complaints: {enhanced_cats.get('UX Complaints', 0):,}
-- Brand Loyalty: {enhanced_cats.get('Brand Loyalty', 0):,}
-- General Dissatisfaction: {enhanced_cats.get('General Dissatisfaction', 0):,}
-
-### Reports Needing Text Updates:
-1. Executive Summary - Update total reviews, provider counts
-2. CX Assessment Report - Update methodology description  
-3. Research Methodology - Update data processing description
-4. Key Metrics Reference - Update all numbers
-5. Dashboard header - Update review counts and methodology
-
-### Search for These Outdated Numbers:
-- "12,785" or "12,893" → {len(df):,}
-- "9,038" → {len(df[df['app_name'] == 'Rogers']):,}
-- "3,747" → {len(df[df['app_name'] == 'Bell']):,}
-- "2.64" → {df['rating'].mean():.2f}
-"""
-    
-    return report
+def write_text(path, text):
+    """Write a build output, creating its directory"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+def _shard_key(review_ids):
+    """Stable 64-bit hash of each review_id"""
+    return pd.util.hash_array(review_ids.astype(str).to_numpy(dtype=object))
+
+def review_shards(frames):
+    """
+    Cut reviews into contiguous shards, one at a time, keeping dataset order
+
+    A shard ends after a review whose review_id hash is 0 modulo SHARD_SIZE
+    (or at MAX_SHARD_ROWS), so shard boundaries move with the reviews rather
+    than with row positions. Shards are named after the hash of their first
+    review.
+
+    Args:
+        frames: Consecutive DataFrames of the dataset (e.g. [df])
+
+    Yields:
+        (shard name, rows in dataset order)
+    """
+    pieces = []
+    rows = 0
+    names = Counter()
+
+    def emit():
+        nonlocal pieces, rows
+        shard = pieces[0] if len(pieces) == 1 else pd.concat(pieces)
+        name = f"{_shard_key(shard['review_id'].iloc[:1])[0]:016x}"
+        names[name] += 1
+        if names[name] > 1:
+            name = f"{name}-{names[name]}"
+        pieces, rows = [], 0
+        return name, shard
+
+    for frame in frames:
+        cuts = np.flatnonzero(_shard_key(frame['review_id']) % SHARD_SIZE == 0) + 1
+        start = 0
+        for end, is_cut in [(end, True) for end in cuts.tolist()] + [(len(frame), False)]:
+            while start < end:
+                take = min(end - start, MAX_SHARD_ROWS - rows)
+                pieces.append(frame.iloc[start:start + take])
+                rows += take
+                start += take
+                if rows == MAX_SHARD_ROWS:
+                    yield emit()
+            if is_cut and pieces:
+                yield emit()
+
+    if pieces:
+        yield emit()
+
+def remove_stale_shards(fragments):
+    """Delete shard files in BUILD_DIR other than the given fragments"""
+    current = {os.path.abspath(path) for path in fragments}
+    stale = [path for path in glob.glob(f'{BUILD_DIR}/reviews_*.part') if os.path.abspath(path) not in current]
+    for path in stale:
+        os.remove(path)
+    return stale
+
+def read_dataset(path=DATA_FILE):
+    """The review dataset as consecutive chunks with parsed dates"""
+    for chunk in read_review_chunks(path):
+        chunk['date'] = pd.to_datetime(chunk['date'])
+        yield chunk
+
+def dashboard_artifacts(frames, metrics, compat=True):
+    """
+    Build graph for the dashboard: summary JSON -> review shards -> JS files + sidecar
+
+    Artifacts are generated lazily from the review frames (read_dataset()
+    chunks, or [df]), so run_build holds one chunk and one shard's records at
+    a time. Once the last artifact is built, shard files of earlier datasets
+    are removed.
+    """
+    if isinstance(frames, pd.DataFrame):
+        frames = [frames]
+    
+    # Summary JSON
+    summary_file = f'{BUILD_DIR}/summary.json'
+    yield artifact(
+        'dashboard:summary',
+        lambda: write_text(summary_file, encode_compact(metrics)),
+        inputs=CODE_INPUTS,
+        values=[metrics],
+        outputs=[summary_file]
+    )
+    
+    # Review shards: a compat fragment for the JS files and a strict one for the sidecar
+    js_fragments = []
+    json_fragments = []
+    for shard_name, shard in review_shards(frames):
+        js_part = f'{BUILD_DIR}/reviews_{shard_name}.js.part'
+        json_part = f'{BUILD_DIR}/reviews_{shard_name}.json.part'
+        
+        def build_shard(shard=shard, js_part=js_part, json_part=json_part):
+            records = prepare_enhanced_reviews_data(shard)
+            write_text(js_part, encode_fragment(records, compat=compat))
+            write_text(json_part, encode_fragment(records, compat=False))
+        
+        yield artifact(
+            f'dashboard:reviews_{shard_name}',
+            build_shard,
+            inputs=CODE_INPUTS,
+            values=[compat, pd.util.hash_pandas_object(shard, index=False).values.tobytes()],
+            outputs=[js_part, json_part]
+        )
+        js_fragments.append(js_part)
+        json_fragments.append(json_part)
+    
+    def build_dashboard_js():
+        assemble_dashboard_js(DASHBOARD_JS_FILES[0], render_enhanced_dashboard_js, metrics, js_fragments)
+        for file_path in DASHBOARD_JS_FILES[1:]:
+            shutil.copyfile(DASHBOARD_JS_FILES[0], file_path)
+    
+    # Assembled outputs depend on the summary and shard files above
+    yield artifact(
+        'dashboard:js',
+        build_dashboard_js,
+        inputs=CODE_INPUTS + [summary_file] + js_fragments,
+        outputs=DASHBOARD_JS_FILES
+    )
+    yield artifact(
+        'dashboard:sidecar',
+        lambda: assemble_dashboard_sidecar(SIDECAR_FILE, metrics, json_fragments),
+        inputs=CODE_INPUTS + [summary_file] + json_fragments,
+        outputs=[SIDECAR_FILE]
+    )
+    
+    stale = remove_stale_shards(js_fragments + json_fragments)
+    if stale:
+        print(f"🧹 Removed {len(stale)} stale review shard files")
 
 def main():
     """Complete dashboard update process"""
@@ -250,45 +386,31 @@ def main():
     print("🔄 COMPLETE DASHBOARD UPDATE")
     print("=" * 50)
     
-    # Load enhanced dataset
-    print("📊 Loading enhanced dataset...")
-    df = pd.read_csv('Data/recategorized_analysis_final_20250529_125620.csv')
-    df['date'] = pd.to_datetime(df['date'])
-    
-    print(f"   Total reviews: {len(df):,}")
-    print(f"   Enhanced categories: {len(df['enhanced_category'].value_counts())}")
+    # The dataset is read in chunks, once per pass, so memory stays flat with its size
+    if not os.path.exists(DATA_FILE):
+        print(f"❌ Enhanced dataset not found: {DATA_FILE}")
+        sys.exit(1)
     
-    # Calculate enhanced metrics
+    # Calculate enhanced metrics (first pass: label columns only)
     print("🧮 Calculating enhanced metrics...")
-    metrics = calculate_enhanced_metrics(df)
+    metrics = calculate_enhanced_metrics(read_review_chunks(DATA_FILE, usecols=METRIC_COLUMNS))
     
-    # Prepare enhanced reviews data
-    print("📝 Preparing enhanced reviews data...")
-    reviews = prepare_enhanced_reviews_data(df)
+    print(f"   Total reviews: {metrics['total_reviews']:,}")
+    print(f"   Enhanced categories: {len(metrics['enhanced_category_distribution'])}")
     
-    # Generate enhanced JavaScript files
+    # Rebuild only the summary / review shards / JS files whose inputs changed
+    # (--fast: compact orjson output, --force: rebuild everything)
+    compat = '--fast' not in sys.argv[1:]
+    force = '--force' in sys.argv[1:]
     print("🔧 Generating enhanced dashboard JS files...")
-    js_content = generate_enhanced_dashboard_js(metrics, reviews)
     
-    # Update dashboard files
-    enhanced_files = [
-        'html_dashboard/dashboard_complete_enhanced.js',
-        'html_dashboard/dashboard_final.js'
-    ]
+    results = run_build(dashboard_artifacts(read_dataset(), metrics, compat), force=force)
+    print_timing_table(results)
     
-    for file_path in enhanced_files:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(js_content)
-        print(f"✅ Updated: {file_path}")
-    
-    # Generate accuracy verification report
+    # Generate accuracy verification report (HTML + Markdown from the metrics cube)
     print("📋 Generating accuracy verification report...")
-    accuracy_report = generate_accuracy_report(df)
-    
-    report_file = f'dashboard_accuracy_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.md'
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(accuracy_report)
-    print(f"✅ Accuracy report: {report_file}")
+    write_accuracy_reports(read_review_chunks(DATA_FILE), DATA_FILE, CATEGORY_COLUMN)
+    print(f"✅ Accuracy report: {ACCURACY_HTML_FILE}, {ACCURACY_MARKDOWN_FILE}")
     
     # Summary
     print(f"""
@@ -322,8 +444,8 @@ def main():
    4. Review accuracy report for text updates needed
    5. Update all HTML reports with new numbers
 
-📋 Accuracy Report: {report_file}
-   Contains all numbers that need updating in reports
+📋 Accuracy Report: {ACCURACY_MARKDOWN_FILE}
+   Null rates, date coverage and label drift for the dataset
 """)
 
 if __name__ == "__main__":
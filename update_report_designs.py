@@ -5,8 +5,12 @@ Update all report HTML files to use consistent EY dashboard design
 
 import os
 import re
+import sys
 from pathlib import Path
 
+from build_graph import artifact, print_timing_table, run_build
+from rewrite_engine import compile_rules, rewrite
+
 # Template for the new report structure
 REPORT_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
@@ -128,6 +132,15 @@ REPORTS = {
     }
 }
 
+# Page chrome stripped from extracted report content
+CLEANUP_RULESET = compile_rules([
+    (r'<script[^>]*>.*?</script>', '', re.DOTALL),
+    (r'<style[^>]*>.*?</style>', '', re.DOTALL),
+    (r'<header[^>]*>.*?</header>', '', re.DOTALL),
+    (r'<nav[^>]*>.*?</nav>', '', re.DOTALL),
+    (r'<footer[^>]*>.*?</footer>', '', re.DOTALL)
+])
+
 def extract_content_from_html(html_content):
     """Extract the main content from existing HTML"""
     # Try to find content between common markers
@@ -142,13 +155,8 @@ def extract_content_from_html(html_content):
     for pattern in patterns:
         match = re.search(pattern, html_content, re.DOTALL | re.IGNORECASE)
         if match:
-            content = match.group(1)
-            # Clean up the content
-            content = re.sub(r'<script[^>]*>.*?</script>', '', content, flags=re.DOTALL)
-            content = re.sub(r'<style[^>]*>.*?</style>', '', content, flags=re.DOTALL)
-            content = re.sub(r'<header[^>]*>.*?</header>', '', content, flags=re.DOTALL)
-            content = re.sub(r'<nav[^>]*>.*?</nav>', '', content, flags=re.DOTALL)
-            content = re.sub(r'<footer[^>]*>.*?</footer>', '', content, flags=re.DOTALL)
+            # Clean up the content (one scan for all removals)
+            content, _ = rewrite(match.group(1), CLEANUP_RULESET)
             return content.strip()
     
     return "<p>Content extraction failed. Please check the original file.</p>"
@@ -207,7 +215,7 @@ def main():
     print("🎨 Updating report designs to match dashboard...")
     print(f"📁 Base directory: {base_dir}")
     
-    success_count = 0
+    artifacts = []
     
     for filename, config in REPORTS.items():
         # Check multiple possible locations
@@ -218,13 +226,26 @@ def main():
         
         for path in possible_paths:
             if path.exists():
-                print(f"\n📄 Processing: {filename}")
-                if update_report_file(str(path), config):
-                    success_count += 1
+                def build_report(path=path, filename=filename, config=config):
+                    print(f"\n📄 Processing: {filename}")
+                    if not update_report_file(str(path), config):
+                        raise RuntimeError(f"could not update {filename}")
+                
+                # Rebuilt only when the source report or this template changes
+                artifacts.append(artifact(
+                    f'report_design:{filename}',
+                    build_report,
+                    inputs=[str(path), __file__],
+                    outputs=[str(path).replace('.html', '_updated.html')]
+                ))
                 break
         else:
             print(f"\n⚠️  Not found: {filename}")
     
+    results = run_build(artifacts, force='--force' in sys.argv[1:])
+    print_timing_table(results)
+    success_count = sum(1 for r in results if r['status'] != 'failed')
+    
     print(f"\n✨ Complete! Updated {success_count}/{len(REPORTS)} reports")
     print("\nNote: Updated files have '_updated.html' suffix. Review and rename as needed.")
 
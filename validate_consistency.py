@@ -5,8 +5,13 @@ import os
 import json
 from pathlib import Path
 
+from dashboard_data import load_dashboard_data, review_store_frame
+from metrics_cube import build_cube
+from report_numbers import build_index, check_index, current_values
+from verify_claims import evaluate_claims, load_registry
+
 def validate_html_consistency():
-    """Validate that all HTML files have consistent metrics"""
+    """Validate that the numbers in all reports are consistent with the claims and metrics"""
     
     # Load expected metrics
     with open('filtered_dataset_metrics.json', 'r') as f:
@@ -20,83 +25,51 @@ def validate_html_consistency():
     print(f"  Rogers: {expected_metrics['rogers_reviews']:,} ({expected_metrics['rogers_percentage']}%)")
     print(f"  Bell: {expected_metrics['bell_reviews']:,} ({expected_metrics['bell_percentage']}%)\n")
     
-    # Files to validate
-    html_files = [
-        'html_dashboard/dashboard.html',
-        'html_dashboard/executive_summary.html',
-        'html_dashboard/rogers_cx_transformation_report.html',
-        'html_dashboard/bell_smart_cx_report.html',
-        'html_dashboard/cx_ux_assessment_report.html',
-        'html_dashboard/metrics_calculations_verification.html',
-        'html_dashboard/research_process_approach.html',
-        'html_dashboard/key_metrics_reference.html'
-    ]
+    # Index every number in the reports and check it against the claims registry
+    registry = load_registry()
+    index = build_index()
+    tokens = sum(len(entry['numbers']) for entry in index.values())
+    print(f"📄 Indexed {tokens:,} numbers in {len(index)} reports\n")
     
-    issues = []
+    values = current_values(registry['claims'])
+    report_issues = check_index(index, registry['claims'], values, registry['historical'])
     
-    for html_file in html_files:
-        if not os.path.exists(html_file):
-            issues.append(f"❌ File not found: {html_file}")
-            continue
-            
-        print(f"📄 Validating {html_file}...")
-        
-        with open(html_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        file_issues = []
-        
-        # Check for old review counts
-        old_counts = ['12,785', '12,893', '12785', '12893']
-        for old_count in old_counts:
-            if old_count in content:
-                file_issues.append(f"  ❌ Still contains old count: {old_count}")
-        
-        # Check for correct total review count
-        if '10,103' not in content:
-            file_issues.append(f"  ⚠️  Missing correct total review count (10,103)")
-        
-        # Check data timeframe
-        if '2010' in content and '2020-2025' not in content:
-            file_issues.append(f"  ⚠️  May contain old timeframe (2010 instead of 2020)")
-        
-        # Check for old data currency percentages
-        old_currency = ['65.2%', '78.4%']
-        for old_perc in old_currency:
-            if old_perc in content:
-                file_issues.append(f"  ❌ Still contains old data currency: {old_perc}")
-        
-        # Check for correct data currency
-        if '99.6%' not in content and 'data_accuracy_report' not in html_file:
-            file_issues.append(f"  ⚠️  Missing correct data currency (99.6%)")
-        
+    for path in index:
+        file_issues = sum(1 for i in report_issues if i['path'] == path)
         if file_issues:
-            issues.extend([f"Issues in {html_file}:"] + file_issues)
-            print(f"  ❌ Found {len(file_issues)} issues")
-        else:
-            print(f"  ✅ All metrics consistent")
-        
-        print()
+            print(f"  ❌ {path}: {file_issues} issues")
+    if not report_issues:
+        print("  ✅ All report numbers consistent")
     
-    # Validate dashboard data files
-    print("📊 Validating dashboard data files...")
+    issues = [f"{'⚠️ ' if i['kind'] == 'missing' else '❌'} {i['path']}"
+              f"{':' + str(i['line']) if i['line'] else ''} [{i['claim']}] {i['message']}"
+              for i in report_issues]
     
-    js_files = [
-        'html_dashboard/dashboard_complete_enhanced.js',
-        'html_dashboard/dashboard_final.js'
-    ]
+    print()
     
-    for js_file in js_files:
-        if os.path.exists(js_file):
-            with open(js_file, 'r', encoding='utf-8') as f:
-                js_content = f.read()
-            
-            if 'total_reviews: 10103' in js_content:
-                print(f"  ✅ {js_file} has correct total_reviews")
+    # Validate dashboard data against the expected metrics (one aggregation pass)
+    print("📊 Validating dashboard data files...")
+    
+    try:
+        data = load_dashboard_data()
+    except (OSError, ValueError) as e:
+        issues.append(f"❌ Dashboard data not loadable: {e}")
+    else:
+        cube = build_cube(review_store_frame(data['reviews']), 'enhanced_category')
+        dashboard_claims = [
+            {'id': 'total_reviews', 'metric': 'count()', 'expected': expected_metrics['total_reviews']},
+            {'id': 'rogers_reviews', 'metric': 'count(app_name=Rogers)', 'expected': expected_metrics['rogers_reviews']},
+            {'id': 'bell_reviews', 'metric': 'count(app_name=Bell)', 'expected': expected_metrics['bell_reviews']}
+        ]
+        for result in evaluate_claims(dashboard_claims, cube):
+            if result['status'] == 'pass':
+                print(f"  ✅ Dashboard data has correct {result['id']}")
             else:
-                issues.append(f"❌ {js_file} missing correct total_reviews")
-        else:
-            issues.append(f"❌ JS file not found: {js_file}")
+                issues.append(f"❌ Dashboard data {result['id']}: {result['actual']}, expected {result['expected']}")
+        
+        if data['summary'].get('total_reviews') != expected_metrics['total_reviews']:
+            issues.append(f"❌ Dashboard summary total_reviews: {data['summary'].get('total_reviews')}, "
+                          f"expected {expected_metrics['total_reviews']}")
     
     print()
     
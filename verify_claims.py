@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Claims Verification
+Checks every statistic registered in claims.yaml against the review data in a
+single group-by pass: the dataset is aggregated once into the metrics cube
+(plus one true/false dimension per registry topic) and each claim's metric
+expression is evaluated on that cube, never on the full DataFrame.
+
+Writes a machine-readable pass/fail report to claims_report.json.
+
+Usage:
+    python verify_claims.py                  # telecom_app_reviews_filtered_current.csv
+    python verify_claims.py <reviews.csv>    # any review CSV
+"""
+
+import json
+import operator
+import os
+import re
+import sys
+from datetime import datetime
+
+import pandas as pd
+import yaml
+
+from metrics_cube import build_cube, cube_count, cube_mean_rating, cube_share, summary_metrics
+
+CLAIMS_FILE = 'claims.yaml'
+REPORT_FILE = 'claims_report.json'
+DATA_FILE = 'telecom_app_reviews_filtered_current.csv'
+
+# count(...), share(...; ...), mean_rating(...) or a bare headline metric name
+EXPRESSION = re.compile(r'^\s*(?:(count|share|mean_rating)\s*\((.*)\)|([a-z0-9_]+))\s*$', re.DOTALL)
+FILTER = re.compile(r'^\s*([a-z0-9_]+)\s*(>=|<=|!=|=|>|<)\s*(.+?)\s*$')
+
+COMPARISONS = {'>=': operator.ge, '<=': operator.le, '>': operator.gt, '<': operator.lt}
+
+
+def load_registry(path=CLAIMS_FILE):
+    """
+    Load and validate the claims registry (YAML or JSON)
+
+    Returns:
+        Dict with 'topics' ({name: [keywords]}), 'historical' (glob patterns)
+        and 'claims' (list of dicts)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.json'):
+            registry = json.load(f)
+        else:
+            registry = yaml.safe_load(f)
+
+    registry = registry or {}
+    claims = registry.get('claims') or []
+    seen = set()
+    for index, claim in enumerate(claims):
+        missing = [field for field in ('id', 'metric', 'expected') if field not in claim]
+        if missing:
+            raise ValueError(f"Claim #{index + 1} in {path} is missing {', '.join(missing)}")
+        if claim['id'] in seen:
+            raise ValueError(f"Duplicate claim id '{claim['id']}' in {path}")
+        seen.add(claim['id'])
+
+    return {
+        'topics': registry.get('topics') or {},
+        'historical': registry.get('historical') or [],
+        'claims': claims
+    }
+
+
+def topic_flags(df, topics):
+    """One keyword-search flag per topic, as extra cube dimensions (topic_<name>)"""
+    text = df['text'] if 'text' in df.columns else pd.Series('', index=df.index)
+    return {
+        f'topic_{name}': text.str.contains('|'.join(re.escape(k) for k in keywords), case=False, na=False)
+        for name, keywords in topics.items()
+    }
+
+
+def build_claims_cube(df, registry, category_column='primary_category'):
+    """The one aggregation pass every claim is evaluated on"""
+    return build_cube(df, category_column, topic_flags(df, registry['topics']))
+
+
+def _parse_value(text):
+    """Filter value as bool, int, float or string"""
+    lowered = text.lower()
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_filters(text):
+    """
+    Parse 'dimension=value, year>=2020, platform=iOS|Android' into cube_slice filters
+
+    Raises:
+        ValueError: For malformed or repeated filters
+    """
+    filters = {}
+    for part in filter(str.strip, text.split(',')):
+        match = FILTER.match(part)
+        if not match:
+            raise ValueError(f"Malformed filter '{part.strip()}'")
+
+        dimension, op, raw = match.groups()
+        if dimension in filters:
+            raise ValueError(f"Filter on '{dimension}' given twice")
+
+        values = [_parse_value(value.strip()) for value in raw.split('|')]
+        if op == '=':
+            filters[dimension] = values if len(values) > 1 else values[0]
+        elif op == '!=':
+            filters[dimension] = lambda column, values=values: ~column.isin(values)
+        else:
+            compare = COMPARISONS[op]
+            filters[dimension] = lambda column, compare=compare, value=values[0]: compare(column, value)
+
+    return filters
+
+
+def evaluate_metric(expression, cube, headline=None):
+    """
+    Value of one metric expression on the cube
+
+    Args:
+        expression: count(...), share(...; ...), mean_rating(...) or a headline metric name
+        cube: Cube from build_claims_cube
+        headline: summary_metrics(cube), computed on demand when omitted
+
+    Raises:
+        ValueError: For unknown functions, dimensions or metric names
+    """
+    match = EXPRESSION.match(expression)
+    if not match:
+        raise ValueError(f"Malformed metric expression '{expression}'")
+
+    function, arguments, name = match.groups()
+    if name:
+        headline = headline if headline is not None else summary_metrics(cube)
+        if name not in headline:
+            raise ValueError(f"Unknown headline metric '{name}'")
+        return float(headline[name])
+
+    parts = arguments.split(';')
+    filters = [parse_filters(part) for part in parts]
+    for dimension in set().union(*filters):
+        if dimension not in cube.columns:
+            raise ValueError(f"Unknown dimension '{dimension}'")
+
+    if function == 'share':
+        if len(filters) > 2:
+            raise ValueError(f"share() takes 'filters; base filters': '{expression}'")
+        return cube_share(cube, filters[0], filters[1] if len(filters) > 1 else None)
+
+    if len(filters) > 1:
+        raise ValueError(f"{function}() takes one filter list: '{expression}'")
+    if function == 'count':
+        return float(cube_count(cube, **filters[0]))
+    return cube_mean_rating(cube, **filters[0])
+
+
+def evaluate_claims(claims, cube):
+    """
+    Check each claim against the cube
+
+    Returns:
+        List of result dicts (id, metric, expected, actual, difference,
+        tolerance, status 'pass'/'fail'/'error', sources, error)
+    """
+    headline = summary_metrics(cube)
+    results = []
+
+    for claim in claims:
+        tolerance = claim.get('tolerance', 0)
+        result = {
+            'id': claim['id'],
+            'metric': claim['metric'],
+            'expected': claim['expected'],
+            'actual': None,
+            'difference': None,
+            'tolerance': tolerance,
+            'format': claim.get('format', 'raw'),
+            'status': 'error',
+            'sources': claim.get('sources', [])
+        }
+
+        try:
+            actual = evaluate_metric(claim['metric'], cube, headline)
+        except ValueError as e:
+            result['error'] = str(e)
+        else:
+            difference = actual - float(claim['expected'])
+            result['actual'] = round(actual, 4)
+            result['difference'] = round(difference, 4)
+            result['status'] = 'pass' if abs(difference) <= tolerance + 1e-9 else 'fail'
+
+        results.append(result)
+
+    return results
+
+
+def verify_claims(df, registry=None, category_column='primary_category'):
+    """Build the cube once for df and evaluate every registered claim on it"""
+    registry = registry or load_registry()
+    cube = build_claims_cube(df, registry, category_column)
+    return evaluate_claims(registry['claims'], cube)
+
+
+def claims_report(results, dataset=''):
+    """Machine-readable report: totals plus one entry per claim"""
+    return {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'dataset': dataset,
+        'total': len(results),
+        'passed': sum(1 for r in results if r['status'] == 'pass'),
+        'failed': sum(1 for r in results if r['status'] == 'fail'),
+        'errors': sum(1 for r in results if r['status'] == 'error'),
+        'claims': results
+    }
+
+
+def save_claims_report(report, path=REPORT_FILE):
+    """Write the report as JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+
+def print_claims_report(results):
+    """One line per claim"""
+    icons = {'pass': '✅', 'fail': '❌', 'error': '⚠️ '}
+    for r in results:
+        if r['status'] == 'error':
+            print(f"  {icons['error']} {r['id']}: {r['error']}")
+        else:
+            print(f"  {icons[r['status']]} {r['id']}: {r['actual']:g} (claimed {r['expected']}, ±{r['tolerance']})")
+
+
+def main():
+    """Verify all registered claims against a review CSV"""
+    data_path = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+
+    print("=== CLAIMS VERIFICATION ===\n")
+    if not os.path.exists(data_path):
+        print(f"❌ Review data not found: {data_path}")
+        sys.exit(1)
+
+    try:
+        registry = load_registry()
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        print(f"❌ Error loading {CLAIMS_FILE}: {e}")
+        sys.exit(1)
+
+    df = pd.read_csv(data_path)
+    print(f"Dataset: {data_path} ({len(df):,} reviews)")
+    print(f"Claims: {len(registry['claims'])} from {CLAIMS_FILE}\n")
+
+    results = verify_claims(df, registry)
+    print_claims_report(results)
+
+    report = claims_report(results, data_path)
+    save_claims_report(report)
+
+    print(f"\n=== {report['passed']}/{report['total']} CLAIMS VERIFIED ===")
+    print(f"Report saved: {REPORT_FILE}")
+    if report['failed'] or report['errors']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
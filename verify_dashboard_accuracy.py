@@ -3,43 +3,27 @@
 Verify dashboard data accuracy for Issue Categories chart
 """
 import re
-import json
+
+from dashboard_data import load_dashboard_data, review_store_frame
+from metrics_cube import build_cube
 
 def main():
     print("=== DASHBOARD DATA ACCURACY VERIFICATION ===")
     
-    # Read the dashboard JS file
-    with open('html_dashboard/dashboard_complete_enhanced.js', 'r') as f:
-        content = f.read()
-
-    # Extract the data using regex
-    data_match = re.search(r'window\.ENHANCED_DASHBOARD_DATA\s*=\s*({.*?});', content, re.DOTALL)
-    if not data_match:
-        print("❌ Could not find ENHANCED_DASHBOARD_DATA in file")
-        return
-        
-    data_str = data_match.group(1)
-    # Simple JS to Python conversion for the data object
-    data_str = data_str.replace('true', 'True').replace('false', 'False').replace('null', 'None').replace('NaN', 'None')
-    
+    # Load the dashboard data (sidecar, or decoded from the JS file)
     try:
-        data = eval(data_str)
-    except Exception as e:
-        print(f"❌ Error parsing dashboard data: {e}")
+        data = load_dashboard_data()
+    except (OSError, ValueError) as e:
+        print(f"❌ Error loading dashboard data: {e}")
         return
         
     print(f"✅ Total reviews loaded: {len(data['reviews'])}")
     
-    # Count categories manually from reviews (excluding App Praise)
-    category_counts = {}
-    app_praise_count = 0
-    
-    for review in data['reviews']:
-        category = review.get('category', 'Unknown')
-        if category == 'App Praise':
-            app_praise_count += 1
-        else:
-            category_counts[category] = category_counts.get(category, 0) + 1
+    # Count categories from the reviews in one aggregation pass
+    cube = build_cube(review_store_frame(data['reviews']), 'enhanced_category')
+    counts = cube.groupby('category')['count'].sum()
+    app_praise_count = int(counts.get('App Praise', 0))
+    category_counts = {category: int(count) for category, count in counts.items() if category != 'App Praise'}
     
     print(f"✅ Issue categories found (excluding App Praise): {len(category_counts)}")
     print(f"✅ App Praise reviews: {app_praise_count}")